@@ -0,0 +1,91 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+"""
+Concurrent client benchmark for the asyncio facade.
+
+Thousands of coroutines share one journaled AsyncTodoManager, each
+running a mix of reads, toggles and adds. The same load runs with
+writes committed one at a time (max_batch=1) and in batches, to show
+what sharing commits buys.
+
+Usage:
+    python benchmarks/bench_async.py [clients ...]
+"""
+
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from common import print_table
+from async_manager import DEFAULT_MAX_BATCH, AsyncTodoManager
+from journal import JournalStorage
+
+DEFAULT_CLIENTS = [100, 1000, 5000]
+OPS_PER_CLIENT = 20
+INITIAL_TASKS = 10_000
+
+
+async def client(manager: AsyncTodoManager, seed: int, latencies: List[float]) -> None:
+    """
+    Run 60% get_task, 30% toggle_complete and 10% add_task calls.
+    """
+    rng = random.Random(seed)
+    for i in range(OPS_PER_CLIENT):
+        task_id = rng.randint(1, INITIAL_TASKS)
+        roll = rng.random()
+        start = time.perf_counter()
+        if roll < 0.6:
+            await manager.get_task(task_id)
+        elif roll < 0.9:
+            await manager.toggle_complete(task_id)
+        else:
+            await manager.add_task(f"Client {seed} task {i}")
+        latencies.append(time.perf_counter() - start)
+
+
+async def measure(clients: int, max_batch: int) -> Dict[str, float]:
+    """
+    Run the client mix against a fresh journaled manager.
+
+    Returns:
+        dict: Throughput, commit count and 99th percentile latency
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        async with AsyncTodoManager(JournalStorage(directory), max_batch=max_batch) as manager:
+            await manager.add_tasks((f"Task {i}", "") for i in range(INITIAL_TASKS))
+            commits = manager.commits
+            latencies = []
+            start = time.perf_counter()
+            await asyncio.gather(*(client(manager, seed, latencies) for seed in range(clients)))
+            elapsed = time.perf_counter() - start
+            commits = manager.commits - commits
+    latencies.sort()
+    return {'ops_per_s': len(latencies) / elapsed, 'commits': commits,
+            'p99_ms': latencies[int(len(latencies) * 0.99)] * 1e3}
+
+
+def run(client_counts: List[int] = DEFAULT_CLIENTS) -> Dict[int, Dict[str, float]]:
+    """
+    Measure unbatched and batched throughput per number of clients.
+
+    Returns:
+        dict: Mapping of client count to {measurement: value}
+    """
+    results = {}
+    for clients in client_counts:
+        single = asyncio.run(measure(clients, max_batch=1))
+        batched = asyncio.run(measure(clients, max_batch=DEFAULT_MAX_BATCH))
+        results[clients] = {'single_ops': single['ops_per_s'], 'single_p99': single['p99_ms'],
+                            'batched_ops': batched['ops_per_s'], 'batched_p99': batched['p99_ms'],
+                            'commits': batched['commits']}
+    return results
+
+
+if __name__ == "__main__":
+    client_counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_CLIENTS
+    print_table("Concurrent asyncio clients, one commit per write vs. batched",
+                run(client_counts), unit="ops/s, ms", key="clients")
@@ -0,0 +1,95 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §UI Enhancement
+
+"""
+UI-thread latency benchmark for autosaving.
+
+Drives a headless TodoGUI (see bench_gui.py) with a mix of add_task,
+toggle_complete and update_task calls, each followed by the GUI's change
+listener, and reports the latency percentiles seen by the event loop
+when the manager:
+
+    memory    keeps tasks in memory only
+    journal   writes through JournalStorage (group commits with fsync)
+    sync      writes through JournalStorage, fsyncing every change
+    autosave  writes through AutosaveStorage in a background thread
+
+Usage:
+    python benchmarks/bench_autosave.py [operations]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from typing import Dict
+
+from common import print_table
+from autosave import AutosaveStorage
+from bench_gui import headless_gui
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+DEFAULT_OPERATIONS = 5_000
+INITIAL_TASKS = 10_000
+# Pause between operations, like a user clicking quickly
+THINK_TIME = 0.0002
+
+STORAGES = {
+    'memory': lambda directory: None,
+    'journal': lambda directory: JournalStorage(directory),
+    'sync': lambda directory: JournalStorage(directory, group_size=1),
+    'autosave': lambda directory: AutosaveStorage(JournalStorage(directory), quiet_period=0.05),
+}
+
+
+def percentile(samples, fraction: float) -> float:
+    """Return the given percentile of sorted samples."""
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+def latencies(manager: TodoManager, operations: int) -> list:
+    """Run the operation mix and return each call's latency in microseconds, sorted."""
+    headless_gui(manager)
+    rng = random.Random(operations)
+    samples = []
+    for i in range(operations):
+        task_id = rng.randint(1, INITIAL_TASKS)
+        roll = rng.random()
+        start = time.perf_counter()
+        if roll < 0.4:
+            manager.toggle_complete(task_id)
+        elif roll < 0.8:
+            manager.update_task(task_id, f"Renamed {i}")
+        else:
+            manager.add_task(f"New task {i}")
+        samples.append((time.perf_counter() - start) * 1e6)
+        time.sleep(THINK_TIME)
+    return sorted(samples)
+
+
+def run(operations: int = DEFAULT_OPERATIONS) -> Dict[str, Dict[str, float]]:
+    """
+    Measure UI-thread latency with each kind of storage.
+
+    Returns:
+        dict: Mapping of storage name to {percentile or close: microseconds}
+    """
+    results = {}
+    for name, make_storage in STORAGES.items():
+        with tempfile.TemporaryDirectory() as directory:
+            manager = TodoManager(make_storage(directory))
+            manager.add_tasks((f"Task {i}", "Autosave benchmark") for i in range(INITIAL_TASKS))
+            samples = latencies(manager, operations)
+            start = time.perf_counter()
+            manager.close()
+            results[name] = {'p50': percentile(samples, 0.5), 'p99': percentile(samples, 0.99),
+                             'p99.9': percentile(samples, 0.999), 'max': samples[-1],
+                             'close': (time.perf_counter() - start) * 1e6}
+    return results
+
+
+if __name__ == "__main__":
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OPERATIONS
+    print_table(f"UI-thread latency over {operations} changes with {INITIAL_TASKS} tasks",
+                run(operations), key="storage")
@@ -0,0 +1,95 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §Main Application
+
+"""
+Throughput benchmark for the command-line batch mode.
+
+Feeds a 40/30/20/10 mix of add/update/toggle/delete command lines to
+run_batch, once against an in-memory manager and once against a
+journaled one, and for comparison runs a few commands as separate
+``main.py`` processes, as a shell loop calling the CLI would.
+
+Usage:
+    python benchmarks/bench_batch.py [commands]
+"""
+
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from common import PROJECT_ROOT
+from cli import run_batch
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+DEFAULT_COMMANDS = 10 ** 5
+PROCESS_COMMANDS = 20
+
+
+def command_lines(count: int, seed: int = 42) -> List[str]:
+    """
+    Build a 40/30/20/10 mix of add/update/toggle/delete command lines.
+    """
+    rng = random.Random(seed)
+    lines = []
+    added = 0
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.4 or added == 0:
+            added += 1
+            lines.append(f'add "Task {i}" -d "Batch benchmark"\n')
+        elif roll < 0.7:
+            lines.append(f'update {rng.randint(1, added)} -t "Renamed {i}"\n')
+        elif roll < 0.9:
+            lines.append(f"toggle {rng.randint(1, added)}\n")
+        else:
+            lines.append(f"delete {rng.randint(1, added)}\n")
+    return lines
+
+
+def commands_per_second(manager: TodoManager, lines: List[str]) -> float:
+    """Run the lines as one batch and return the throughput."""
+    start = time.perf_counter()
+    run_batch(manager, lines, io.StringIO(), io.StringIO())
+    manager.close()
+    return len(lines) / (time.perf_counter() - start)
+
+
+def run(commands: int = DEFAULT_COMMANDS) -> Dict[str, float]:
+    """
+    Measure batch throughput in memory and journaled, and per-process commands.
+
+    Returns:
+        dict: Commands per second for each way of running them
+    """
+    lines = command_lines(commands)
+    results = {'commands': commands,
+               'memory_cmd_per_sec': commands_per_second(TodoManager(), lines)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        results['journal_cmd_per_sec'] = commands_per_second(
+            TodoManager(JournalStorage(directory)), lines)
+
+    with tempfile.TemporaryDirectory() as directory:
+        main_script = os.path.join(PROJECT_ROOT, 'src', 'main.py')
+        start = time.perf_counter()
+        for i in range(PROCESS_COMMANDS):
+            subprocess.run([sys.executable, main_script, '--journal', directory, 'add', f"Task {i}"],
+                           check=True, stdout=subprocess.DEVNULL)
+        results['process_cmd_per_sec'] = PROCESS_COMMANDS / (time.perf_counter() - start)
+    return results
+
+
+if __name__ == "__main__":
+    commands = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COMMANDS
+    results = run(commands)
+    print("\nBatch mode throughput")
+    print("=" * 40)
+    for name, value in results.items():
+        print(f"{name:<20}{value:>20,.2f}")
+    print("=" * 40)
@@ -0,0 +1,80 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Benchmark comparing bulk operations with per-item loops.
+
+For each operation the same work is done twice on fresh managers: once
+by calling the single-task method in a loop, once with the batch method.
+
+Usage:
+    python benchmarks/bench_bulk.py [size ...]
+"""
+
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+from common import print_table, time_per_op
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+DEFAULT_BULK_SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+
+
+def new_manager(journal_root: Optional[str]) -> TodoManager:
+    """Create an empty manager, journaling below ``journal_root`` if given."""
+    if journal_root is None:
+        return TodoManager()
+    return TodoManager(JournalStorage(tempfile.mkdtemp(dir=journal_root)))
+
+
+def loaded_manager(items: List, journal_root: Optional[str]) -> TodoManager:
+    """Create a manager holding the given (title, description) items."""
+    manager = new_manager(journal_root)
+    manager.add_tasks(items)
+    return manager
+
+
+def run(sizes: List[int] = DEFAULT_BULK_SIZES, journaled: bool = False) -> Dict[int, Dict[str, float]]:
+    """
+    Report the batch speedup (loop time / batch time) for each operation.
+
+    Args:
+        sizes (list[int]): Number of tasks per batch
+        journaled (bool): Attach a JournalStorage backend to every manager
+
+    Returns:
+        dict: Mapping of size to {operation: speedup factor}
+    """
+    with tempfile.TemporaryDirectory() as root:
+        return {size: measure(size, root if journaled else None) for size in sizes}
+
+
+def measure(size: int, journal_root: Optional[str]) -> Dict[str, float]:
+    """
+    Measure the batch speedup of every operation for one batch size.
+    """
+    items = [(f"Task {i}", "Bulk benchmark") for i in range(size)]
+    ids = list(range(1, size + 1))
+    updates = [(task_id, "Renamed", None) for task_id in ids]
+
+    loop_manager, bulk_manager = new_manager(journal_root), new_manager(journal_root)
+    add = (time_per_op(lambda: [loop_manager.add_task(*item) for item in items], size)
+           / time_per_op(lambda: bulk_manager.add_tasks(items), size))
+
+    loop_manager, bulk_manager = loaded_manager(items, journal_root), loaded_manager(items, journal_root)
+    update = (time_per_op(lambda: [loop_manager.update_task(*update) for update in updates], size)
+              / time_per_op(lambda: bulk_manager.update_tasks(updates), size))
+    toggle = (time_per_op(lambda: [loop_manager.toggle_complete(i) for i in ids], size)
+              / time_per_op(lambda: bulk_manager.toggle_many(ids), size))
+    delete = (time_per_op(lambda: [loop_manager.delete_task(i) for i in ids], size)
+              / time_per_op(lambda: bulk_manager.delete_tasks(ids), size))
+
+    return {'add': add, 'update': update, 'toggle': toggle, 'delete': delete}
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_BULK_SIZES
+    print_table("Bulk speedup over per-item loops", run(sizes), unit="x faster")
+    print_table("Bulk speedup with a journal attached", run(sizes, journaled=True), unit="x faster")
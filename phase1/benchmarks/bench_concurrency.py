@@ -0,0 +1,84 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Throughput benchmark for the thread-safe manager.
+
+Runs the same 80/20 read/write mix on 1, 2, 4 and 8 threads sharing one
+ConcurrentTodoManager, next to the unsynchronized TodoManager on a
+single thread, to show what the locks cost and that readers keep going
+while writers work.
+
+Usage:
+    python benchmarks/bench_concurrency.py [tasks]
+"""
+
+import random
+import sys
+import threading
+import time
+from typing import Dict
+
+import common  # noqa: F401  (adds src to the path)
+from concurrent_manager import ConcurrentTodoManager
+from todo_manager import TodoManager
+
+DEFAULT_TASKS = 10 ** 5
+OPS_PER_THREAD = 50_000
+THREAD_COUNTS = [1, 2, 4, 8]
+
+
+def mixed_operations(manager: TodoManager, size: int, seed: int) -> None:
+    """
+    Run 80% get_task and 20% toggle_complete/update_task calls.
+    """
+    rng = random.Random(seed)
+    for i in range(OPS_PER_THREAD):
+        task_id = rng.randint(1, size)
+        roll = rng.random()
+        if roll < 0.8:
+            manager.get_task(task_id)
+        elif roll < 0.9:
+            manager.toggle_complete(task_id)
+        else:
+            manager.update_task(task_id, f"Renamed {i}")
+
+
+def ops_per_second(manager: TodoManager, size: int, threads: int) -> float:
+    """Run the mix on the given number of threads and return the total throughput."""
+    workers = [threading.Thread(target=mixed_operations, args=(manager, size, seed))
+               for seed in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * OPS_PER_THREAD / (time.perf_counter() - start)
+
+
+def run(size: int = DEFAULT_TASKS) -> Dict[str, float]:
+    """
+    Measure mixed-operation throughput per thread count.
+
+    Returns:
+        dict: Operations per second for each configuration
+    """
+    manager = TodoManager()
+    manager.add_tasks((f"Task {i}", "") for i in range(size))
+    results = {'unsynchronized_1': ops_per_second(manager, size, 1)}
+
+    for threads in THREAD_COUNTS:
+        manager = ConcurrentTodoManager()
+        manager.add_tasks((f"Task {i}", "") for i in range(size))
+        results[f'concurrent_{threads}'] = ops_per_second(manager, size, threads)
+    return results
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TASKS
+    results = run(size)
+    print("\nMixed read/write throughput (ops/s)")
+    print("=" * 40)
+    for name, value in results.items():
+        print(f"{name:<20}{value:>20,.0f}")
+    print("=" * 40)
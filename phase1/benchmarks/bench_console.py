@@ -0,0 +1,76 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoUI Class
+
+"""
+Benchmark for the console task list.
+
+Compares printing every task with print() per row (the old
+display_tasks) against the paged display, which only reads and writes
+the first page before prompting. Output goes to an in-memory buffer and
+the navigation prompt is answered with end-of-input, so the paged column
+is the time to first screen.
+
+Usage:
+    python benchmarks/bench_console.py [size ...]
+"""
+
+import builtins
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import Dict, List
+
+from common import DEFAULT_SIZES, print_table
+from todo_manager import TodoManager
+from ui import TodoUI, format_task_row
+
+
+def print_all(tasks) -> None:
+    """
+    Print every task with one print() call per row, as before paging.
+    """
+    for task in tasks:
+        print(format_task_row(task))
+
+
+def end_of_input(prompt: str = "") -> str:
+    """Stand-in for input() that always reports end-of-input."""
+    raise EOFError
+
+
+def milliseconds(func) -> float:
+    """Return the wall time of one call in milliseconds, with stdout captured."""
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func()
+        return (time.perf_counter() - start) * 1e3
+
+
+def run(sizes: List[int] = DEFAULT_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Measure showing all tasks against showing the first page.
+
+    Returns:
+        dict: Mapping of size to {approach: milliseconds}
+    """
+    results = {}
+    real_input = builtins.input
+    builtins.input = end_of_input
+    try:
+        for size in sizes:
+            manager = TodoManager()
+            manager.add_tasks((f"Task {i}", "Console benchmark") for i in range(size))
+            ui = TodoUI(manager)
+            results[size] = {
+                'print_all_ms': milliseconds(lambda: print_all(manager.iter_tasks())),
+                'first_page_ms': milliseconds(lambda: ui.display_tasks(manager.iter_tasks(), size)),
+            }
+    finally:
+        builtins.input = real_input
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print_table("Console task list", run(sizes), unit="ms")
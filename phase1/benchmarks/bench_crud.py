@@ -0,0 +1,112 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+CRUD mix benchmark.
+
+Replays a fixed, seeded sequence of operations against a TodoManager
+pre-filled with each list size and reports the mean time per operation
+for three mixes:
+
+    read      80% get_task, 10% get_task_page, 5% update_task, 5% toggle_complete
+    write     10% get_task, 40% add_task, 30% update_task, 20% toggle_complete
+    delete    10% get_task, 30% add_task, 60% delete_task
+
+Every operation targets a task that exists at that point, so the
+sequence is planned before the clock starts and only the manager calls
+are timed.
+
+Usage:
+    python benchmarks/bench_crud.py [size ...]
+"""
+
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from common import print_table
+from todo_manager import TodoManager
+
+SUITE_SIZES = [10, 10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+OPERATIONS = 20_000
+PAGE = 50
+
+# Weight of each operation per mix
+MIXES = {
+    'read': {'get': 80, 'page': 10, 'update': 5, 'toggle': 5},
+    'write': {'get': 10, 'add': 40, 'update': 30, 'toggle': 20},
+    'delete': {'get': 10, 'add': 30, 'delete': 60},
+}
+
+
+def plan(mix: Dict[str, int], size: int, seed: int) -> List[Tuple[str, int]]:
+    """
+    Draw a sequence of (operation, argument) pairs that only touch live tasks.
+
+    IDs handed out by add_task are predicted from the manager's counter,
+    and a delete never picks a task deleted before it. When every task is
+    gone a delete turns into an add.
+    """
+    rng = random.Random(seed)
+    names, weights = zip(*mix.items())
+    live = list(range(1, size + 1))
+    next_id = size + 1
+    steps = []
+    for name in rng.choices(names, weights, k=OPERATIONS):
+        if name == 'delete' and live:
+            # Swap-remove a random live ID
+            position = rng.randrange(len(live))
+            live[position], live[-1] = live[-1], live[position]
+            steps.append(('delete', live.pop()))
+        elif name == 'add' or not live:
+            steps.append(('add', next_id))
+            live.append(next_id)
+            next_id += 1
+        elif name == 'page':
+            steps.append(('page', rng.randrange(max(len(live) - PAGE, 1))))
+        else:
+            steps.append((name, live[rng.randrange(len(live))]))
+    return steps
+
+
+def replay(manager: TodoManager, steps: List[Tuple[str, int]]) -> None:
+    """Run a planned sequence against the manager."""
+    for name, argument in steps:
+        if name == 'get':
+            manager.get_task(argument)
+        elif name == 'page':
+            manager.get_task_page(argument, PAGE)
+        elif name == 'update':
+            manager.update_task(argument, "Renamed task")
+        elif name == 'toggle':
+            manager.toggle_complete(argument)
+        elif name == 'add':
+            manager.add_task("New task", "CRUD benchmark")
+        else:
+            manager.delete_task(argument)
+
+
+def run(sizes: List[int] = SUITE_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Measure each mix at each list size.
+
+    Returns:
+        dict: Mapping of list size to {mix: microseconds per operation}
+    """
+    results = {}
+    for size in sizes:
+        results[size] = {}
+        for mix_name, mix in MIXES.items():
+            manager = TodoManager()
+            manager.add_tasks((f"Task {i}", "CRUD benchmark") for i in range(size))
+            steps = plan(mix, size, seed=size)
+            start = time.perf_counter()
+            replay(manager, steps)
+            results[size][mix_name] = (time.perf_counter() - start) / OPERATIONS * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SUITE_SIZES
+    print_table(f"CRUD mixes over {OPERATIONS} operations", run(sizes))
@@ -0,0 +1,103 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §UI Enhancement
+
+"""
+Benchmark for refreshing the GUI task list.
+
+Compares the original full rebuild (delete every Treeview row, insert
+every task) with the virtualized list that only materializes the visible
+rows, and measures how long TodoGUI takes to reflect a single toggle
+with each approach. Runs headless against the Tk stand-ins in fake_tk.py.
+
+Usage:
+    python benchmarks/bench_gui.py [size ...]
+"""
+
+import sys
+import time
+from typing import Dict, List
+
+from common import print_table
+from fake_tk import FakeScrollbar, FakeTreeview, FakeVar
+from gui_ui import TodoGUI, VirtualTaskList, task_row
+from todo_manager import TodoManager
+
+DEFAULT_GUI_SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+
+
+def full_rebuild(tree: FakeTreeview, manager: TodoManager) -> None:
+    """Refresh the way TodoGUI used to: clear the tree and insert every task."""
+    for item in tree.get_children():
+        tree.delete(item)
+    for task in manager.iter_tasks():
+        tree.insert('', 'end', values=task_row(task))
+
+
+def headless_gui(manager: TodoManager) -> TodoGUI:
+    """
+    Build a TodoGUI wired to Tk stand-ins instead of real widgets.
+    """
+    gui = TodoGUI.__new__(TodoGUI)
+    gui.manager = manager
+    gui.task_tree = FakeTreeview()
+    gui.task_list = VirtualTaskList(gui.task_tree, FakeScrollbar())
+    gui.search_var = FakeVar()
+    gui.filter_var = FakeVar('All')
+    gui.status_var = FakeVar()
+    gui.sort_column = None
+    gui.sort_descending = False
+    gui.refresh_task_list()
+    manager.add_change_listener(gui.on_tasks_changed)
+    return gui
+
+
+def milliseconds(func) -> float:
+    """Return the wall time of one call in milliseconds."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def run(sizes: List[int] = DEFAULT_GUI_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Measure one refresh with each approach, plus the rows left in the tree.
+
+    Returns:
+        dict: Mapping of size to {measurement: value}
+    """
+    results = {}
+    for size in sizes:
+        manager = TodoManager()
+        manager.add_tasks((f"Task {i}", "GUI benchmark") for i in range(size))
+
+        full_tree = FakeTreeview()
+        full_rebuild(full_tree, manager)
+        full_ms = milliseconds(lambda: full_rebuild(full_tree, manager))
+
+        virtual_tree = FakeTreeview()
+        task_list = VirtualTaskList(virtual_tree, FakeScrollbar())
+        source = lambda offset, limit: manager.get_task_page(offset, limit)
+        task_list.set_source(size, source)
+        virtual_ms = milliseconds(lambda: task_list.set_source(size, source))
+        scroll_ms = milliseconds(lambda: task_list.on_scrollbar('moveto', '0.5'))
+
+        # A single toggle: full rebuild afterwards vs. the change listener
+        toggle_full_ms = milliseconds(lambda: (manager.toggle_complete(1), full_rebuild(full_tree, manager)))
+        gui = headless_gui(manager)
+        toggle_incremental_ms = milliseconds(lambda: manager.toggle_complete(1))
+        manager.remove_change_listener(gui.on_tasks_changed)
+
+        results[size] = {
+            'full_ms': full_ms,
+            'virtual_ms': virtual_ms,
+            'scroll_ms': scroll_ms,
+            'toggle_full': toggle_full_ms,
+            'toggle_incr': toggle_incremental_ms,
+            'tree_rows': len(virtual_tree.order),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_GUI_SIZES
+    print_table("GUI task list refresh", run(sizes), unit="ms / rows")
@@ -0,0 +1,141 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Load test for the HTTP/JSON API server.
+
+Starts src/server.py with a journal in a separate process, seeds it with
+tasks, then opens keep-alive connections that send a mix of task reads,
+conditional list reads and toggles. Each connection sends requests one
+at a time, and again with several requests pipelined per write.
+Reports requests per second and the p50 and p99 latency.
+
+Usage:
+    python benchmarks/bench_http.py [connections ...]
+"""
+
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from common import PROJECT_ROOT, print_table
+
+DEFAULT_CONNECTIONS = [1, 10, 100]
+REQUESTS_PER_CONNECTION = 500
+PIPELINE_DEPTH = 8
+INITIAL_TASKS = 10_000
+
+
+def build_request(method: str, path: str, body=None, etag: str = "") -> bytes:
+    """Encode a keep-alive HTTP/1.1 request."""
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    head = f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(data)}\r\n"
+    if etag:
+        head += f"If-None-Match: {etag}\r\n"
+    return (head + "\r\n").encode("latin-1") + data
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+    """Read one response, returning its status and headers."""
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    await reader.readexactly(int(headers["content-length"]))
+    return status, headers
+
+
+async def connection(address: Tuple[str, int], seed: int, depth: int, latencies: List[float]) -> None:
+    """
+    Send 70% task reads, 10% conditional list reads and 20% toggles,
+    ``depth`` requests at a time.
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(*address)
+    etag = ""
+    for _ in range(REQUESTS_PER_CONNECTION // depth):
+        requests = []
+        for _ in range(depth):
+            roll = rng.random()
+            if roll < 0.7:
+                requests.append(build_request("GET", f"/tasks/{rng.randint(1, INITIAL_TASKS)}"))
+            elif roll < 0.8:
+                requests.append(build_request("GET", "/tasks?limit=20", etag=etag))
+            else:
+                requests.append(build_request("POST", f"/tasks/{rng.randint(1, INITIAL_TASKS)}/toggle"))
+        start = time.perf_counter()
+        writer.write(b"".join(requests))
+        for _ in range(depth):
+            status, headers = await read_response(reader)
+            assert status in (200, 304), status
+            etag = headers.get("etag", etag)
+            latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def load(address: Tuple[str, int], connections: int, depth: int) -> Dict[str, float]:
+    """
+    Run the request mix on the given number of connections at once.
+
+    Returns:
+        dict: Requests per second and the p50 and p99 latency in ms
+    """
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(connection(address, seed, depth, latencies) for seed in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {'req_s': len(latencies) / elapsed,
+            'p50_ms': latencies[len(latencies) // 2] * 1e3,
+            'p99_ms': latencies[int(len(latencies) * 0.99)] * 1e3}
+
+
+async def seed(address: Tuple[str, int]) -> None:
+    """Add the initial tasks with one bulk request."""
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(build_request("POST", "/tasks", [{"title": f"Task {i}"} for i in range(INITIAL_TASKS)]))
+    assert (await read_response(reader))[0] == 201
+    writer.close()
+
+
+def run(connection_counts: List[int] = DEFAULT_CONNECTIONS) -> Dict[int, Dict[str, float]]:
+    """
+    Load the server with sequential and pipelined requests per connection count.
+
+    Returns:
+        dict: Mapping of connection count to {measurement: value}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(PROJECT_ROOT, "src", "server.py"), "--port", "0", "--journal", directory],
+            stdout=subprocess.PIPE, text=True)
+        try:
+            host, port = server.stdout.readline().split("//")[1].strip().rsplit(":", 1)
+            address = (host, int(port))
+            asyncio.run(seed(address))
+            for connections in connection_counts:
+                sequential = asyncio.run(load(address, connections, 1))
+                pipelined = asyncio.run(load(address, connections, PIPELINE_DEPTH))
+                results[connections] = {**sequential, 'piped_req_s': pipelined['req_s'],
+                                        'piped_p99_ms': pipelined['p99_ms']}
+        finally:
+            server.terminate()
+            server.wait()
+    return results
+
+
+if __name__ == "__main__":
+    connection_counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_CONNECTIONS
+    print_table(f"HTTP API load, sequential vs. {PIPELINE_DEPTH} pipelined requests per connection",
+                run(connection_counts), unit="req/s, ms", key="connections")
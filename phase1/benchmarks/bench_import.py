@@ -0,0 +1,67 @@
+# [Task]: Performance Benchmarks
+# [From]: constitution.md §Data Management
+
+"""
+Benchmark for streaming JSON Lines and CSV import/export.
+
+Exports a generated task list to each format, then imports the file
+into a SQLite-backed manager, whose rows live outside the Python heap,
+so the traced peak memory shows what the importer itself holds. That
+peak should stay flat as the file grows.
+
+Usage:
+    python benchmarks/bench_import.py [size ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+from common import DEFAULT_SIZES, print_table
+from sqlite_manager import SQLiteTodoManager
+from task_io import FORMATS, export_file, import_file
+from todo_manager import TodoManager
+
+
+def run(sizes: List[int] = DEFAULT_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Measure export and import throughput and the importer's peak memory.
+
+    Returns:
+        dict: Mapping of size to {measurement: value}
+    """
+    results = {}
+    for size in sizes:
+        manager = TodoManager()
+        manager.add_tasks((f"Task {i}", "Imported from a large backlog file") for i in range(size))
+        row = {}
+        with tempfile.TemporaryDirectory() as directory:
+            for fmt in FORMATS:
+                path = os.path.join(directory, f"tasks.{fmt}")
+                start = time.perf_counter()
+                export_file(manager, path)
+                row[f'{fmt}_out_k/s'] = size / (time.perf_counter() - start) / 1e3
+
+                target = SQLiteTodoManager()
+                start = time.perf_counter()
+                import_file(target, path)
+                row[f'{fmt}_in_k/s'] = size / (time.perf_counter() - start) / 1e3
+                target.close()
+
+                # Trace a second import separately, since tracing slows it down
+                target = SQLiteTodoManager()
+                tracemalloc.start()
+                import_file(target, path)
+                row[f'{fmt}_peak_MB'] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+                tracemalloc.stop()
+                target.close()
+        results[size] = row
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print_table("Import/export throughput (k tasks/s) and import peak memory", run(sizes), unit="mixed")
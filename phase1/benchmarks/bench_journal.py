@@ -0,0 +1,82 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Benchmark for the append-only journal storage backend.
+
+Runs a mixed stream of add, update, toggle and delete operations against
+a journaled TodoManager, then measures how long a restart takes to
+restore the state from the snapshot and log.
+
+Usage:
+    python benchmarks/bench_journal.py [operations] [group_size]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from typing import Dict
+
+import common  # noqa: F401  (adds src to the path)
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+DEFAULT_OPERATIONS = 10 ** 6
+
+
+def apply_mixed_operations(manager: TodoManager, operations: int, seed: int = 42) -> None:
+    """
+    Apply a 40/30/20/10 mix of add/update/toggle/delete operations.
+    """
+    rng = random.Random(seed)
+    for i in range(operations):
+        roll = rng.random()
+        if roll < 0.4 or manager.task_count() == 0:
+            manager.add_task(f"Task {i}", "Journal benchmark")
+        else:
+            task_id = rng.randint(1, manager._next_id - 1)
+            if roll < 0.7:
+                manager.update_task(task_id, f"Renamed {i}")
+            elif roll < 0.9:
+                manager.toggle_complete(task_id)
+            else:
+                manager.delete_task(task_id)
+
+
+def run(operations: int = DEFAULT_OPERATIONS, group_size: int = 256) -> Dict[str, float]:
+    """
+    Measure journal write throughput and recovery time.
+
+    Returns:
+        dict: ops_per_sec, recovery_sec and the number of recovered tasks
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory, group_size=group_size))
+        start = time.perf_counter()
+        apply_mixed_operations(manager, operations)
+        manager.close()
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        restored = TodoManager(JournalStorage(directory))
+        recovery_time = time.perf_counter() - start
+        restored.close()
+
+    return {
+        'operations': operations,
+        'ops_per_sec': operations / write_time,
+        'recovery_sec': recovery_time,
+        'recovered_tasks': restored.task_count(),
+    }
+
+
+if __name__ == "__main__":
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OPERATIONS
+    group_size = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    results = run(operations, group_size)
+    print("\nJournal storage benchmark")
+    print("=" * 40)
+    for name, value in results.items():
+        print(f"{name:<20}{value:>20,.2f}")
+    print("=" * 40)
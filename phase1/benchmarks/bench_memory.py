@@ -0,0 +1,79 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Memory benchmark comparing the old dict-per-task layout with Task records.
+
+Uses tracemalloc to report the bytes allocated per stored task, excluding
+the title and description strings that both layouts share.
+
+Usage:
+    python benchmarks/bench_memory.py [size ...]
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, Dict, List
+
+from common import print_table
+from todo_manager import TodoManager
+
+DEFAULT_MEMORY_SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+
+
+def bytes_per_task(build: Callable[[List[str]], object], titles: List[str]) -> float:
+    """
+    Measure the bytes allocated by ``build`` for each task it stores.
+
+    Args:
+        build (callable): Function that stores one task per title
+        titles (list[str]): Pre-allocated titles, so string cost is excluded
+
+    Returns:
+        float: Bytes allocated per task
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    store = build(titles)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del store
+    return (after - before) / len(titles)
+
+
+def build_dict_store(titles: List[str]) -> Dict[int, Dict]:
+    """Store tasks as four-key dictionaries, as the manager used to."""
+    return {
+        task_id: {'id': task_id, 'title': title, 'description': "", 'completed': False}
+        for task_id, title in enumerate(titles, start=1)
+    }
+
+
+def build_manager(titles: List[str]) -> TodoManager:
+    """Store tasks through TodoManager, which uses Task records."""
+    manager = TodoManager()
+    for title in titles:
+        manager.add_task(title)
+    return manager
+
+
+def run(sizes: List[int] = DEFAULT_MEMORY_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Report bytes per task for both layouts at each list size.
+
+    Returns:
+        dict: Mapping of list size to {layout: bytes per task}
+    """
+    results = {}
+    for size in sizes:
+        titles = [f"Task {i}" for i in range(size)]
+        results[size] = {
+            'dict': bytes_per_task(build_dict_store, titles),
+            'Task': bytes_per_task(build_manager, titles),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_MEMORY_SIZES
+    print_table("Memory per stored task", run(sizes), unit="bytes/task")
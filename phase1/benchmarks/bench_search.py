@@ -0,0 +1,62 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Benchmark for full-text search over task titles and descriptions.
+
+Builds a manager with synthetic tasks drawn from a fixed vocabulary,
+then reports the index build time and the average latency of selective,
+prefix and multi-word queries.
+
+Usage:
+    python benchmarks/bench_search.py [size ...]
+"""
+
+import random
+import sys
+import time
+from typing import Dict, List
+
+from common import DEFAULT_SIZES, print_table, time_per_op
+from todo_manager import TodoManager
+
+WORDS = ["buy", "call", "email", "fix", "plan", "review", "write", "clean", "book", "pay",
+         "groceries", "report", "dentist", "invoice", "garden", "meeting", "budget", "car",
+         "kitchen", "slides", "taxes", "birthday", "flight", "laundry", "newsletter"]
+QUERIES = {
+    'unique': lambda rng, size: f"item{rng.randint(0, size - 1)}",
+    'prefix': lambda rng, size: f"item{rng.randint(0, size // 100)}",
+    'two_words': lambda rng, size: f"{rng.choice(WORDS)} {rng.choice(WORDS)[:3]}",
+}
+QUERY_RUNS = 200
+
+
+def run(sizes: List[int] = DEFAULT_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Measure index build time (ms) and query latency (ms) at each size.
+
+    Returns:
+        dict: Mapping of size to {measurement: milliseconds}
+    """
+    results = {}
+    rng = random.Random(42)
+    for size in sizes:
+        manager = TodoManager()
+        manager.add_tasks(
+            (f"{rng.choice(WORDS)} {rng.choice(WORDS)} item{i}", f"{rng.choice(WORDS)} {rng.choice(WORDS)}")
+            for i in range(size))
+
+        start = time.perf_counter()
+        manager.search("warmup")
+        results[size] = {'build': (time.perf_counter() - start) * 1e3}
+
+        for name, make_query in QUERIES.items():
+            queries = [make_query(rng, size) for _ in range(QUERY_RUNS)]
+            results[size][name] = time_per_op(
+                lambda: [manager.search(query) for query in queries], QUERY_RUNS) / 1e3
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print_table("Search index build and query latency", run(sizes), unit="ms")
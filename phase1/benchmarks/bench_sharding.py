@@ -0,0 +1,104 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Throughput benchmark for the multi-process sharded manager.
+
+Runs a mixed CRUD workload from several client threads against 1, 2, 4
+and 8 shard processes, and times the scatter-gather operations (a full
+listing and a search) that every shard works on at once. Single-task
+calls to different shards overlap because each waits on its own pipe,
+so they scale with the cores available.
+
+Usage:
+    python benchmarks/bench_sharding.py [tasks]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from typing import Dict
+
+from common import print_table
+from sharded_manager import ShardedTodoManager
+from todo_manager import TodoManager
+
+DEFAULT_TASKS = 10 ** 5
+SHARD_COUNTS = [1, 2, 4, 8]
+CLIENT_THREADS = 8
+OPS_PER_THREAD = 2_000
+
+
+def mixed_operations(manager, size: int, seed: int) -> None:
+    """
+    Run 60% get_task, 15% toggle_complete, 15% update_task and 10% add_task calls.
+    """
+    rng = random.Random(seed)
+    for i in range(OPS_PER_THREAD):
+        task_id = rng.randint(1, size)
+        roll = rng.random()
+        if roll < 0.6:
+            manager.get_task(task_id)
+        elif roll < 0.75:
+            manager.toggle_complete(task_id)
+        elif roll < 0.9:
+            manager.update_task(task_id, f"Renamed {i}")
+        else:
+            manager.add_task(f"Client {seed} task {i}")
+
+
+def ops_per_second(manager, size: int, threads: int) -> float:
+    """Run the mix on the given number of threads and return the total throughput."""
+    workers = [threading.Thread(target=mixed_operations, args=(manager, size, seed))
+               for seed in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * OPS_PER_THREAD / (time.perf_counter() - start)
+
+
+def milliseconds(func) -> float:
+    """Return the wall time of one call in milliseconds."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def run(size: int = DEFAULT_TASKS) -> Dict[int, Dict[str, float]]:
+    """
+    Measure throughput and scatter-gather latency per shard count.
+
+    The row for 0 shards is a plain in-process TodoManager on one thread.
+
+    Returns:
+        dict: Mapping of shard count to {measurement: value}
+    """
+    results = {}
+    manager = TodoManager()
+    manager.add_tasks((f"Task {i}", "Sharding benchmark task") for i in range(size))
+    manager.search("warm")
+    results[0] = {'ops_per_s': ops_per_second(manager, size, 1),
+                  'get_all_ms': milliseconds(manager.get_all_tasks),
+                  'search_ms': milliseconds(lambda: manager.search("task 5"))}
+
+    for shards in SHARD_COUNTS:
+        manager = ShardedTodoManager(shards)
+        try:
+            manager.add_tasks((f"Task {i}", "Sharding benchmark task") for i in range(size))
+            manager.search("warm")
+            results[shards] = {'ops_per_s': ops_per_second(manager, size, CLIENT_THREADS),
+                               'get_all_ms': milliseconds(manager.get_all_tasks),
+                               'search_ms': milliseconds(lambda: manager.search("task 5"))}
+        finally:
+            manager.close()
+    return results
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TASKS
+    print_table(f"Sharded manager on {os.cpu_count()} CPUs, {CLIENT_THREADS} client threads "
+                f"(0 shards = in-process TodoManager)", run(size), unit="ops/s, ms", key="shards")
@@ -0,0 +1,71 @@
+# [Task]: Performance Benchmarks
+# [From]: constitution.md §Data Management
+
+"""
+Cold-start benchmark for the memory-mapped binary snapshot.
+
+Saves the same task list twice: once as a JSON journal that a restart
+must replay, and once compacted into a binary snapshot that a restart
+maps into memory. Then times the restart and the first reads after it.
+
+Usage:
+    python benchmarks/bench_snapshot.py [size ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from common import DEFAULT_SIZES, print_table
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+
+def milliseconds(func) -> float:
+    """Return the wall time of one call in milliseconds."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def run(sizes: List[int] = DEFAULT_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Measure restart time from a JSON log and from a binary snapshot.
+
+    Returns:
+        dict: Mapping of size to {measurement: milliseconds or MB}
+    """
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as json_dir, tempfile.TemporaryDirectory() as binary_dir:
+            for directory in (json_dir, binary_dir):
+                manager = TodoManager(JournalStorage(directory))
+                manager.add_tasks((f"Task {i}", "Snapshot benchmark task") for i in range(size))
+                manager.toggle_many(range(1, size + 1, 3))
+                if directory == binary_dir:
+                    manager._storage.compact(manager.iter_tasks(), manager._next_id)
+                manager.close()
+
+            managers = {}
+            row = {}
+            for name, directory in (('json', json_dir), ('mmap', binary_dir)):
+                row[f'{name}_start'] = milliseconds(
+                    lambda: managers.__setitem__(name, TodoManager(JournalStorage(directory))))
+
+            restored = managers['mmap']
+            row['get_task'] = milliseconds(lambda: restored.get_task(size // 2))
+            row['first_page'] = milliseconds(lambda: restored.get_task_page(0, 50))
+            row['counts'] = milliseconds(restored.count_by_status)
+            row['pending_page'] = milliseconds(lambda: restored.get_task_page(0, 50, completed=False))
+            row['file_MB'] = os.path.getsize(restored._storage.snapshot_path) / 2 ** 20
+            for manager in managers.values():
+                manager.close()
+        results[size] = row
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print_table("Cold start from a JSON log vs. a mapped snapshot", run(sizes), unit="ms, MB")
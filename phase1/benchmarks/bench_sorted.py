@@ -0,0 +1,66 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Sorted view benchmark.
+
+Compares fetching one 50-task page of the list sorted by title from the
+manager's sort index against sorting the whole list on every view, and
+measures what keeping the index costs: its one-off build and the extra
+time per update_task while it is maintained.
+
+Usage:
+    python benchmarks/bench_sorted.py [size ...]
+"""
+
+import random
+import sys
+from typing import Dict, List
+
+from common import DEFAULT_SIZES, print_table, time_per_op
+from sorted_index import SORT_KEYS
+from todo_manager import TodoManager
+
+PAGE = 50
+PAGES = 200
+UPDATES = 2_000
+
+
+def run(sizes: List[int] = DEFAULT_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Measure sorted page fetches and index upkeep for each list size.
+
+    Returns:
+        dict: Mapping of list size to {measurement: microseconds}
+    """
+    results = {}
+    for size in sizes:
+        manager = TodoManager()
+        manager.add_tasks((f"Task {random.random()}", "") for _ in range(size))
+        rng = random.Random(size)
+        offsets = [rng.randrange(max(size - PAGE, 1)) for _ in range(PAGES)]
+        ids = [rng.randint(1, size) for _ in range(UPDATES)]
+
+        def sort_each_view():
+            # What a view has to do without an index: sort, then slice
+            key = SORT_KEYS['title']
+            for offset in offsets[:max(PAGES * 1000 // size, 1)]:
+                sorted(manager.iter_tasks(), key=key)[offset:offset + PAGE]
+
+        def update_all(prefix):
+            for i, task_id in enumerate(ids):
+                manager.update_task(task_id, f"{prefix} {i}")
+
+        row = {'sort_view': time_per_op(sort_each_view, max(PAGES * 1000 // size, 1)),
+               'update': time_per_op(lambda: update_all("Plain"), UPDATES),
+               'build_index': time_per_op(lambda: manager.get_sorted_page('title', 0, PAGE), 1)}
+        row['indexed_page'] = time_per_op(
+            lambda: [manager.get_sorted_page('title', offset, PAGE) for offset in offsets], PAGES)
+        row['indexed_upd'] = time_per_op(lambda: update_all("Indexed"), UPDATES)
+        results[size] = row
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print_table(f"Sorted views ({PAGE}-task page sorted by title)", run(sizes))
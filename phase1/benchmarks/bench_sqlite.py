@@ -0,0 +1,72 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Latency comparison between the in-memory and SQLite task managers.
+
+Scales the CRUD scenario from test_todo_app.py up to large task counts:
+bulk-load the tasks, then time get, update, toggle and delete calls on
+random existing IDs for both managers.
+
+Usage:
+    python benchmarks/bench_sqlite.py [size ...]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from typing import Dict, List
+
+from common import DEFAULT_SIZES, print_table, time_per_op
+from sqlite_manager import SQLiteTodoManager
+from todo_manager import TodoManager
+
+OPS = 5_000
+
+
+def crud_latencies(manager, size: int, seed: int = 42) -> Dict[str, float]:
+    """
+    Load ``size`` tasks and time each CRUD operation on random IDs.
+
+    Returns:
+        dict: {operation: microseconds per op}
+    """
+    rng = random.Random(seed)
+    items = [(f"Task {i}", "Benchmark task") for i in range(size)]
+    load = time_per_op(lambda: manager.add_tasks(items) if hasattr(manager, 'add_tasks')
+                       else [manager.add_task(*item) for item in items], size)
+
+    ids = [rng.randint(1, size) for _ in range(OPS)]
+    doomed = rng.sample(range(1, size + 1), min(OPS, size))
+    return {
+        'load': load,
+        'get': time_per_op(lambda: [manager.get_task(i) for i in ids], OPS),
+        'update': time_per_op(lambda: [manager.update_task(i, "Renamed") for i in ids], OPS),
+        'toggle': time_per_op(lambda: [manager.toggle_complete(i) for i in ids], OPS),
+        'delete': time_per_op(lambda: [manager.delete_task(i) for i in doomed], len(doomed)),
+    }
+
+
+def run(sizes: List[int] = DEFAULT_SIZES) -> Dict[str, Dict[int, Dict[str, float]]]:
+    """
+    Benchmark both managers at each size.
+
+    Returns:
+        dict: {'memory': results, 'sqlite': results}, keyed by size
+    """
+    results = {'memory': {}, 'sqlite': {}}
+    for size in sizes:
+        results['memory'][size] = crud_latencies(TodoManager(), size)
+        with tempfile.TemporaryDirectory() as directory:
+            manager = SQLiteTodoManager(os.path.join(directory, "tasks.db"))
+            results['sqlite'][size] = crud_latencies(manager, size)
+            manager.close()
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    results = run(sizes)
+    print_table("In-memory TodoManager", results['memory'])
+    print_table("SQLiteTodoManager (WAL)", results['sqlite'])
@@ -0,0 +1,89 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §Main Application
+
+"""
+Startup benchmark for the launcher modes.
+
+Starts a fresh interpreter per mode under ``python -X importtime`` and
+reports the wall time to exit, the time spent importing modules, the
+number of modules imported and whether tkinter was loaded. The console
+is fed an empty stdin, so it shows the menu once and exits; the GUI
+mode imports gui_ui and tkinter without opening a window, which needs
+no display.
+
+The suite holds the import times under IMPORT_BUDGET_MS and checks that
+only the GUI loads tkinter.
+
+Usage:
+    python benchmarks/bench_startup.py [mode ...]
+"""
+
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from common import PROJECT_ROOT, print_table
+
+# Interpreter arguments per mode, run from the project root
+MODES = {
+    'command': ['todo.py', 'list'],
+    'batch': ['todo.py', 'batch', '-'],
+    'console': ['todo.py'],
+    'gui': ['-c', 'import gui_ui; gui_ui.load_tk()'],
+}
+# Import time each mode must stay under, in milliseconds
+IMPORT_BUDGET_MS = {'command': 100.0, 'batch': 100.0, 'console': 110.0, 'gui': 150.0}
+RUNS = 5
+
+
+def parse_importtime(report: str) -> Dict[str, float]:
+    """
+    Sum the -X importtime report of one run.
+
+    Returns:
+        dict: {'import_ms': cumulative time of the top-level imports,
+            'modules': modules imported, 'tkinter': 1.0 if tkinter was imported}
+    """
+    total_us = modules = 0
+    tkinter = False
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules += 1
+        tkinter = tkinter or name.strip() == "tkinter"
+        if not name.startswith("  "):
+            # A top-level import; nested ones are inside its cumulative time
+            total_us += int(cumulative)
+    return {'import_ms': total_us / 1e3, 'modules': float(modules), 'tkinter': float(tkinter)}
+
+
+def start(arguments: List[str]) -> Dict[str, float]:
+    """Run one interpreter with import timing and measure it."""
+    began = time.perf_counter()
+    process = subprocess.run([sys.executable, '-X', 'importtime', *arguments], cwd=PROJECT_ROOT,
+                             input="", capture_output=True, text=True, encoding="utf-8")
+    wall_ms = (time.perf_counter() - began) * 1e3
+    if process.returncode:
+        raise RuntimeError(f"{' '.join(arguments)} failed: {process.stderr[-500:]}")
+    return {'wall_ms': wall_ms, **parse_importtime(process.stderr)}
+
+
+def run(modes: List[str] = list(MODES)) -> Dict[str, Dict[str, float]]:
+    """
+    Measure each mode's startup, keeping the fastest of RUNS starts.
+
+    Returns:
+        dict: Mapping of mode to {'wall_ms', 'import_ms', 'modules', 'tkinter'}
+    """
+    results = {}
+    for mode in modes:
+        runs = [start(MODES[mode]) for _ in range(RUNS)]
+        results[mode] = min(runs, key=lambda measured: measured['import_ms'])
+    return results
+
+
+if __name__ == "__main__":
+    modes = sys.argv[1:] or list(MODES)
+    print_table("Startup per launcher mode", run(modes), unit="ms, modules", key="mode")
@@ -0,0 +1,58 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Overhead benchmark for operation statistics.
+
+Times common operations on a manager without statistics (the methods are
+not wrapped at all) and on one created with OperationStats, whose
+wrappers read the clock twice and update a histogram per call.
+
+Usage:
+    python benchmarks/bench_stats.py [tasks]
+"""
+
+import sys
+from typing import Dict
+
+from common import print_table, time_per_op
+from instrumentation import OperationStats
+from todo_manager import TodoManager
+
+DEFAULT_TASKS = 10 ** 4
+CALLS = 100_000
+
+
+def operations(manager: TodoManager, size: int) -> Dict[str, float]:
+    """Return the time per call of each operation in microseconds."""
+    ids = [i % size + 1 for i in range(CALLS)]
+    return {
+        'get_task': time_per_op(lambda: [manager.get_task(task_id) for task_id in ids], CALLS),
+        'toggle': time_per_op(lambda: [manager.toggle_complete(task_id) for task_id in ids], CALLS),
+        'add_task': time_per_op(lambda: [manager.add_task("Benchmark task") for _ in range(CALLS)], CALLS),
+        'get_all': time_per_op(lambda: [manager.get_all_tasks() for _ in range(100)], 100),
+    }
+
+
+def run(size: int = DEFAULT_TASKS) -> Dict[str, Dict[str, float]]:
+    """
+    Measure each operation with statistics disabled and enabled.
+
+    Returns:
+        dict: Mapping of operation to {'disabled', 'enabled', 'overhead'} in microseconds
+    """
+    results = {}
+    timings = {}
+    for label, stats in (('disabled', None), ('enabled', OperationStats())):
+        manager = TodoManager(stats=stats)
+        manager.add_tasks((f"Task {i}", "Statistics benchmark") for i in range(size))
+        timings[label] = operations(manager, size)
+    for name, disabled in timings['disabled'].items():
+        enabled = timings['enabled'][name]
+        results[name] = {'disabled': disabled, 'enabled': enabled, 'overhead': enabled - disabled}
+    return results
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TASKS
+    print_table(f"Operation statistics overhead with {size} tasks", run(size), key="operation")
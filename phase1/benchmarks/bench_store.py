@@ -0,0 +1,61 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Microbenchmark for the id-indexed task store.
+
+Measures the per-operation cost of get_task, update_task, toggle_complete
+and delete_task at growing list sizes. With an id-keyed store each column
+should stay flat as the number of tasks grows.
+
+Usage:
+    python benchmarks/bench_store.py [size ...]
+"""
+
+import random
+import sys
+from typing import Dict, List
+
+from common import DEFAULT_SIZES, print_table, time_per_op
+from todo_manager import TodoManager
+
+OPS = 10_000
+
+
+def build_manager(size: int) -> TodoManager:
+    """
+    Create a TodoManager pre-filled with ``size`` tasks.
+    """
+    manager = TodoManager()
+    for i in range(size):
+        manager.add_task(f"Task {i}", "Benchmark task")
+    return manager
+
+
+def run(sizes: List[int] = DEFAULT_SIZES) -> Dict[int, Dict[str, float]]:
+    """
+    Benchmark the core single-task operations at each list size.
+
+    Returns:
+        dict: Mapping of list size to {operation: microseconds per op}
+    """
+    results = {}
+    rng = random.Random(42)
+    for size in sizes:
+        manager = build_manager(size)
+        ids = [rng.randint(1, size) for _ in range(OPS)]
+        # Delete distinct IDs so every call hits an existing task
+        doomed = rng.sample(range(1, size + 1), min(OPS, size))
+
+        results[size] = {
+            'get_task': time_per_op(lambda: [manager.get_task(i) for i in ids], OPS),
+            'update_task': time_per_op(lambda: [manager.update_task(i, "Renamed") for i in ids], OPS),
+            'toggle': time_per_op(lambda: [manager.toggle_complete(i) for i in ids], OPS),
+            'delete_task': time_per_op(lambda: [manager.delete_task(i) for i in doomed], len(doomed)),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print_table("TodoManager single-task operations", run(sizes))
@@ -0,0 +1,56 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Shared helpers for the Todo Console App benchmarks.
+"""
+
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+# Add the project root (for gui_ui) and the src directory to Python path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+
+def time_per_op(func: Callable[[], None], ops: int) -> float:
+    """
+    Run a callable once and return the average time per operation.
+
+    Args:
+        func (callable): Callable that performs ``ops`` operations
+        ops (int): Number of operations performed by ``func``
+
+    Returns:
+        float: Average time per operation in microseconds
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return elapsed / max(ops, 1) * 1e6
+
+
+def print_table(title: str, rows: Dict[int, Dict[str, float]], unit: str = "us/op",
+                key: str = "tasks") -> None:
+    """
+    Print benchmark results as a table with one row per list size.
+
+    Args:
+        title (str): Heading printed above the table
+        rows (dict): Mapping of list size to {column name: value}
+        unit (str): Unit label shown in the heading
+        key (str): Heading of the first column
+    """
+    columns = list(next(iter(rows.values())).keys())
+    print(f"\n{title} ({unit})")
+    print("=" * (12 + 14 * len(columns)))
+    print(f"{key:>12}" + "".join(f"{name:>14}" for name in columns))
+    print("-" * (12 + 14 * len(columns)))
+    for size, values in rows.items():
+        print(f"{size:>12}" + "".join(f"{values[name]:>14.3f}" for name in columns))
+    print("=" * (12 + 14 * len(columns)))
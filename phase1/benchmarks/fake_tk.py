@@ -0,0 +1,107 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §UI Enhancement
+
+"""
+Minimal stand-ins for ttk.Treeview and ttk.Scrollbar.
+
+They record rows in plain Python structures so GUI refresh logic can be
+benchmarked headless, without a display or a Tk interpreter.
+"""
+
+from typing import Dict, List, Tuple
+
+
+class FakeTreeview:
+    """
+    In-memory Treeview supporting the calls the task list makes.
+    """
+
+    def __init__(self, height: int = 15):
+        """Create an empty tree showing ``height`` rows."""
+        self.height = height
+        self.rows: Dict[str, Tuple] = {}
+        self.order: List[str] = []
+        self.operations = 0
+        self._next_iid = 0
+
+    def cget(self, option: str):
+        """Return a widget option; only 'height' is supported."""
+        return self.height
+
+    def bind(self, sequence: str, func) -> None:
+        """Accept and ignore event bindings."""
+
+    def get_children(self, item: str = '') -> Tuple[str, ...]:
+        """Return the row IDs in display order."""
+        return tuple(self.order)
+
+    def exists(self, iid: str) -> bool:
+        """Return True if a row with this ID exists."""
+        return iid in self.rows
+
+    def insert(self, parent: str, index, iid: str = None, values: Tuple = ()) -> str:
+        """Insert a row at ``index`` ('end' appends)."""
+        if iid is None:
+            self._next_iid += 1
+            iid = f"I{self._next_iid}"
+        position = len(self.order) if index == 'end' else index
+        self.order.insert(position, iid)
+        self.rows[iid] = values
+        self.operations += 1
+        return iid
+
+    def item(self, iid: str, values: Tuple = None):
+        """Read a row, or replace its values when ``values`` is given."""
+        if values is None:
+            return {'values': list(self.rows[iid])}
+        self.rows[iid] = values
+        self.operations += 1
+
+    def move(self, iid: str, parent: str, index: int) -> None:
+        """Move a row to a new position."""
+        if self.order[index:index + 1] != [iid]:
+            self.order.remove(iid)
+            self.order.insert(index, iid)
+            self.operations += 1
+
+    def delete(self, *iids: str) -> None:
+        """Delete the given rows."""
+        for iid in iids:
+            self.order.remove(iid)
+            del self.rows[iid]
+            self.operations += 1
+
+
+class FakeVar:
+    """
+    Stand-in for tk.StringVar.
+    """
+
+    def __init__(self, value: str = ""):
+        """Create a variable holding ``value``."""
+        self.value = value
+
+    def get(self) -> str:
+        """Return the current value."""
+        return self.value
+
+    def set(self, value: str) -> None:
+        """Replace the current value."""
+        self.value = value
+
+
+class FakeScrollbar:
+    """
+    Scrollbar that only remembers its last position.
+    """
+
+    def __init__(self):
+        """Create a scrollbar showing the whole list."""
+        self.position = (0.0, 1.0)
+
+    def configure(self, **options) -> None:
+        """Accept and ignore widget options."""
+
+    def set(self, first: float, last: float) -> None:
+        """Record the visible fraction of the list."""
+        self.position = (first, last)
@@ -0,0 +1,238 @@
+# [Task]: Performance Benchmarks
+# [From]: plan.md §TodoManager Class
+
+"""
+Benchmark suite with machine-readable results and regression checks.
+
+Runs the benchmarks listed in SUITE, writes every measurement as JSON and
+compares it with a stored baseline, flagging measurements that got worse
+by more than the tolerance. Every suite measurement is a cost (time,
+bytes or rows), so lower is better. Each benchmark runs --repeat times
+and keeps the best value of each measurement, which takes most of the
+scheduling noise out of the comparison.
+
+Baselines are only meaningful on the machine they were recorded on;
+record one with --save-baseline before comparing. The limits in BUDGETS,
+such as the startup import times, are checked on every run.
+
+Usage:
+    python benchmarks/suite.py [--quick] [--only NAME ...] [--repeat N]
+                               [--output FILE] [--baseline FILE]
+                               [--save-baseline] [--tolerance FRACTION]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from common import DEFAULT_SIZES
+import bench_console
+import bench_crud
+import bench_gui
+import bench_memory
+import bench_search
+import bench_startup
+import bench_sorted
+import bench_store
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TOLERANCE = 0.5
+DEFAULT_REPEAT = 3
+
+# Results per benchmark: {row label: {measurement: value}}
+Results = Dict[str, Dict[str, Dict[str, float]]]
+
+
+class Benchmark(NamedTuple):
+    """A suite entry: the benchmark's run() and its arguments for a full and a quick run."""
+    run: Callable[[List], Dict]
+    sizes: List
+    quick_sizes: List
+
+
+SUITE = {
+    'crud': Benchmark(bench_crud.run, bench_crud.SUITE_SIZES, [10, 10 ** 3, 10 ** 4]),
+    'store': Benchmark(bench_store.run, DEFAULT_SIZES, [10 ** 3, 10 ** 4]),
+    'memory': Benchmark(bench_memory.run, bench_memory.DEFAULT_MEMORY_SIZES, [10 ** 4]),
+    'gui': Benchmark(bench_gui.run, bench_gui.DEFAULT_GUI_SIZES, [10 ** 3, 10 ** 4]),
+    'console': Benchmark(bench_console.run, DEFAULT_SIZES, [10 ** 3, 10 ** 4]),
+    'search': Benchmark(bench_search.run, DEFAULT_SIZES, [10 ** 3, 10 ** 4]),
+    'sorted': Benchmark(bench_sorted.run, DEFAULT_SIZES, [10 ** 3, 10 ** 4]),
+    'startup': Benchmark(bench_startup.run, list(bench_startup.MODES), list(bench_startup.MODES)),
+}
+
+# Limits that hold whatever the baseline: {benchmark: {measurement: {row: limit}}}
+BUDGETS = {
+    'startup': {
+        'import_ms': bench_startup.IMPORT_BUDGET_MS,
+        # Only the GUI may load tkinter
+        'tkinter': {'command': 0.0, 'batch': 0.0, 'console': 0.0},
+    },
+}
+
+
+class Regression(NamedTuple):
+    """A measurement that got worse than the baseline allows."""
+    benchmark: str
+    row: str
+    measurement: str
+    baseline: float
+    current: float
+
+
+def run_suite(names: List[str], quick: bool = False, repeat: int = DEFAULT_REPEAT) -> Results:
+    """
+    Run the named benchmarks and keep the best value of each measurement.
+
+    Args:
+        names (list[str]): Keys of SUITE to run
+        quick (bool): Use the small quick sizes
+        repeat (int): Runs per benchmark
+
+    Returns:
+        dict: Mapping of benchmark name to its results, with row labels as strings
+    """
+    results = {}
+    for name in names:
+        benchmark = SUITE[name]
+        best: Dict[str, Dict[str, float]] = {}
+        for _ in range(repeat):
+            rows = benchmark.run(benchmark.quick_sizes if quick else benchmark.sizes)
+            for row, values in rows.items():
+                best_row = best.setdefault(str(row), {})
+                for measurement, value in values.items():
+                    best_row[measurement] = min(value, best_row.get(measurement, value))
+        results[name] = best
+    return results
+
+
+def compare(results: Results, baseline: Results, tolerance: float) -> List[Regression]:
+    """
+    Find the measurements that are worse than the baseline by more than the tolerance.
+
+    Measurements missing from either side (another size, a new column)
+    are skipped.
+
+    Args:
+        results (dict): The current results
+        baseline (dict): The stored results
+        tolerance (float): Allowed slowdown, e.g. 0.5 for up to 1.5x the baseline
+
+    Returns:
+        list[Regression]: The regressed measurements
+    """
+    regressions = []
+    for name, rows in results.items():
+        for row, values in rows.items():
+            baseline_values = baseline.get(name, {}).get(row, {})
+            for measurement, value in values.items():
+                reference = baseline_values.get(measurement)
+                if reference is not None and value > reference * (1 + tolerance):
+                    regressions.append(Regression(name, row, measurement, reference, value))
+    return regressions
+
+
+def over_budget(results: Results) -> List[Regression]:
+    """
+    Find the measurements above their limit in BUDGETS.
+
+    Returns:
+        list[Regression]: The measurements over budget, with the limit as the baseline
+    """
+    failures = []
+    for name, measurements in BUDGETS.items():
+        for measurement, limits in measurements.items():
+            for row, limit in limits.items():
+                value = results.get(name, {}).get(row, {}).get(measurement)
+                if value is not None and value > limit:
+                    failures.append(Regression(name, row, measurement, limit, value))
+    return failures
+
+
+def print_failures(title: str, failures: List[Regression]) -> None:
+    """Print regressed or over-budget measurements to stderr."""
+    print(title, file=sys.stderr)
+    for failure in failures:
+        print(f"  {failure.benchmark} [{failure.row}] {failure.measurement}: "
+              f"{failure.baseline:.3f} -> {failure.current:.3f}", file=sys.stderr)
+
+
+def environment(quick: bool, repeat: int) -> Dict[str, object]:
+    """Describe the machine and settings the results were recorded with."""
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'platform': platform.platform(), 'cpus': os.cpu_count(), 'quick': quick,
+            'repeat': repeat, 'time': time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def load_baseline(path: str) -> Optional[Dict]:
+    """Read a baseline file, or return None if there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the suite, write its results and compare them with the baseline.
+
+    Returns:
+        int: Exit status; 1 if any measurement regressed or went over budget
+    """
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and check for regressions.")
+    parser.add_argument('--quick', action='store_true', help="run small sizes only")
+    parser.add_argument('--only', nargs='+', choices=list(SUITE), default=list(SUITE), metavar='NAME',
+                        help=f"benchmarks to run (default: all of {', '.join(SUITE)})")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="runs per benchmark, best kept")
+    parser.add_argument('--output', metavar='FILE', help="write the results as JSON (default: stdout)")
+    parser.add_argument('--baseline', metavar='FILE', default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="store the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown before flagging, as a fraction (default: 0.5)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    report = {'environment': environment(args.quick, args.repeat),
+              'results': run_suite(args.only, args.quick, args.repeat)}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    status = 0
+    failures = over_budget(report['results'])
+    if failures:
+        print_failures(f"{len(failures)} measurements over budget (limit -> measured):", failures)
+        status = 1
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return status
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; record one with --save-baseline", file=sys.stderr)
+        return status
+    if baseline['environment']['quick'] != args.quick:
+        print("Baseline was recorded with different sizes; only shared sizes are compared", file=sys.stderr)
+
+    regressions = compare(report['results'], baseline['results'], args.tolerance)
+    if regressions:
+        print_failures(f"{len(regressions)} regressions beyond {args.tolerance:.0%} of the baseline "
+                       f"(baseline -> measured):", regressions)
+        return 1
+    print(f"No regressions beyond {args.tolerance:.0%} of the baseline", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
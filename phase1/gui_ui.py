@@ -1,9 +1,48 @@
 # [Task]: Interactive GUI UI
 # [From]: specify.md §User Experience, plan.md §UI Enhancement
 
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-from todo_manager import TodoManager
+import argparse
+from typing import List, Optional
+try:
+    from src.autosave import AutosaveStorage
+    from src.history import UndoHistory
+    from src.journal import JournalStorage
+    from src.sorted_index import SORT_KEYS
+    from src.todo_manager import TodoManager
+except ImportError:
+    from autosave import AutosaveStorage
+    from history import UndoHistory
+    from journal import JournalStorage
+    from sorted_index import SORT_KEYS
+    from todo_manager import TodoManager
+
+# tkinter modules, imported by load_tk() when a window is first created so
+# that importing this module (e.g. for the headless benchmarks) stays cheap
+tk = ttk = messagebox = None
+
+# Maximum number of search results shown in the task list
+SEARCH_LIMIT = 500
+
+# Status filter choices mapped to the manager's completed filter
+STATUS_FILTERS = {'All': None, 'Pending': False, 'Completed': True}
+
+# Task field sorted by each Treeview column
+COLUMN_FIELDS = {'ID': 'id', 'Title': 'title', 'Description': 'description', 'Status': 'status'}
+
+# Default Treeview row height and heading height, in pixels
+ROW_HEIGHT = 20
+HEADING_HEIGHT = 25
+
+
+def load_tk():
+    """
+    Import tkinter and the ttk and messagebox modules used by the GUI.
+    """
+    global tk, ttk, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as tk_ttk, messagebox as tk_messagebox
+        tk, ttk, messagebox = tkinter, tk_ttk, tk_messagebox
 
 
 class TodoGUI:
@@ -12,25 +51,36 @@ class TodoGUI:
     Provides an interactive UI using tkinter.
     """
     
-    def __init__(self, root):
+    def __init__(self, root, journal_dir=None):
         """
         Initialize the GUI with a root window.
         
         Args:
             root: The main tkinter window
+            journal_dir (str | None): Directory for durable task storage;
+                tasks are kept in memory only when omitted
         """
+        load_tk()
         self.root = root
         self.root.title("Todo Console App - GUI Version")
         self.root.geometry("700x500")
         
-        # Initialize the TodoManager
-        self.manager = TodoManager()
+        # Initialize the TodoManager, keeping an undo history. Changes are
+        # saved from a background thread, so the event loop never waits on the disk
+        storage = AutosaveStorage(JournalStorage(journal_dir)) if journal_dir else None
+        self.manager = TodoManager(storage, UndoHistory())
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Column the list is sorted by (None keeps insertion order) and direction
+        self.sort_column = None
+        self.sort_descending = False
         
         # Set up the GUI elements
         self.setup_gui()
         
-        # Refresh the task list
+        # Refresh the task list, then follow the manager's changes row by row
         self.refresh_task_list()
+        self.manager.add_change_listener(self.on_tasks_changed)
     
     def setup_gui(self):
         """
@@ -70,6 +120,28 @@ class TodoGUI:
         self.refresh_button = tk.Button(button_frame, text="Refresh", command=self.refresh_task_list, bg="#9E9E9E", fg="white")
         self.refresh_button.grid(row=0, column=4, padx=5, pady=5, sticky="ew")
         
+        # Search box below the buttons
+        search_frame = tk.Frame(button_frame)
+        search_frame.grid(row=1, column=0, columnspan=5, padx=5, pady=5, sticky="ew")
+        search_frame.columnconfigure(1, weight=1)
+        
+        tk.Label(search_frame, text="Search:").grid(row=0, column=0, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_entry = tk.Entry(search_frame, textvariable=self.search_var)
+        self.search_entry.grid(row=0, column=1, sticky="ew")
+        self.search_entry.bind('<Return>', lambda event: self.refresh_task_list())
+        
+        tk.Button(search_frame, text="Search", command=self.refresh_task_list).grid(row=0, column=2, padx=5)
+        tk.Button(search_frame, text="Clear", command=self.clear_search).grid(row=0, column=3)
+        
+        # Status filter next to the search box
+        tk.Label(search_frame, text="Show:").grid(row=0, column=4, padx=(10, 5))
+        self.filter_var = tk.StringVar(value='All')
+        filter_box = ttk.Combobox(search_frame, textvariable=self.filter_var, values=list(STATUS_FILTERS),
+                                  state='readonly', width=10)
+        filter_box.grid(row=0, column=5)
+        filter_box.bind('<<ComboboxSelected>>', lambda event: self.refresh_task_list())
+        
         # Task list frame
         task_frame = tk.Frame(self.root)
         task_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=10)
@@ -80,11 +152,9 @@ class TodoGUI:
         columns = ('ID', 'Title', 'Description', 'Status')
         self.task_tree = ttk.Treeview(task_frame, columns=columns, show='headings', height=15)
         
-        # Define headings
-        self.task_tree.heading('ID', text='ID')
-        self.task_tree.heading('Title', text='Title')
-        self.task_tree.heading('Description', text='Description')
-        self.task_tree.heading('Status', text='Status')
+        # Define headings; clicking one sorts the list by that column
+        for column in columns:
+            self.task_tree.heading(column, text=column, command=lambda column=column: self.sort_by(column))
         
         # Define column widths
         self.task_tree.column('ID', width=50)
@@ -93,13 +163,16 @@ class TodoGUI:
         self.task_tree.column('Status', width=100)
         
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(task_frame, orient=tk.VERTICAL, command=self.task_tree.yview)
-        self.task_tree.configure(yscroll=scrollbar.set)
+        scrollbar = ttk.Scrollbar(task_frame, orient=tk.VERTICAL)
         
         # Pack the treeview and scrollbar
         self.task_tree.grid(row=0, column=0, sticky='nsew')
         scrollbar.grid(row=0, column=1, sticky='ns')
         
+        # Only the rows on screen exist in the treeview; the virtual list
+        # drives the scrollbar and swaps rows in as it moves
+        self.task_list = VirtualTaskList(self.task_tree, scrollbar)
+        
         # Bind selection event
         self.task_tree.bind('<<TreeviewSelect>>', self.on_task_select)
         
@@ -108,25 +181,125 @@ class TodoGUI:
         self.status_bar = tk.Label(self.root, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.grid(row=3, column=0, sticky="ew", padx=5, pady=5)
         self.status_var.set("Ready")
+        
+        # Undo and redo from anywhere in the main window
+        self.root.bind('<Control-z>', lambda event: self.undo())
+        self.root.bind('<Control-y>', lambda event: self.redo())
     
     def refresh_task_list(self):
         """
         Refresh the task list display.
+        
+        Only the visible rows are fetched from the manager, so the cost
+        does not grow with the number of tasks.
         """
-        # Clear current items
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
+        # Show the search results if there is a query, otherwise every task
+        query = self.search_var.get().strip()
+        completed = STATUS_FILTERS[self.filter_var.get()]
+        field = COLUMN_FIELDS.get(self.sort_column)
+        if query:
+            tasks = self.manager.search(query, limit=SEARCH_LIMIT)
+            if completed is not None:
+                tasks = [task for task in tasks if task['completed'] == completed]
+            if field is not None:
+                # At most SEARCH_LIMIT results, so sorting them directly is cheap
+                tasks.sort(key=SORT_KEYS[field], reverse=self.sort_descending)
+            self.task_list.set_source(len(tasks), lambda offset, limit: tasks[offset:offset + limit])
+        elif field is not None:
+            # The manager keeps a sort index, so each window is an O(log n) lookup
+            descending = self.sort_descending
+            self.task_list.set_source(
+                self.filtered_count(),
+                lambda offset, limit: self.manager.get_sorted_page(field, offset, limit, descending, completed))
+        else:
+            self.task_list.set_source(
+                self.filtered_count(), lambda offset, limit: self.manager.get_task_page(offset, limit, completed))
         
-        # Get all tasks
-        tasks = self.manager.get_all_tasks()
+        self.update_status()
+    
+    def on_tasks_changed(self, events):
+        """
+        Apply a batch of changes from the manager to the task list.
         
-        # Insert tasks into the treeview
-        for task in tasks:
-            status_text = "Completed" if task['completed'] else "Pending"
-            self.task_tree.insert('', tk.END, values=(task['id'], task['title'], task['description'], status_text))
+        Edits to visible rows only rewrite those rows; tasks entering or
+        leaving the list resize the virtual list once per batch, which
+        touches at most the rows on screen.
         
-        # Update status
-        self.status_var.set(f"Showing {len(tasks)} tasks")
+        Args:
+            events: ChangeEvent tuples (kind, task_id, fields)
+        """
+        # Search results depend on every task's text, and a change can move
+        # a task anywhere in a sorted list, so fetch the window again
+        if self.search_var.get().strip() or self.sort_column is not None:
+            self.refresh_task_list()
+            return
+        
+        completed = STATUS_FILTERS[self.filter_var.get()]
+        first_moved = None
+        for event in events:
+            if event.kind in ('updated', 'toggled') and (completed is None or 'completed' not in event.fields):
+                self.task_list.update_row(self.manager.get_task(event.task_id))
+            elif first_moved is None or event.task_id < first_moved:
+                first_moved = event.task_id
+        
+        # Tasks entered or left the list; rows only shift if one of them
+        # sits before or inside the window
+        if first_moved is not None:
+            self.task_list.change_total(self.filtered_count(), first_moved)
+        
+        self.update_status()
+    
+    def filtered_count(self):
+        """
+        Return the number of tasks matching the status filter.
+        """
+        completed = STATUS_FILTERS[self.filter_var.get()]
+        if completed is None:
+            return self.manager.task_count()
+        return self.manager.count_by_status()['completed' if completed else 'pending']
+    
+    def update_status(self):
+        """
+        Show what the task list contains in the status bar.
+        """
+        counts = self.manager.count_by_status()
+        summary = f"{counts['pending']} pending, {counts['completed']} completed"
+        query = self.search_var.get().strip()
+        if query:
+            self.status_var.set(f"Found {self.task_list.total} tasks matching '{query}' ({summary})")
+        elif STATUS_FILTERS[self.filter_var.get()] is None:
+            self.status_var.set(f"Showing {self.manager.task_count()} tasks ({summary})")
+        else:
+            self.status_var.set(f"Showing {self.filter_var.get().lower()} tasks ({summary})")
+    
+    def sort_by(self, column):
+        """
+        Sort the task list by a column; clicking the same column again
+        reverses the order.
+        
+        Args:
+            column: The Treeview column whose heading was clicked
+        """
+        if column == self.sort_column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = False
+        
+        # Mark the sorted column's heading with the direction
+        arrow = " ▼" if self.sort_descending else " ▲"
+        for name in COLUMN_FIELDS:
+            self.task_tree.heading(name, text=name + (arrow if name == column else ""))
+        
+        self.task_list.scroll_to(0)
+        self.refresh_task_list()
+    
+    def clear_search(self):
+        """
+        Clear the search box and show all tasks again.
+        """
+        self.search_var.set("")
+        self.refresh_task_list()
     
     def on_task_select(self, event):
         """
@@ -169,7 +342,6 @@ class TodoGUI:
             try:
                 task = self.manager.add_task(title, description)
                 messagebox.showinfo("Success", f"Task added successfully! ID: {task['id']}")
-                self.refresh_task_list()
             except ValueError as e:
                 messagebox.showerror("Error", f"Error adding task: {e}")
     
@@ -197,7 +369,6 @@ class TodoGUI:
                 success = self.manager.update_task(task_id, new_title, new_description)
                 if success:
                     messagebox.showinfo("Success", f"Task {task_id} updated successfully!")
-                    self.refresh_task_list()
                 else:
                     messagebox.showerror("Error", f"Failed to update task {task_id}.")
             except ValueError as e:
@@ -218,7 +389,6 @@ class TodoGUI:
             success = self.manager.delete_task(task_id)
             if success:
                 messagebox.showinfo("Success", f"Task {task_id} deleted successfully!")
-                self.refresh_task_list()
             else:
                 messagebox.showerror("Error", f"Failed to delete task {task_id}.")
     
@@ -239,11 +409,205 @@ class TodoGUI:
         
         success = self.manager.toggle_complete(task_id)
         if success:
+            # Re-read the task, since some managers return detached snapshots
+            task = self.manager.get_task(task_id)
             new_status = "completed" if task['completed'] else "incomplete"
             messagebox.showinfo("Success", f"Task {task_id} marked as {new_status}!")
-            self.refresh_task_list()
         else:
             messagebox.showerror("Error", f"Failed to toggle completion status for task {task_id}.")
+    
+    def undo(self):
+        """
+        Handle undoing the most recent change (Ctrl+Z).
+        
+        The task list follows through the change listener; the bell rings
+        if there is nothing to undo.
+        """
+        if not self.manager.undo():
+            self.root.bell()
+    
+    def redo(self):
+        """
+        Handle redoing the most recently undone change (Ctrl+Y).
+        """
+        if not self.manager.redo():
+            self.root.bell()
+    
+    def close(self):
+        """
+        Handle closing the window: end the event loop. run_gui() then
+        writes any unsaved changes, however the loop ended.
+        """
+        self.root.destroy()
+
+
+class VirtualTaskList:
+    """
+    Shows a large task list in a Treeview by materializing only the visible rows.
+    
+    The scrollbar and mouse wheel move a window over the task source; rows
+    leaving the window are deleted and rows entering it are inserted, so
+    memory and redraw time stay flat however many tasks there are. Tasks
+    just outside the window are prefetched into a small buffer.
+    """
+    
+    def __init__(self, tree, scrollbar, buffer=50):
+        """
+        Attach the virtual list to a Treeview and its scrollbar.
+        
+        Args:
+            tree: The ttk.Treeview that displays the rows
+            scrollbar: The ttk.Scrollbar that controls the window position
+            buffer: Number of tasks prefetched beyond each edge of the window
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.buffer = buffer
+        self.page_size = int(tree.cget('height'))
+        self.total = 0
+        self.offset = 0
+        self._fetch = lambda offset, limit: []
+        self._cache_start = 0
+        self._cache = []
+        
+        scrollbar.configure(command=self.on_scrollbar)
+        tree.bind('<MouseWheel>', self.on_mousewheel)
+        tree.bind('<Button-4>', lambda event: self.scroll_by(-3))
+        tree.bind('<Button-5>', lambda event: self.scroll_by(3))
+        tree.bind('<Configure>', self.on_resize)
+    
+    def set_source(self, total, fetch):
+        """
+        Show a new task source, keeping the scroll position where possible.
+        
+        Args:
+            total: Number of tasks in the source
+            fetch: Callable (offset, limit) -> list of tasks
+        """
+        self.total = total
+        self._fetch = fetch
+        self._cache = []
+        self.offset = min(self.offset, max(total - self.page_size, 0))
+        self.render()
+    
+    def scroll_to(self, offset):
+        """
+        Move the window so it starts at the given task position.
+        """
+        offset = max(0, min(int(offset), max(self.total - self.page_size, 0)))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+    
+    def scroll_by(self, rows):
+        """
+        Move the window by a number of rows and stop Tk's own scrolling.
+        """
+        self.scroll_to(self.offset + rows)
+        return 'break'
+    
+    def on_scrollbar(self, action, *args):
+        """
+        Handle the scrollbar's moveto and scroll commands.
+        """
+        if action == 'moveto':
+            self.scroll_to(float(args[0]) * self.total)
+        elif action == 'scroll':
+            step = self.page_size if args[1] == 'pages' else 1
+            self.scroll_by(int(args[0]) * step)
+    
+    def on_mousewheel(self, event):
+        """
+        Scroll three rows per mouse wheel notch.
+        """
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+    
+    def on_resize(self, event):
+        """
+        Show as many rows as fit in the resized Treeview.
+        """
+        page_size = max(1, (event.height - HEADING_HEIGHT) // ROW_HEIGHT)
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self.offset = min(self.offset, max(self.total - self.page_size, 0))
+            self.render()
+    
+    def update_row(self, task):
+        """
+        Rewrite the row of a changed task if it is on screen.
+        """
+        iid = str(task['id'])
+        if self.tree.exists(iid):
+            self.tree.item(iid, values=task_row(task))
+    
+    def change_total(self, total, task_id):
+        """
+        Account for a task that entered or left the source.
+        
+        Rows are ordered by task ID, so a change after a full window only
+        moves the scrollbar; otherwise the window is rendered again.
+        
+        Args:
+            total: New number of tasks in the source
+            task_id: ID of the task that was added, removed or moved
+        """
+        self.total = total
+        self._cache = []
+        rows = self.tree.get_children()
+        if len(rows) == self.page_size and task_id > int(rows[-1]) and self.offset + len(rows) <= total:
+            self.update_scrollbar(len(rows))
+            return
+        self.offset = min(self.offset, max(total - self.page_size, 0))
+        self.render()
+    
+    def visible_tasks(self):
+        """
+        Return the tasks in the window, fetching from the source only when
+        the window leaves the prefetched buffer.
+        """
+        end = min(self.offset + self.page_size, self.total)
+        cache_end = self._cache_start + len(self._cache)
+        if not (self._cache_start <= self.offset and end <= cache_end):
+            self._cache_start = max(0, self.offset - self.buffer)
+            self._cache = self._fetch(self._cache_start, end + self.buffer - self._cache_start)
+        return self._cache[self.offset - self._cache_start:end - self._cache_start]
+    
+    def render(self):
+        """
+        Swap the Treeview rows so they match the tasks in the window.
+        """
+        tasks = self.visible_tasks()
+        wanted = [str(task['id']) for task in tasks]
+        
+        # Drop rows that left the window, then update or insert the rest
+        stale = set(self.tree.get_children()) - set(wanted)
+        if stale:
+            self.tree.delete(*stale)
+        for index, (iid, task) in enumerate(zip(wanted, tasks)):
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=task_row(task))
+                self.tree.move(iid, '', index)
+            else:
+                self.tree.insert('', index, iid=iid, values=task_row(task))
+        
+        self.update_scrollbar(len(tasks))
+    
+    def update_scrollbar(self, visible):
+        """
+        Size the scrollbar thumb to the visible share of the whole list.
+        """
+        if self.total:
+            self.scrollbar.set(self.offset / self.total, (self.offset + visible) / self.total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+def task_row(task):
+    """
+    Return the Treeview column values for a task.
+    """
+    status_text = "Completed" if task['completed'] else "Pending"
+    return (task['id'], task['title'], task['description'], status_text)
 
 
 class TaskDialog:
@@ -355,14 +719,41 @@ class TaskDialog:
         self.dialog.destroy()
 
 
-def run_gui():
+def run_gui(journal_dir=None):
     """
     Run the GUI application.
+    
+    Args:
+        journal_dir (str | None): Directory for durable task storage
     """
+    load_tk()
     root = tk.Tk()
-    app = TodoGUI(root)
-    root.mainloop()
+    app = TodoGUI(root, journal_dir)
+    try:
+        root.mainloop()
+    finally:
+        # The only place the manager is closed, so changes are saved whether
+        # the window was closed or the loop ended some other way
+        app.manager.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    GUI entry point: parse the options and run the window until it is closed.
+    
+    Args:
+        argv (list[str] | None): Arguments without the program name;
+            defaults to sys.argv[1:]
+        
+    Returns:
+        int: Exit status, 0 on success
+    """
+    parser = argparse.ArgumentParser(prog="todo gui", description="Manage todo tasks in a window.")
+    parser.add_argument('--journal', metavar='DIR',
+                        help="directory for durable task storage (default: in memory)")
+    run_gui(parser.parse_args(argv).journal)
+    return 0
 
 
 if __name__ == "__main__":
-    run_gui()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,5 +1,9 @@
-# [Task]: T-002
-# [From]: constitution.md §Project Structure
-"""
-Initialization file for the Todo Console App src package.
+# [Task]: T-002
+# [From]: constitution.md §Project Structure
+"""
+Initialization file for the Todo Console App src package.
+
+Modules import their siblings relatively (``from .task import Task``) and
+fall back to top-level imports when src/ itself is on sys.path, as in the
+tests and benchmarks, so they work both ways.
 """
\ No newline at end of file
@@ -0,0 +1,235 @@
+# [Task]: Asyncio Task Manager
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .concurrent_manager import ConcurrentTodoManager
+    from .task import Task
+except ImportError:
+    from concurrent_manager import ConcurrentTodoManager
+    from task import Task
+
+# Most writes applied and committed together in one trip to the writer thread
+DEFAULT_MAX_BATCH = 256
+
+
+class AsyncTodoManager:
+    """
+    Asyncio facade over a task manager, for embedding the task store in
+    an asyncio service.
+
+    Responsibilities:
+    - Offer awaitable versions of the TodoManager operations
+    - Serve reads straight from memory on the event loop, so any number
+      of coroutines can read at once
+    - Queue writes and hand them to a single writer thread in batches,
+      so every batch is applied in order and committed with one fsync
+      while the event loop keeps running
+    - Apply writes directly on the loop when there is no persistence
+      backend, since nothing would block
+
+    A write returns once it is committed to the backend. Reads may see a
+    write that is applied but not yet committed.
+    """
+
+    def __init__(self, storage=None, max_batch: int = DEFAULT_MAX_BATCH):
+        """
+        Initialize the facade and the manager it wraps.
+
+        Args:
+            storage: Optional persistence backend (e.g. JournalStorage)
+            max_batch (int): Most writes committed together
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        # The writer thread changes tasks while the loop reads them
+        self.manager = ConcurrentTodoManager(storage)
+        self.max_batch = max_batch
+        self.commits = 0
+        self._storage = storage
+        self._pending: List[Tuple[Callable, tuple, asyncio.Future]] = []
+        self._writer: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1) if storage is not None else None
+
+    async def __aenter__(self) -> "AsyncTodoManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def add_task(self, title: str, description: str = "") -> Task:
+        """
+        Add a new task; see TodoManager.add_task.
+
+        Raises:
+            ValueError: If title is empty or exceeds character limits
+        """
+        return await self._write(self.manager.add_task, title, description)
+
+    async def add_tasks(self, items) -> List[Task]:
+        """
+        Add many tasks at once; see TodoManager.add_tasks.
+
+        Raises:
+            ValueError: If any title or description is invalid
+        """
+        return await self._write(self.manager.add_tasks, list(items))
+
+    async def get_task(self, task_id: int) -> Optional[Task]:
+        """
+        Find and return a single task by ID; see TodoManager.get_task.
+        """
+        return self.manager.get_task(task_id)
+
+    async def get_all_tasks(self) -> List[Task]:
+        """
+        Return a copy of all tasks; see TodoManager.get_all_tasks.
+        """
+        return self.manager.get_all_tasks()
+
+    async def get_task_page(self, offset: int, limit: int, completed: Optional[bool] = None) -> List[Task]:
+        """
+        Return a slice of the task list; see TodoManager.get_task_page.
+        """
+        return self.manager.get_task_page(offset, limit, completed)
+
+    async def update_task(self, task_id: int, title: Optional[str] = None,
+                          description: Optional[str] = None) -> bool:
+        """
+        Update task title and/or description; see TodoManager.update_task.
+
+        Raises:
+            ValueError: If the new title or description is invalid
+        """
+        return await self._write(self.manager.update_task, task_id, title, description)
+
+    async def delete_task(self, task_id: int) -> bool:
+        """
+        Remove a task; see TodoManager.delete_task.
+        """
+        return await self._write(self.manager.delete_task, task_id)
+
+    async def toggle_complete(self, task_id: int) -> bool:
+        """
+        Toggle task completion status; see TodoManager.toggle_complete.
+        """
+        return await self._write(self.manager.toggle_complete, task_id)
+
+    async def update_tasks(self, updates) -> bool:
+        """
+        Update many tasks at once; see TodoManager.update_tasks.
+
+        Raises:
+            ValueError: If any title or description is invalid
+        """
+        return await self._write(self.manager.update_tasks, list(updates))
+
+    async def delete_tasks(self, task_ids) -> bool:
+        """
+        Delete many tasks at once; see TodoManager.delete_tasks.
+        """
+        return await self._write(self.manager.delete_tasks, list(task_ids))
+
+    async def toggle_many(self, task_ids) -> bool:
+        """
+        Toggle many tasks at once; see TodoManager.toggle_many.
+        """
+        return await self._write(self.manager.toggle_many, list(task_ids))
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """
+        Return how many tasks are completed and how many are pending.
+        """
+        return self.manager.count_by_status()
+
+    async def close(self) -> None:
+        """
+        Wait for queued writes, then commit and release the backend.
+        """
+        if self._writer is not None:
+            await self._writer
+        if self._executor is None:
+            self.manager.close()
+            return
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.manager.close)
+        self._executor.shutdown()
+
+    async def _write(self, operation: Callable, *args) -> Any:
+        """
+        Run a write, queueing it for the writer thread if there is a backend.
+        """
+        if self._executor is None:
+            return operation(*args)
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((operation, args, future))
+        if self._writer is None:
+            self._writer = asyncio.ensure_future(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        """
+        Hand queued writes to the writer thread until the queue is empty.
+
+        Writes queued while a batch is being committed form the next batch.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                outcomes: List[Tuple[bool, Any]] = []
+                try:
+                    outcomes = await loop.run_in_executor(self._executor, self._commit, batch)
+                except Exception as e:
+                    # The commit failed, so none of the batch's writes are durable
+                    outcomes = [(True, e)] * len(batch)
+                finally:
+                    self._resolve(batch, outcomes)
+        finally:
+            self._writer = None
+            # Only reached with writes left if the drain itself was cancelled
+            self._resolve(self._pending, [])
+            self._pending = []
+
+    @staticmethod
+    def _resolve(batch: List[Tuple[Callable, tuple, asyncio.Future]],
+                 outcomes: List[Tuple[bool, Any]]) -> None:
+        """
+        Settle the futures of a batch, failing those without an outcome so
+        no caller waits forever.
+        """
+        for index, (_, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index >= len(outcomes):
+                future.set_exception(RuntimeError("write was not committed"))
+                continue
+            failed, value = outcomes[index]
+            if failed:
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+    def _commit(self, batch: List[Tuple[Callable, tuple, asyncio.Future]]) -> List[Tuple[bool, Any]]:
+        """
+        Apply a batch of writes on the writer thread and commit them together.
+
+        Returns:
+            list[tuple[bool, Any]]: (failed, result or exception) per write
+        """
+        outcomes = []
+        with self.manager.batch_changes():
+            for operation, args, _ in batch:
+                try:
+                    outcomes.append((False, operation(*args)))
+                except Exception as e:
+                    # Any failure belongs to its own caller, not the whole batch
+                    outcomes.append((True, e))
+        flush = getattr(self._storage, 'flush', None)
+        if flush is not None:
+            flush()
+        self.commits += 1
+        return outcomes
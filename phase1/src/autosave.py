@@ -0,0 +1,278 @@
+# [Task]: Debounced Autosave
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+import threading
+import time
+from typing import Dict, Iterable, List, MutableMapping, Optional, Tuple
+
+try:
+    from .task import Task
+except ImportError:
+    from task import Task
+
+# Seconds without changes before the dirty tasks are written
+DEFAULT_QUIET_PERIOD = 0.5
+# Dirty tasks that trigger a write without waiting for a quiet period
+DEFAULT_MAX_DIRTY = 1_000
+
+
+def merge_change(pending: List[Dict], record: Dict) -> None:
+    """
+    Fold a change record into the unsaved records of its task.
+
+    Repeated edits collapse: an update or toggle of a task added since the
+    last write is folded into the add, a later update overwrites the
+    fields of an earlier one, two toggles cancel out and a delete drops
+    the edits before it. An add followed by a delete is kept, so replaying
+    the log still moves the next task ID past the deleted task.
+
+    Args:
+        pending (list[dict]): The task's unsaved records, changed in place
+        record (dict): A single-task change record, e.g. {'op': 'toggle', 'id': 3}
+    """
+    op = record['op']
+    # Start of the updates and toggles made since the task's last add or delete
+    edits = len(pending)
+    while edits and pending[edits - 1]['op'] in ('update', 'toggle'):
+        edits -= 1
+
+    if op == 'update':
+        fields = {key: record[key] for key in ('title', 'description') if key in record}
+        if pending and pending[-1]['op'] == 'add':
+            pending[-1].update(fields)
+            return
+        for existing in pending[edits:]:
+            if existing['op'] == 'update':
+                existing.update(fields)
+                return
+        pending.append(dict(record))
+    elif op == 'toggle':
+        if pending and pending[-1]['op'] == 'add':
+            pending[-1]['completed'] = not pending[-1]['completed']
+            return
+        for position in range(edits, len(pending)):
+            if pending[position]['op'] == 'toggle':
+                del pending[position]
+                return
+        pending.append(dict(record))
+    elif op == 'delete':
+        del pending[edits:]
+        pending.append(record)
+    else:
+        pending.append(dict(record))
+
+
+class AutosaveStorage:
+    """
+    Persistence wrapper that saves changes from a background thread.
+
+    Responsibilities:
+    - Track unsaved changes per task, folding repeated edits of a task
+      into as few records as possible
+    - Write the dirty tasks as one atomic batch once changes stop for a
+      quiet period, or straight away when enough tasks are dirty
+    - Keep disk writes and fsyncs off the thread that makes the changes,
+      such as the Tk event loop
+    - Write everything still unsaved on flush() and close()
+
+    Wraps another backend (e.g. JournalStorage) and has the same
+    interface, so TodoManager uses it unchanged. A write that fails in the
+    background, with any exception, stays in the wrapped backend's buffer
+    and is retried after another quiet period; the error is kept in
+    last_error until a write succeeds, and the next flush() or close()
+    raises it after writing what it can.
+    """
+
+    def __init__(self, storage, quiet_period: float = DEFAULT_QUIET_PERIOD,
+                 max_dirty: int = DEFAULT_MAX_DIRTY):
+        """
+        Initialize the wrapper; the writer thread starts when load() is called.
+
+        Args:
+            storage: The backend the changes are written to
+            quiet_period (float): Seconds without changes before a write
+            max_dirty (int): Dirty tasks that trigger a write immediately
+
+        Raises:
+            ValueError: If quiet_period is negative or max_dirty is below 1
+        """
+        if quiet_period < 0:
+            raise ValueError("quiet_period cannot be negative")
+        if max_dirty < 1:
+            raise ValueError("max_dirty must be at least 1")
+        self.storage = storage
+        self.quiet_period = quiet_period
+        self.max_dirty = max_dirty
+        # Number of batches written, and the error of the last failed background write
+        self.writes = 0
+        self.last_error: Optional[Exception] = None
+        # Unsaved records per dirty task, ordered by when each task was last
+        # added so replay keeps the manager's insertion order
+        self._dirty: Dict[int, List[Dict]] = {}
+        self._last_change = 0.0
+        self._closed = False
+        # Guards the dirty records and wakes the writer; the write lock keeps
+        # background writes, flushes and compactions from overlapping
+        self._changed = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+
+    @property
+    def dirty_count(self) -> int:
+        """Number of tasks with unsaved changes."""
+        with self._changed:
+            return len(self._dirty)
+
+    def load(self) -> Tuple[MutableMapping[int, Task], int]:
+        """
+        Load the saved state from the wrapped backend and start the writer thread.
+
+        Returns:
+            tuple: (tasks keyed by ID in insertion order, next task ID)
+        """
+        state = self.storage.load()
+        self._writer = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._writer.start()
+        return state
+
+    def append(self, record: Dict) -> None:
+        """
+        Mark the tasks of a change record dirty; nothing is written here.
+
+        Args:
+            record (dict): The change record, e.g. {'op': 'delete', 'id': 3}
+        """
+        changes = record['records'] if record['op'] == 'batch' else (record,)
+        with self._changed:
+            was_clean = not self._dirty
+            self._mark_dirty(changes)
+            self._last_change = time.monotonic()
+            # The writer only needs waking to start a quiet period or to
+            # write a full batch; otherwise it notices the new time itself
+            if was_clean or len(self._dirty) >= self.max_dirty:
+                self._changed.notify()
+
+    def flush(self) -> None:
+        """
+        Write every unsaved change now, in the calling thread.
+
+        Raises:
+            Exception: The error of this write, or else the error of a
+                background write that failed with no write succeeding since
+        """
+        self._write()
+        with self._changed:
+            error, self.last_error = self.last_error, None
+        if error is not None:
+            raise error
+
+    def _write(self) -> None:
+        """
+        Write every unsaved change as one batch and flush the wrapped backend.
+        """
+        with self._write_lock:
+            with self._changed:
+                dirty, self._dirty = self._dirty, {}
+            if dirty:
+                try:
+                    self.storage.append({'op': 'batch',
+                                         'records': [record for pending in dirty.values() for record in pending]})
+                except Exception:
+                    # Not handed to the backend: keep the records, with any
+                    # made since folded in after them, for the next write
+                    with self._changed:
+                        newer, self._dirty = self._dirty, dirty
+                        self._mark_dirty(record for pending in newer.values() for record in pending)
+                    raise
+                self.writes += 1
+            self.storage.flush()
+
+    def _mark_dirty(self, changes: Iterable[Dict]) -> None:
+        """
+        Fold single-task change records into the dirty records; the caller
+        holds the condition's lock.
+        """
+        for change in changes:
+            task_id = change['id']
+            if change['op'] == 'add':
+                # Move the task to the end, after the tasks added before it
+                pending = self._dirty.pop(task_id, [])
+                self._dirty[task_id] = pending
+            else:
+                pending = self._dirty.setdefault(task_id, [])
+            merge_change(pending, change)
+
+    def needs_compaction(self) -> bool:
+        """
+        Check whether the wrapped backend wants a new snapshot.
+
+        Returns:
+            bool: True if compact() should be called
+        """
+        return self.storage.needs_compaction()
+
+    def compact(self, tasks: Iterable[Task], next_id: int) -> None:
+        """
+        Write a snapshot of the given state through the wrapped backend.
+
+        The snapshot already holds every unsaved change, so they are
+        dropped rather than written to the log on top of it.
+
+        Args:
+            tasks (Iterable[Task]): All current tasks in insertion order
+            next_id (int): The next task ID to hand out
+        """
+        with self._write_lock:
+            with self._changed:
+                self._dirty.clear()
+            self.storage.compact(tasks, next_id)
+
+    def close(self) -> None:
+        """
+        Stop the writer thread, write every unsaved change and close the
+        wrapped backend, even if the final write fails. Calling close()
+        again does nothing.
+
+        Raises:
+            Exception: As for flush()
+        """
+        with self._changed:
+            if self._closed:
+                return
+            self._closed = True
+            self._changed.notify()
+        if self._writer is not None:
+            self._writer.join()
+        try:
+            self.flush()
+        finally:
+            self.storage.close()
+
+    def _run(self) -> None:
+        """
+        Writer thread loop: wait for a quiet period or a full batch, then write.
+        """
+        while True:
+            with self._changed:
+                while not self._closed:
+                    if not self._dirty:
+                        self._changed.wait()
+                        continue
+                    if len(self._dirty) >= self.max_dirty and self.last_error is None:
+                        break
+                    remaining = self._last_change + self.quiet_period - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._changed.wait(remaining)
+                if self._closed:
+                    # close() writes what is left in its own thread
+                    return
+            try:
+                self._write()
+                with self._changed:
+                    self.last_error = None
+            except Exception as error:  # kept for flush() and close() to raise
+                with self._changed:
+                    self.last_error = error
+                    # Retry after another quiet period rather than spinning
+                    self._last_change = time.monotonic()
@@ -0,0 +1,314 @@
+# [Task]: Command-Line Mode
+# [From]: plan.md §Main Application, specify.md §Menu System
+
+import argparse
+import re
+import shlex
+import sys
+import time
+from typing import Iterable, List, Optional, TextIO
+
+try:
+    from .instrumentation import OperationStats
+    from .journal import JournalStorage
+    from .task_io import FORMATS, export_file, import_file, write_tasks
+    from .todo_manager import TodoManager
+except ImportError:
+    from instrumentation import OperationStats
+    from journal import JournalStorage
+    from task_io import FORMATS, export_file, import_file, write_tasks
+    from todo_manager import TodoManager
+
+# Subcommands understood on the command line and in batch files
+COMMANDS = ('add', 'list', 'update', 'delete', 'toggle', 'search', 'import', 'export', 'batch')
+
+# A shell word made of bare characters and quoted strings without escapes,
+# e.g. "Buy milk" or done; anything fancier is left to shlex
+SIMPLE_WORD = re.compile(r"(?:[^\s\"'\\]|\"[^\"\\]*\"|'[^']*')+")
+QUOTED = re.compile(r"\"([^\"\\]*)\"|'([^']*)'")
+
+# Options of the update command and the fields they set
+UPDATE_OPTIONS = {'-t': 'title', '--title': 'title', '-d': 'description', '--description': 'description'}
+
+
+class CommandError(ValueError):
+    """A batch line that could not be parsed, raised instead of exiting."""
+
+
+class HelpRequested(Exception):
+    """A batch line asked for help; carries the help text to print."""
+
+
+class BatchCommandParser(argparse.ArgumentParser):
+    """
+    Argument parser for batch lines: errors raise CommandError and -h
+    raises HelpRequested instead of printing and exiting the whole program.
+    """
+
+    def error(self, message):
+        raise CommandError(message)
+
+    def print_help(self, file=None):
+        raise HelpRequested(self.format_help())
+
+    def exit(self, status=0, message=None):
+        raise CommandError(message.strip() if message else f"command exited with status {status}")
+
+
+def build_parser(parser_class=argparse.ArgumentParser, batch: bool = False) -> argparse.ArgumentParser:
+    """
+    Build the parser for the todo subcommands.
+
+    Args:
+        parser_class: ArgumentParser class to use for the parser and subparsers
+        batch (bool): Build the parser for batch lines, which has no
+            --journal or --stats option and no nested batch command
+
+    Returns:
+        argparse.ArgumentParser: The configured parser
+    """
+    parser = parser_class(prog="todo", description="Manage todo tasks from the command line.")
+    if not batch:
+        parser.add_argument('--journal', metavar='DIR',
+                            help="directory for durable task storage (default: in memory)")
+        parser.add_argument('--stats', metavar='FILE',
+                            help="time every operation and dump the statistics to FILE as JSON")
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    add = commands.add_parser('add', help="add a task and print its ID")
+    add.add_argument('title')
+    add.add_argument('-d', '--description', default="")
+
+    list_ = commands.add_parser('list', help="list tasks")
+    status = list_.add_mutually_exclusive_group()
+    status.add_argument('--pending', dest='completed', action='store_false', default=None)
+    status.add_argument('--completed', dest='completed', action='store_true')
+
+    update = commands.add_parser('update', help="change a task's title and/or description")
+    update.add_argument('id', type=int)
+    update.add_argument('-t', '--title')
+    update.add_argument('-d', '--description')
+
+    for name, help_text in (('delete', "delete a task"), ('toggle', "toggle a task's completion")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('id', type=int)
+
+    search = commands.add_parser('search', help="search task titles and descriptions")
+    search.add_argument('query')
+    search.add_argument('-n', '--limit', type=int, default=20)
+
+    import_ = commands.add_parser('import', help="add the tasks of a JSON Lines or CSV file")
+    import_.add_argument('file')
+    import_.add_argument('-f', '--format', choices=FORMATS, help="file format (default: from the extension)")
+
+    export = commands.add_parser('export', help="write all tasks to a JSON Lines or CSV file")
+    export.add_argument('file', help="output file, or - for stdout")
+    export.add_argument('-f', '--format', choices=FORMATS, help="file format (default: from the extension)")
+
+    if not batch:
+        batch_command = commands.add_parser(
+            'batch', help="run newline-delimited commands from a file or stdin")
+        batch_command.add_argument('file', nargs='?', default='-',
+                                   help="command file, or - for stdin (default)")
+    return parser
+
+
+def split_line(line: str) -> List[str]:
+    """
+    Split a batch line into words like a POSIX shell would.
+
+    Lines made only of bare words and simple quoted strings are split with
+    one regular expression; other lines go through shlex.
+
+    Raises:
+        ValueError: If the line has unbalanced quotes
+    """
+    words = SIMPLE_WORD.findall(line)
+    if SIMPLE_WORD.sub('', line).strip():
+        return shlex.split(line)
+    return [QUOTED.sub(r'\1\2', word) if '"' in word or "'" in word else word for word in words]
+
+
+def parse_simple(words: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the most common command shapes without argparse.
+
+    Handles add with an optional description, update with -t/-d options,
+    delete, toggle and a plain list. Anything else, including values that
+    look like options, returns None and is left to the full parser.
+
+    Returns:
+        argparse.Namespace | None: The parsed command, or None
+    """
+    command, args = words[0], words[1:]
+    if any(arg.startswith('-') and arg not in UPDATE_OPTIONS for arg in args):
+        return None
+    if command == 'add':
+        if len(args) == 1:
+            return argparse.Namespace(command=command, title=args[0], description="")
+        if len(args) == 3 and args[1] in ('-d', '--description') and not args[2].startswith('-'):
+            return argparse.Namespace(command=command, title=args[0], description=args[2])
+    elif command in ('delete', 'toggle'):
+        if len(args) == 1 and args[0].isdecimal():
+            return argparse.Namespace(command=command, id=int(args[0]))
+    elif command == 'update':
+        if len(args) in (1, 3, 5) and args[0].isdecimal():
+            fields = {'title': None, 'description': None}
+            for option, value in zip(args[1::2], args[2::2]):
+                if option not in UPDATE_OPTIONS or value in UPDATE_OPTIONS:
+                    return None
+                fields[UPDATE_OPTIONS[option]] = value
+            return argparse.Namespace(command=command, id=int(args[0]), **fields)
+    elif command == 'list' and not args:
+        return argparse.Namespace(command=command, completed=None)
+    return None
+
+
+def format_task(task) -> str:
+    """
+    Format a task as one tab-separated line: ID, status, title, description.
+    """
+    status = "done" if task['completed'] else "pending"
+    return f"{task['id']}\t{status}\t{task['title']}\t{task['description']}\n"
+
+
+def run_command(manager: TodoManager, args: argparse.Namespace, out: TextIO) -> bool:
+    """
+    Run one parsed subcommand against the manager.
+
+    Args:
+        manager (TodoManager): The manager to act on
+        args (argparse.Namespace): The parsed command
+        out (TextIO): Stream for the command's output
+
+    Returns:
+        bool: True on success, False if the task was not found
+
+    Raises:
+        ValueError: If a title, description or import file is invalid
+        OSError: If an import or export file cannot be opened
+    """
+    command = args.command
+    if command == 'add':
+        out.write(f"{manager.add_task(args.title, args.description)['id']}\n")
+        return True
+    if command == 'list':
+        out.writelines(map(format_task, manager.iter_tasks(completed=args.completed)))
+        return True
+    if command == 'search':
+        out.writelines(map(format_task, manager.search(args.query, limit=args.limit)))
+        return True
+    if command == 'import':
+        out.write(f"{import_file(manager, args.file, args.format)}\n")
+        return True
+    if command == 'export':
+        if args.file == '-':
+            write_tasks(manager.iter_tasks(), out, args.format or 'jsonl')
+        else:
+            out.write(f"{export_file(manager, args.file, args.format)}\n")
+        return True
+    if command == 'update':
+        return manager.update_task(args.id, args.title, args.description)
+    if command == 'delete':
+        return manager.delete_task(args.id)
+    if command == 'toggle':
+        return manager.toggle_complete(args.id)
+    raise CommandError(f"unknown command: {command}")
+
+
+def run_batch(manager: TodoManager, lines: Iterable[str], out: TextIO, err: TextIO) -> int:
+    """
+    Run newline-delimited commands against one manager, without prompts.
+
+    Each line holds one command as it would be typed after ``todo``, e.g.
+    ``add "Buy milk" -d "2 litres"``. Blank lines and lines starting with
+    # are skipped. A failing line is reported on err and the batch goes on,
+    and -h prints the command's help on out without stopping it.
+
+    Args:
+        manager (TodoManager): The manager to run the commands against
+        lines (Iterable[str]): The command lines
+        out (TextIO): Stream for command output
+        err (TextIO): Stream for errors and the throughput summary
+
+    Returns:
+        int: Number of failed commands
+    """
+    parser = build_parser(BatchCommandParser, batch=True)
+    commands = failures = 0
+    start = time.perf_counter()
+
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        commands += 1
+        try:
+            words = split_line(line)
+            args = parse_simple(words) or parser.parse_args(words)
+            if args.command is None:
+                raise CommandError("missing command")
+            if not run_command(manager, args, out):
+                raise CommandError(f"task {args.id} not found")
+        except HelpRequested as e:
+            out.write(str(e))
+        except (ValueError, OSError) as e:
+            failures += 1
+            err.write(f"line {line_number}: {e}\n")
+
+    elapsed = time.perf_counter() - start
+    rate = commands / elapsed if elapsed else 0.0
+    err.write(f"Ran {commands} commands ({failures} failed) in {elapsed:.3f} s, "
+              f"{rate:,.0f} commands/s\n")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point: run one subcommand, a batch, or the menu.
+
+    Without a subcommand the interactive menu starts. For compatibility a
+    lone directory argument is still taken as the journal directory.
+
+    Args:
+        argv (list[str] | None): Arguments without the program name;
+            defaults to sys.argv[1:]
+
+    Returns:
+        int: Exit status, 0 on success
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 1 and not argv[0].startswith('-') and argv[0] not in COMMANDS:
+        argv = ['--journal', argv[0]]
+    args = build_parser().parse_args(argv)
+
+    if args.command is None:
+        # The menu's modules are only loaded when the menu is used
+        try:
+            from .main import main as interactive_main
+        except ImportError:
+            from main import main as interactive_main
+        interactive_main(args.journal, args.stats)
+        return 0
+
+    stats = None
+    if args.stats:
+        stats = OperationStats()
+        stats.dump_every(args.stats)
+    manager = TodoManager(JournalStorage(args.journal) if args.journal else None, stats=stats)
+
+    try:
+        if args.command == 'batch':
+            if args.file == '-':
+                return 1 if run_batch(manager, sys.stdin, sys.stdout, sys.stderr) else 0
+            with open(args.file, encoding="utf-8") as lines:
+                return 1 if run_batch(manager, lines, sys.stdout, sys.stderr) else 0
+        try:
+            if run_command(manager, args, sys.stdout):
+                return 0
+            print(f"Task {args.id} not found.", file=sys.stderr)
+        except (ValueError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        manager.close()
@@ -0,0 +1,395 @@
+# [Task]: Thread-Safe Task Manager
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+try:
+    from .instrumentation import OperationStats
+    from .status_index import StatusIndex
+    from .task import Task, validate_description, validate_title
+    from .todo_manager import TodoManager
+except ImportError:
+    from instrumentation import OperationStats
+    from status_index import StatusIndex
+    from task import Task, validate_description, validate_title
+    from todo_manager import TodoManager
+
+T = TypeVar('T')
+
+# Number of lock stripes tasks are spread over by ID
+DEFAULT_STRIPES = 64
+
+# Lock-free attempts a read gets before it takes the stripe locks
+READ_RETRIES = 100
+
+
+class LockedStatusIndex(StatusIndex):
+    """
+    StatusIndex whose operations are each made atomic by a private lock.
+    """
+
+    def __init__(self):
+        """Initialize an empty index with its lock."""
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def defer(self, counts, load) -> None:
+        """Postpone building the ID sets; see StatusIndex.defer."""
+        with self._lock:
+            super().defer(counts, load)
+
+    def add(self, task_id: int, completed: bool) -> None:
+        """Record a task under the given status."""
+        with self._lock:
+            super().add(task_id, completed)
+
+    def discard(self, task_id: int, completed: bool) -> None:
+        """Forget a task recorded under the given status."""
+        with self._lock:
+            super().discard(task_id, completed)
+
+    def move(self, task_id: int, completed: bool) -> None:
+        """Move a recorded task to the given status."""
+        with self._lock:
+            super().move(task_id, completed)
+
+    def count(self, completed: bool) -> int:
+        """Return the number of tasks with the given status."""
+        with self._lock:
+            return super().count(completed)
+
+    def ordered_ids(self, completed: Optional[bool]) -> Iterator[int]:
+        """
+        Iterate over a copy of the IDs with the given status in ascending
+        order, so other threads may change the index meanwhile.
+        """
+        with self._lock:
+            return iter(list(super().ordered_ids(completed)))
+
+    def page(self, completed: Optional[bool], offset: int, limit: int) -> List[int]:
+        """Return one page of the IDs with the given status; see StatusIndex.page."""
+        with self._lock:
+            return super().page(completed, offset, limit)
+
+
+class ConcurrentTodoManager(TodoManager):
+    """
+    TodoManager that can be shared between threads, e.g. the Tk thread
+    and background importers.
+
+    Responsibilities:
+    - Hand out task IDs atomically, so no two tasks share an ID
+    - Serialize changes to the same task with striped per-task locks,
+      while changes to tasks on different stripes run independently
+    - Keep the status index, search and sort indexes, and journal
+      consistent with small locks of their own; an index's lock is only
+      taken once that index has been built
+    - Serve reads without locks: lookups are single dict operations, and
+      list views copy the store, retrying if a writer resized it mid-copy
+      and taking the stripe locks if that keeps happening
+
+    Change listeners are called on the thread that made the change, while
+    the changed tasks' locks are held, so they must not change other tasks.
+    """
+
+    _status_index_type = LockedStatusIndex
+
+    def __init__(self, storage=None, stripes: int = DEFAULT_STRIPES, stats: Optional[OperationStats] = None):
+        """
+        Initialize the manager and its locks.
+
+        Args:
+            storage: Optional persistence backend (e.g. JournalStorage)
+            stripes (int): Number of locks tasks are spread over by ID
+            stats (OperationStats | None): Optional call statistics; see TodoManager
+        """
+        self._stripes = [threading.RLock() for _ in range(stripes)]
+        # Reentrant: add_tasks holds it while TodoManager allocates the block
+        self._id_lock = threading.RLock()
+        # One lock per kind of index, only taken once that index is built
+        self._search_lock = threading.RLock()
+        self._sort_lock = threading.RLock()
+        self._journal_lock = threading.Lock()
+        super().__init__(storage, stats=stats)
+
+    def add_task(self, title: str, description: str = "") -> Task:
+        """
+        Add a new task; see TodoManager.add_task.
+
+        The ID is allocated and the task stored under the ID lock, so the
+        store stays in ID order however many threads add at once. Its
+        stripe is taken before the ID lock is released and held while the
+        task is indexed and recorded, so no change to the new task can be
+        logged before its creation.
+        """
+        title = validate_title(title)
+        validate_description(description)
+
+        with self._id_lock:
+            task = Task(self._allocate_ids(1), title, description)
+            stripe = self._stripe(task.id)
+            stripe.acquire()
+            self._tasks[task.id] = task
+        try:
+            self._status_index.add(task.id, False)
+            self._index(task)
+            self._record(self._add_record(task))
+        finally:
+            stripe.release()
+        self._compact_if_due()
+        return task
+
+    def add_tasks(self, items: Iterable[Tuple[str, str]]) -> List[Task]:
+        """
+        Add many tasks at once; see TodoManager.add_tasks.
+
+        The ID lock is taken before the stripes, in the same order as
+        add_task, so the two cannot deadlock and the block is stored
+        before any task added after it.
+        """
+        items = list(items)
+        with self._id_lock, self._locked_all():
+            tasks = super().add_tasks(items)
+        self._compact_if_due()
+        return tasks
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Return a copy of all tasks, without blocking writers.
+        """
+        return self._read(lambda: list(self._tasks.values()))
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """
+        Iterate over a copy of the tasks, so writers may change the store meanwhile.
+
+        Args:
+            completed (bool | None): Only yield completed (True) or pending
+                (False) tasks; None yields every task
+
+        Returns:
+            Iterator[Task]: An iterator over the tasks at the time of the call
+        """
+        if completed is None:
+            return iter(self.get_all_tasks())
+        # Tasks deleted since the status index was read are skipped
+        return filter(None, map(self._tasks.get, self._status_index.ordered_ids(completed)))
+
+    def get_task_page(self, offset: int, limit: int, completed: Optional[bool] = None) -> List[Task]:
+        """
+        Return a slice of the task list; see TodoManager.get_task_page.
+        """
+        return self._read(lambda: super(ConcurrentTodoManager, self).get_task_page(offset, limit, completed))
+
+    def get_sorted_page(self, sort_by: str, offset: int, limit: int, descending: bool = False,
+                        completed: Optional[bool] = None) -> List[Task]:
+        """
+        Return a slice of the tasks sorted by a field; see TodoManager.get_sorted_page.
+        """
+        self._build_sorted_index(sort_by, completed)
+
+        def read():
+            with self._sort_lock:
+                return super(ConcurrentTodoManager, self).get_sorted_page(
+                    sort_by, offset, limit, descending, completed)
+        return self._read(read)
+
+    def task_rank(self, task_id: int, sort_by: str) -> Optional[int]:
+        """
+        Return a task's position in the sorted task list; see TodoManager.task_rank.
+        """
+        self._build_sorted_index(sort_by, None)
+        with self._sort_lock:
+            return super().task_rank(task_id, sort_by)
+
+    def update_task(self, task_id: int, title: Optional[str] = None,
+                    description: Optional[str] = None) -> bool:
+        """
+        Update task title and/or description; see TodoManager.update_task.
+        """
+        with self._stripe(task_id):
+            updated = super().update_task(task_id, title, description)
+        self._compact_if_due()
+        return updated
+
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Remove a task; see TodoManager.delete_task.
+        """
+        with self._stripe(task_id):
+            deleted = super().delete_task(task_id)
+        self._compact_if_due()
+        return deleted
+
+    def toggle_complete(self, task_id: int) -> bool:
+        """
+        Toggle task completion status; see TodoManager.toggle_complete.
+        """
+        with self._stripe(task_id):
+            toggled = super().toggle_complete(task_id)
+        self._compact_if_due()
+        return toggled
+
+    def update_tasks(self, updates: Iterable[Tuple[int, Optional[str], Optional[str]]]) -> bool:
+        """
+        Update many tasks at once; see TodoManager.update_tasks.
+        """
+        updates = list(updates)
+        with self._locked([task_id for task_id, _, _ in updates]):
+            updated = super().update_tasks(updates)
+        self._compact_if_due()
+        return updated
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> bool:
+        """
+        Delete many tasks at once; see TodoManager.delete_tasks.
+        """
+        task_ids = list(task_ids)
+        with self._locked(task_ids):
+            deleted = super().delete_tasks(task_ids)
+        self._compact_if_due()
+        return deleted
+
+    def toggle_many(self, task_ids: Iterable[int]) -> bool:
+        """
+        Toggle many tasks at once; see TodoManager.toggle_many.
+        """
+        task_ids = list(task_ids)
+        with self._locked(task_ids):
+            toggled = super().toggle_many(task_ids)
+        self._compact_if_due()
+        return toggled
+
+    def search(self, query: str, limit: int = 20) -> List[Task]:
+        """
+        Search task titles and descriptions; see TodoManager.search.
+        """
+        if self._search_index is None:
+            # Building reads every task, so no task may change meanwhile
+            with self._locked_all(), self._search_lock:
+                if self._search_index is None:
+                    self._build_search_index()
+        with self._search_lock:
+            task_ids = self._search_index.search(query, limit)
+        # Tasks deleted since the search are skipped
+        return list(filter(None, map(self._tasks.get, task_ids)))
+
+    def close(self) -> None:
+        """
+        Commit pending changes and release the persistence backend, if any.
+        """
+        with self._journal_lock:
+            super().close()
+
+    def _allocate_ids(self, count: int) -> int:
+        """
+        Reserve a block of consecutive task IDs atomically.
+        """
+        with self._id_lock:
+            return super()._allocate_ids(count)
+
+    def _index(self, task: Task) -> None:
+        """
+        Add a task to the search and sort indexes that have been built.
+
+        Callers hold the task's stripe and indexes are only built with
+        every stripe held, so an index that is missing here stays missing
+        until the change is done and no lock is needed to skip it.
+        """
+        if self._search_index is not None:
+            with self._search_lock:
+                self._search_index.add(task)
+        if self._sorted_indexes:
+            self._sort(task)
+
+    def _unindex(self, task: Task) -> None:
+        """Remove a task from the search and sort indexes that have been built."""
+        if self._search_index is not None:
+            with self._search_lock:
+                self._search_index.remove(task)
+        if self._sorted_indexes:
+            self._unsort(task)
+
+    def _sort(self, task: Task, status_only: bool = False) -> None:
+        """Add a task to the sort indexes that have been built."""
+        with self._sort_lock:
+            super()._sort(task, status_only)
+
+    def _unsort(self, task: Task, status_only: bool = False) -> None:
+        """Remove a task from the sort indexes that have been built."""
+        with self._sort_lock:
+            super()._unsort(task, status_only)
+
+    def _build_sorted_index(self, sort_by: str, completed: Optional[bool]) -> None:
+        """
+        Build a sort index if it is missing, with every stripe held since
+        building reads every task.
+        """
+        if (sort_by, completed is not None) not in self._sorted_indexes:
+            with self._locked_all(), self._sort_lock:
+                self._sorted_range(sort_by, completed)
+
+    def _persist(self, record: Dict) -> None:
+        """
+        Append a change record to the backend.
+
+        Compaction is left to _compact_if_due(), which runs once the
+        change's stripe locks are released.
+        """
+        with self._journal_lock:
+            self._storage.append(record)
+
+    def _compact_if_due(self) -> None:
+        """
+        Compact the journal when due, with every stripe held so the
+        snapshot matches the records logged so far.
+        """
+        if self._storage is None or not self._storage.needs_compaction():
+            return
+        with self._locked_all(), self._journal_lock:
+            if self._storage.needs_compaction():
+                self._storage.compact(self._tasks.values(), self._next_id)
+
+    def _stripe(self, task_id: int) -> ContextManager:
+        """
+        Return the lock guarding a single task.
+        """
+        return self._stripes[task_id % len(self._stripes)]
+
+    @contextmanager
+    def _locked(self, task_ids: Iterable[int]) -> Iterator[None]:
+        """
+        Hold the stripe locks of the given tasks, acquired in stripe order
+        so threads locking overlapping stripes cannot deadlock.
+        """
+        stripes = sorted({task_id % len(self._stripes) for task_id in task_ids})
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._stripes[stripe])
+            yield
+
+    def _locked_all(self):
+        """
+        Hold every stripe lock, for changes that touch the whole store.
+        """
+        return self._locked(range(len(self._stripes)))
+
+    def _read(self, read: Callable[[], T]) -> T:
+        """
+        Run a lock-free read, retrying if a writer changed the store under it.
+
+        Copying a dict that another thread resizes raises RuntimeError, and
+        a task deleted mid-read raises KeyError; both are rare and short,
+        so trying again is cheaper than making every reader take a lock.
+        After READ_RETRIES failures the read runs with every stripe held,
+        so a steady stream of writers cannot starve it.
+        """
+        for _ in range(READ_RETRIES):
+            try:
+                return read()
+            except (RuntimeError, KeyError):
+                continue
+        with self._locked_all():
+            return read()
@@ -0,0 +1,154 @@
+# [Task]: Change Events
+# [From]: plan.md §TodoManager Class
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Kinds of change events
+ADDED = 'added'
+UPDATED = 'updated'
+DELETED = 'deleted'
+TOGGLED = 'toggled'
+
+
+class ChangeEvent(NamedTuple):
+    """
+    A change to a single task.
+
+    Attributes:
+        kind (str): ADDED, UPDATED, DELETED or TOGGLED
+        task_id (int): The ID of the changed task
+        fields (dict): The changed fields and their new values, e.g.
+            {'title': 'Buy milk'}; every field for ADDED, the new
+            'completed' value for TOGGLED, empty for DELETED
+    """
+    kind: str
+    task_id: int
+    fields: Dict[str, Any]
+
+
+def coalesce(previous: ChangeEvent, event: ChangeEvent) -> Optional[ChangeEvent]:
+    """
+    Merge two successive events of the same task into their net effect.
+
+    Args:
+        previous (ChangeEvent): The earlier event
+        event (ChangeEvent): The later event
+
+    Returns:
+        ChangeEvent | None: The combined event, or None if the changes
+        cancel out (e.g. a task added and deleted again)
+    """
+    if event.kind == DELETED:
+        return None if previous.kind == ADDED else event
+    if previous.kind == DELETED:
+        # The task was put back (e.g. by an undo), so it changed in place
+        return ChangeEvent(UPDATED, event.task_id, event.fields)
+    if previous.kind == TOGGLED and event.kind == TOGGLED:
+        return None
+    kind = ADDED if previous.kind == ADDED else (event.kind if previous.kind == event.kind else UPDATED)
+    return ChangeEvent(kind, event.task_id, {**previous.fields, **event.fields})
+
+
+class EventBus:
+    """
+    Delivers change events to listeners in coalesced batches.
+
+    Responsibilities:
+    - Keep the registered listeners
+    - Collect the events published inside a batch() block
+    - Merge several events of one task into its net change
+    - Call every listener once per batch with the list of events
+    """
+
+    def __init__(self):
+        """Initialize a bus without listeners."""
+        # A tuple, so publishing never copies it and registering is one allocation
+        self._listeners: Tuple[Callable[[List[ChangeEvent]], None], ...] = ()
+        # Events of the open batch keyed by task ID, None outside a batch
+        self._pending: Optional[Dict[int, ChangeEvent]] = None
+
+    @property
+    def active(self) -> bool:
+        """True if any listener is registered, i.e. events are worth building."""
+        return bool(self._listeners)
+
+    def subscribe(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Register a listener, called as listener(events) for every batch.
+
+        Args:
+            listener (callable): The function to notify
+        """
+        self._listeners += (listener,)
+
+    def unsubscribe(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Stop notifying a previously registered listener.
+
+        Args:
+            listener (callable): The function to stop notifying
+
+        Raises:
+            ValueError: If the listener is not registered
+        """
+        listeners = list(self._listeners)
+        listeners.remove(listener)
+        self._listeners = tuple(listeners)
+
+    def publish(self, events: Iterable[ChangeEvent]) -> None:
+        """
+        Deliver events as one batch, or queue them if a batch is open.
+
+        Args:
+            events (Iterable[ChangeEvent]): The events, in the order they happened
+        """
+        if self._pending is not None:
+            self._merge(self._pending, events)
+            return
+        pending: Dict[int, ChangeEvent] = {}
+        self._merge(pending, events)
+        self._deliver(pending)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Hold back events until the block ends, then deliver them together.
+
+        Nested blocks join the outermost one. Events are delivered even if
+        the block raises, since the changes already happened.
+        """
+        if self._pending is not None:
+            yield
+            return
+        self._pending = {}
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            self._deliver(pending)
+
+    @staticmethod
+    def _merge(pending: Dict[int, ChangeEvent], events: Iterable[ChangeEvent]) -> None:
+        """
+        Add events to a batch, coalescing them with earlier events of the same task.
+        """
+        for event in events:
+            previous = pending.get(event.task_id)
+            if previous is None:
+                pending[event.task_id] = event
+                continue
+            merged = coalesce(previous, event)
+            if merged is None:
+                del pending[event.task_id]
+            else:
+                pending[event.task_id] = merged
+
+    def _deliver(self, pending: Dict[int, ChangeEvent]) -> None:
+        """
+        Call every listener with the batch, unless it is empty.
+        """
+        if pending:
+            events = list(pending.values())
+            for listener in self._listeners:
+                listener(events)
@@ -0,0 +1,178 @@
+# [Task]: Undo/Redo History
+# [From]: plan.md §TodoManager Class, specify.md §F4: Delete Task
+
+import sys
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, List, Optional, Sequence, Tuple
+
+# Kinds of inverse delta, each undone with one bulk TodoManager call:
+#   DELETE   ids                                 delete_tasks(ids)
+#   RESTORE  (id, title, description, completed) rows, put back with their IDs
+#   UPDATE   (id, title, description) triples   update_tasks(triples)
+#   TOGGLE   ids                                 toggle_many(ids)
+DELETE = 'delete'
+RESTORE = 'restore'
+UPDATE = 'update'
+TOGGLE = 'toggle'
+
+Delta = Tuple[str, Sequence]
+# The deltas that undo one operation, in the order they were recorded
+Entry = List[Delta]
+
+DEFAULT_MAX_BYTES = 4 * 2 ** 20
+
+# Estimated bytes per entry, per delta and per item in a delta
+ENTRY_OVERHEAD = 120
+DELTA_OVERHEAD = 120
+ITEM_OVERHEAD = 80
+
+
+def delta_size(delta: Delta) -> int:
+    """
+    Estimate the memory held by an inverse delta.
+
+    A range of IDs (the inverse of a bulk add) is a fixed size whatever
+    its length; everything else grows with its items and text.
+    """
+    kind, items = delta
+    if isinstance(items, range):
+        return DELTA_OVERHEAD
+    if kind in (DELETE, TOGGLE):
+        return DELTA_OVERHEAD + 8 * len(items)
+    return DELTA_OVERHEAD + sum(ITEM_OVERHEAD + sum(sys.getsizeof(field) for field in item[1:3] if field is not None)
+                                for item in items)
+
+
+class UndoHistory:
+    """
+    Bounded undo and redo stacks of inverse deltas for TodoManager.
+
+    Responsibilities:
+    - Keep, per operation, the compact delta that reverts it (the IDs of
+      added tasks, the previous text of updated fields, the rows of
+      deleted tasks) instead of copies of the task list
+    - Group the deltas of a bulk operation into one undo step
+    - Send deltas recorded while undoing to the redo stack, and clear the
+      redo stack when a new change is made
+    - Stay under a memory budget by dropping the oldest steps first
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize empty stacks.
+
+        Args:
+            max_bytes (int): Estimated memory the two stacks may hold
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._undo: Deque[Tuple[Entry, int]] = deque()
+        self._redo: Deque[Tuple[Entry, int]] = deque()
+        self._bytes = 0
+        # Deltas collected by an open group(), and whether an undo or redo is running
+        self._group: Optional[Entry] = None
+        self._replaying: Optional[str] = None
+
+    @property
+    def can_undo(self) -> bool:
+        """Whether there is a step to undo."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Whether there is an undone step to redo."""
+        return bool(self._redo)
+
+    @property
+    def size(self) -> int:
+        """Estimated memory held by both stacks, in bytes."""
+        return self._bytes
+
+    def record(self, kind: str, items: Sequence) -> None:
+        """
+        Record the delta that reverts a change just made.
+
+        Args:
+            kind (str): DELETE, RESTORE, UPDATE or TOGGLE
+            items (Sequence): The IDs, rows or triples the delta applies to
+        """
+        if self._group is not None:
+            self._group.append((kind, items))
+        else:
+            self._push([(kind, items)])
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        """
+        Collect the deltas recorded inside the block into one undo step.
+        Nested groups join the outermost one.
+        """
+        if self._group is not None:
+            yield
+            return
+        self._group = []
+        try:
+            yield
+        finally:
+            entry, self._group = self._group, None
+            if entry:
+                self._push(entry)
+
+    def pop_undo(self) -> Optional[Entry]:
+        """Take the most recent step off the undo stack, or None if it is empty."""
+        return self._pop(self._undo)
+
+    def pop_redo(self) -> Optional[Entry]:
+        """Take the most recently undone step off the redo stack, or None if it is empty."""
+        return self._pop(self._redo)
+
+    @contextmanager
+    def replaying(self, direction: str) -> Iterator[None]:
+        """
+        Mark the block as an undo ('undo') or redo ('redo'), so the deltas
+        it records form one step on the opposite stack.
+        """
+        self._replaying = direction
+        try:
+            with self.group():
+                yield
+        finally:
+            self._replaying = None
+
+    def clear(self) -> None:
+        """Forget every step."""
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+
+    def _push(self, entry: Entry) -> None:
+        """
+        Put a step on the stack it belongs to and evict old steps over budget.
+        """
+        size = ENTRY_OVERHEAD + sum(map(delta_size, entry))
+        stack = self._redo if self._replaying == 'undo' else self._undo
+        if self._replaying is None:
+            self._bytes -= sum(entry_size for _, entry_size in self._redo)
+            self._redo.clear()
+        if size > self.max_bytes:
+            # Older steps cannot be undone past a change that was not kept
+            self._bytes -= sum(entry_size for _, entry_size in stack)
+            stack.clear()
+            return
+        stack.append((entry, size))
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            # Oldest first: the bottom of the undo stack, then the redo
+            # step furthest from the current state
+            _, evicted = (self._undo or self._redo).popleft()
+            self._bytes -= evicted
+
+    def _pop(self, stack: Deque[Tuple[Entry, int]]) -> Optional[Entry]:
+        """Take the top step off a stack."""
+        if not stack:
+            return None
+        entry, size = stack.pop()
+        self._bytes -= size
+        return entry
@@ -0,0 +1,292 @@
+# [Task]: Operation Statistics
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+# TodoManager methods that are timed once instrumentation is enabled
+INSTRUMENTED_METHODS = (
+    'add_task', 'add_tasks', 'get_task', 'get_all_tasks', 'get_task_page', 'get_sorted_page',
+    'task_rank', 'update_task', 'update_tasks', 'delete_task', 'delete_tasks', 'toggle_complete',
+    'toggle_many', 'search', 'count_by_status', 'task_count', 'undo', 'redo',
+)
+
+# Percentiles reported for every operation
+PERCENTILES = {'p50': 0.50, 'p95': 0.95, 'p99': 0.99}
+
+# Sub-buckets per power of two in the latency histogram: with 8, a
+# reported latency is within about 6% of the measured one
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+# Buckets needed for durations up to 2 ** 64 ns
+BUCKET_COUNT = 64 * SUB_BUCKETS
+
+DEFAULT_DUMP_INTERVAL = 10.0
+
+
+def bucket_index(nanoseconds: int) -> int:
+    """
+    Return the histogram bucket of a duration.
+
+    Durations below 16 ns get a bucket each; above that every power of two
+    is split into SUB_BUCKETS equal buckets, keyed by the leading bits.
+    """
+    shift = nanoseconds.bit_length() - SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return nanoseconds
+    return shift * SUB_BUCKETS + (nanoseconds >> shift)
+
+
+def bucket_value(index: int) -> float:
+    """Return the midpoint, in nanoseconds, of the durations in a bucket."""
+    if index < 2 * SUB_BUCKETS:
+        return float(index)
+    shift = index // SUB_BUCKETS - 1
+    return ((index % SUB_BUCKETS + SUB_BUCKETS) << shift) + (1 << shift) / 2
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of call durations.
+
+    Recording a duration is a couple of integer operations and memory is
+    fixed, however many calls are recorded, at the cost of reporting
+    percentiles to within a few percent.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.max = 0
+        self._buckets: List[int] = [0] * BUCKET_COUNT
+
+    def record(self, nanoseconds: int) -> None:
+        """
+        Count one duration.
+
+        Args:
+            nanoseconds (int): The measured duration
+        """
+        # bucket_index(), inlined since this runs on every timed call
+        shift = nanoseconds.bit_length() - SUB_BUCKET_BITS - 1
+        self._buckets[nanoseconds if shift <= 0 else shift * SUB_BUCKETS + (nanoseconds >> shift)] += 1
+        self.count += 1
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Return the duration below which the given fraction of calls fell.
+
+        Args:
+            fraction (float): E.g. 0.99 for the 99th percentile
+
+        Returns:
+            float: The duration in nanoseconds, 0.0 if nothing was recorded
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for index, count in enumerate(self._buckets):
+            seen += count
+            if seen >= rank:
+                return min(bucket_value(index), float(self.max))
+        return float(self.max)
+
+
+class OperationStats:
+    """
+    Optional call statistics for a TodoManager.
+
+    Responsibilities:
+    - Time every call of the instrumented manager methods
+    - Keep call counts and latency histograms per method
+    - Count the tasks copied into the lists the methods return
+    - Report the statistics as a dictionary, and dump them to a JSON file
+      on request or periodically
+
+    A manager without an OperationStats is not wrapped at all, so
+    instrumentation costs nothing unless it is enabled. Only calls from
+    outside the manager are counted: when toggle_complete() looks the task
+    up with get_task(), that lookup is part of the toggle's time.
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        # Tasks copied into returned lists per method: (total, largest list)
+        self._copied: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        # Per thread: whether a timed call is running, so nested calls are not timed
+        self._active = threading.local()
+        self._dump_thread: Optional[threading.Thread] = None
+        self._dump_path: Optional[str] = None
+        self._stop_dumping = threading.Event()
+
+    def instrument(self, manager) -> None:
+        """
+        Replace the manager's instrumented methods with timed wrappers.
+
+        The wrappers are set on the instance, so other managers of the
+        same class are unaffected.
+
+        Args:
+            manager: The manager to instrument
+        """
+        for name in INSTRUMENTED_METHODS:
+            method = getattr(manager, name, None)
+            if method is not None:
+                setattr(manager, name, self._timed(name, method))
+
+    def record(self, name: str, nanoseconds: int, copied: int = 0) -> None:
+        """
+        Record one call of a method.
+
+        Args:
+            name (str): The method name
+            nanoseconds (int): How long the call took
+            copied (int): Number of tasks in the list it returned
+        """
+        histogram, sizes = self._operation(name)
+        with self._lock:
+            histogram.record(nanoseconds)
+            if copied:
+                sizes[0] += copied
+                if copied > sizes[1]:
+                    sizes[1] = copied
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return the statistics of every method called so far.
+
+        Returns:
+            dict: Mapping of method name to {'calls', 'p50_us', 'p95_us',
+                'p99_us', 'max_us', 'copied', 'max_copied'}, sorted by name
+        """
+        with self._lock:
+            stats = {}
+            for name in sorted(self._histograms):
+                histogram = self._histograms[name]
+                if not histogram.count:
+                    continue
+                entry = {'calls': histogram.count}
+                for label, fraction in PERCENTILES.items():
+                    entry[f'{label}_us'] = round(histogram.percentile(fraction) / 1e3, 3)
+                entry['max_us'] = round(histogram.max / 1e3, 3)
+                entry['copied'], entry['max_copied'] = self._copied[name]
+                stats[name] = entry
+            return stats
+
+    def reset(self) -> None:
+        """Forget every recorded call."""
+        with self._lock:
+            for name in self._histograms:
+                self._histograms[name] = LatencyHistogram()
+                self._copied[name] = [0, 0]
+
+    def dump(self, path: str) -> None:
+        """
+        Write the statistics to a JSON file.
+
+        The file is written under a temporary name and renamed, so readers
+        never see a half-written dump.
+
+        Args:
+            path (str): The file to write
+        """
+        data = {'time': time.time(), 'operations': self.snapshot()}
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+        os.replace(temp_path, path)
+
+    def dump_every(self, path: str, interval: float = DEFAULT_DUMP_INTERVAL) -> None:
+        """
+        Dump the statistics to a JSON file from a background thread.
+
+        Args:
+            path (str): The file to write
+            interval (float): Seconds between dumps
+
+        Raises:
+            ValueError: If interval is not positive or a dump is already running
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if self._dump_thread is not None:
+            raise ValueError("statistics are already being dumped")
+        self._dump_path = path
+        self._stop_dumping.clear()
+        self._dump_thread = threading.Thread(target=self._dump_loop, args=(path, interval),
+                                             name="stats-dump", daemon=True)
+        self._dump_thread.start()
+
+    def close(self) -> None:
+        """
+        Stop the periodic dump, if any, after writing a final one.
+        """
+        if self._dump_thread is None:
+            return
+        self._stop_dumping.set()
+        self._dump_thread.join()
+        self._dump_thread = None
+        self.dump(self._dump_path)
+
+    def _dump_loop(self, path: str, interval: float) -> None:
+        """
+        Dump thread loop: write the statistics every interval until stopped.
+        """
+        while not self._stop_dumping.wait(interval):
+            try:
+                self.dump(path)
+            except OSError:
+                # Try again at the next interval; close() reports a lasting failure
+                pass
+
+    def _operation(self, name: str) -> Tuple[LatencyHistogram, List[int]]:
+        """
+        Return the histogram and copied sizes of a method, creating them if needed.
+        """
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = LatencyHistogram()
+                self._copied[name] = [0, 0]
+            return self._histograms[name], self._copied[name]
+
+    def _timed(self, name: str, method: Callable) -> Callable:
+        """
+        Wrap a bound method so each call is recorded under the given name.
+        """
+        lock = self._lock
+        active = self._active
+        clock = time.perf_counter_ns
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            if getattr(active, 'running', False):
+                return method(*args, **kwargs)
+            # Looked up per call, so the wrapper follows reset()
+            histogram, sizes = self._histograms[name], self._copied[name]
+            active.running = True
+            start = clock()
+            result = None
+            try:
+                result = method(*args, **kwargs)
+                return result
+            finally:
+                elapsed = clock() - start
+                active.running = False
+                with lock:
+                    histogram.record(elapsed)
+                    if type(result) is list:
+                        sizes[0] += len(result)
+                        if len(result) > sizes[1]:
+                            sizes[1] = len(result)
+
+        self._operation(name)
+        return timed
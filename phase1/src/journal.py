@@ -0,0 +1,306 @@
+# [Task]: Persistent Journal Storage
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, MutableMapping, Optional, Tuple
+
+try:
+    from .snapshot import SnapshotTasks, write_snapshot
+    from .task import Task, insert_in_id_order
+except ImportError:
+    from snapshot import SnapshotTasks, write_snapshot
+    from task import Task, insert_in_id_order
+
+SNAPSHOT_NAME = "tasks.{generation}.snapshot"
+LOG_NAME = "tasks.{generation}.log"
+# JSON snapshot written by earlier versions; read once, then replaced
+LEGACY_SNAPSHOT_NAME = "tasks.snapshot"
+GENERATION_FILE = re.compile(r"tasks\.(\d+)\.(snapshot|log)")
+
+
+def record_count(record: Dict) -> int:
+    """
+    Return the number of changes in a log record, so a batch counts
+    toward compaction as much as its changes logged one by one.
+    """
+    return len(record["records"]) if record["op"] == "batch" else 1
+
+
+class JournalStorage:
+    """
+    Append-only journal persistence backend for TodoManager.
+
+    Responsibilities:
+    - Append one JSON record per mutation to a log file
+    - Group-commit buffered records with a single fsync, from a
+      background thread once a record has waited commit_interval
+    - Map the binary snapshot and replay the log on startup
+    - Compact the log into a new snapshot periodically
+
+    A storage backend is any object with load(), append(), needs_compaction(),
+    compact() and close() methods; TodoManager only talks to that interface.
+    """
+
+    def __init__(self, directory: str, group_size: int = 256,
+                 commit_interval: float = 0.05, compact_every: int = 100_000):
+        """
+        Initialize the journal in the given directory.
+
+        Args:
+            directory (str): Directory holding the snapshot and log files
+            group_size (int): Number of records buffered before a group commit
+            commit_interval (float): Max seconds a record may stay buffered
+            compact_every (int): Log records written before a snapshot is due;
+                each change in a batch record counts
+        """
+        self.directory = directory
+        self.group_size = group_size
+        self.commit_interval = commit_interval
+        self.compact_every = compact_every
+        self._generation = 0
+        self._log_records = 0
+        self._buffer: List[str] = []
+        self._buffered_since = 0.0
+        self._log_file = None
+        # Guards the buffer and log file, shared with the commit thread
+        self._lock = threading.RLock()
+        self._buffer_changed = threading.Condition(self._lock)
+        self._committer: Optional[threading.Thread] = None
+        # The memory-mapped snapshot handed out by load(), closed with the journal
+        self._snapshot: Optional[SnapshotTasks] = None
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def snapshot_path(self) -> str:
+        """Path of the snapshot file for the current generation."""
+        return os.path.join(self.directory, SNAPSHOT_NAME.format(generation=self._generation))
+
+    @property
+    def log_path(self) -> str:
+        """Path of the log file for the current generation."""
+        return os.path.join(self.directory, LOG_NAME.format(generation=self._generation))
+
+    def load(self) -> Tuple[MutableMapping[int, Task], int]:
+        """
+        Map the latest snapshot, replay the log and open the log for appending.
+
+        The snapshot is memory-mapped rather than read, so startup only
+        pays for the log records written since the last compaction.
+
+        Returns:
+            tuple: (tasks keyed by ID in insertion order, next task ID)
+        """
+        tasks: MutableMapping[int, Task] = {}
+        next_id = 1
+
+        generations = [int(match.group(1)) for match in map(GENERATION_FILE.fullmatch, os.listdir(self.directory))
+                       if match and match.group(2) == "snapshot"]
+        legacy_path = os.path.join(self.directory, LEGACY_SNAPSHOT_NAME)
+        if generations:
+            self._generation = max(generations)
+            tasks = self._snapshot = SnapshotTasks(self.snapshot_path)
+            next_id = tasks.next_id
+        elif os.path.exists(legacy_path):
+            with open(legacy_path, encoding="utf-8") as snapshot:
+                header = json.loads(snapshot.readline())
+                self._generation = header["generation"]
+                next_id = header["next_id"]
+                for line in snapshot:
+                    task_id, title, description, completed = json.loads(line)
+                    tasks[task_id] = Task(task_id, title, description, completed)
+
+        # Replay the log written since the snapshot
+        next_id = self._replay(tasks, next_id)
+        self._log_file = open(self.log_path, "a", encoding="utf-8")
+        self._remove_stale_files()
+        self._committer = threading.Thread(target=self._run, name="journal-commit", daemon=True)
+        self._committer.start()
+
+        return tasks, next_id
+
+    def append(self, record: Dict) -> None:
+        """
+        Buffer a mutation record, committing the group when it is full.
+
+        A record that is not committed by a later append() is committed
+        by the background thread once it has waited commit_interval.
+
+        Args:
+            record (dict): The mutation record, e.g. {'op': 'delete', 'id': 3}
+        """
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            if not self._buffer:
+                self._buffered_since = time.monotonic()
+                self._buffer_changed.notify()
+            self._buffer.append(line)
+            self._log_records += record_count(record)
+
+            if (len(self._buffer) >= self.group_size
+                    or time.monotonic() - self._buffered_since >= self.commit_interval):
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all buffered records and fsync them in one group commit.
+        """
+        with self._lock:
+            if not self._buffer:
+                return
+            self._log_file.write("\n".join(self._buffer) + "\n")
+            self._log_file.flush()
+            os.fsync(self._log_file.fileno())
+            self._buffer.clear()
+
+    def needs_compaction(self) -> bool:
+        """
+        Check whether enough records were logged to warrant a new snapshot.
+
+        Returns:
+            bool: True if compact() should be called
+        """
+        return self._log_records >= self.compact_every
+
+    def compact(self, tasks: Iterable[Task], next_id: int) -> None:
+        """
+        Write a snapshot of the given state and start a fresh log.
+
+        The snapshot is written to a temporary file and atomically renamed
+        to the next generation's name, so a crash leaves either the old
+        snapshot and log or the new ones. The previous snapshot file may
+        still be mapped by the task store, so it is only deleted when the
+        platform allows it.
+
+        Args:
+            tasks (Iterable[Task]): All current tasks in insertion order
+            next_id (int): The next task ID to hand out
+        """
+        with self._lock:
+            self.flush()
+            generation = self._generation + 1
+            snapshot_path = os.path.join(self.directory, SNAPSHOT_NAME.format(generation=generation))
+            temp_path = snapshot_path + ".tmp"
+            write_snapshot(temp_path, tasks, next_id)
+            os.replace(temp_path, snapshot_path)
+
+            # Switch to the new generation's log and drop the old files
+            self._log_file.close()
+            self._generation = generation
+            self._log_records = 0
+            self._log_file = open(self.log_path, "a", encoding="utf-8")
+            self._remove_stale_files()
+
+    def close(self) -> None:
+        """
+        Commit any buffered records, stop the commit thread, close the log
+        file and unmap the snapshot; the tasks returned by load() must not
+        be used afterwards.
+        """
+        with self._lock:
+            if self._log_file is not None:
+                self.flush()
+                self._log_file.close()
+                self._log_file = None
+            self._buffer_changed.notify()
+        if self._committer is not None:
+            self._committer.join()
+            self._committer = None
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def _run(self) -> None:
+        """
+        Commit thread loop: commit the buffer once its oldest record has
+        waited commit_interval, until the journal is closed.
+        """
+        with self._lock:
+            while self._log_file is not None:
+                if not self._buffer:
+                    self._buffer_changed.wait()
+                    continue
+                remaining = self._buffered_since + self.commit_interval - time.monotonic()
+                if remaining > 0:
+                    self._buffer_changed.wait(remaining)
+                    continue
+                try:
+                    self.flush()
+                except OSError:
+                    # Keep the records buffered and retry after another interval
+                    self._buffered_since = time.monotonic()
+
+    def _replay(self, tasks: MutableMapping[int, Task], next_id: int) -> int:
+        """
+        Apply the current generation's log records to the loaded tasks.
+
+        A torn record at the end of the log (from a crash mid-write) is
+        discarded and truncated so new records are appended cleanly.
+
+        Returns:
+            int: The next task ID after replay
+        """
+        if not os.path.exists(self.log_path):
+            return next_id
+
+        good_offset = 0
+        with open(self.log_path, "rb") as log:
+            for line in log:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                next_id = self._apply(tasks, record, next_id)
+                good_offset += len(line)
+                self._log_records += record_count(record)
+
+        if good_offset < os.path.getsize(self.log_path):
+            os.truncate(self.log_path, good_offset)
+        return next_id
+
+    def _apply(self, tasks: MutableMapping[int, Task], record: Dict, next_id: int) -> int:
+        """
+        Apply a single log record to the loaded tasks.
+
+        Returns:
+            int: The next task ID after the record
+        """
+        op = record["op"]
+        task_id = record.get("id")
+
+        if op == "batch":
+            for sub_record in record["records"]:
+                next_id = self._apply(tasks, sub_record, next_id)
+        elif op == "add":
+            # An undone delete adds a task back below newer ones
+            insert_in_id_order(tasks, [Task(task_id, record["title"], record["description"], record["completed"])])
+            next_id = max(next_id, task_id + 1)
+        elif op == "update":
+            task = tasks[task_id]
+            task.title = record.get("title", task.title)
+            task.description = record.get("description", task.description)
+        elif op == "toggle":
+            task = tasks[task_id]
+            task.completed = not task.completed
+        elif op == "delete":
+            del tasks[task_id]
+        return next_id
+
+    def _remove_stale_files(self) -> None:
+        """
+        Delete snapshots and logs from generations older than the current one.
+
+        A snapshot that is still memory-mapped cannot be deleted on some
+        platforms; it is left for the next cleanup.
+        """
+        for name in os.listdir(self.directory):
+            match = GENERATION_FILE.fullmatch(name)
+            if (match and int(match.group(1)) < self._generation) or \
+                    (name == LEGACY_SNAPSHOT_NAME and self._generation > 0 and os.path.exists(self.snapshot_path)):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except PermissionError:
+                    pass
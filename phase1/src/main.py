@@ -1,49 +1,108 @@
-# [Task]: T-020
-# [From]: plan.md §Main Application, specify.md §Menu System
-
-from todo_manager import TodoManager
-from ui import TodoUI
-
-
-def main():
-    """
-    Main entry point for the Todo Console App.
-    Initializes the TodoManager and TodoUI, then runs the application loop.
-    """
-    print("🌟 Welcome to the Todo Console App! 🌟")
-    
-    # Initialize the TodoManager and TodoUI
-    manager = TodoManager()
-    ui = TodoUI(manager)
-    
-    # Application loop
-    while True:
-        # Show the main menu
-        ui.show_menu()
-        
-        # Get the user's menu choice
-        choice = ui.get_menu_choice()
-        
-        # Route the choice to the appropriate handler
-        if choice == '1':
-            ui.handle_add_task()
-        elif choice == '2':
-            ui.handle_view_tasks()
-        elif choice == '3':
-            ui.handle_update_task()
-        elif choice == '4':
-            ui.handle_delete_task()
-        elif choice == '5':
-            ui.handle_complete_task()
-        elif choice == '6':
-            print("\n👋 Thank you for using the Todo Console App. Goodbye! 👋")
-            break
-        
-        # Pause before showing the menu again
-        input("\n🔹 Press Enter to continue...")
-    
-    print("✨ Application exited. Have a great day! ✨")
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+# [Task]: T-020
+# [From]: plan.md §Main Application, specify.md §Menu System
+
+import sys
+from typing import Optional
+
+try:
+    from .autosave import AutosaveStorage
+    from .history import UndoHistory
+    from .instrumentation import OperationStats
+    from .journal import JournalStorage
+    from .todo_manager import TodoManager
+    from .ui import TodoUI
+except ImportError:
+    from autosave import AutosaveStorage
+    from history import UndoHistory
+    from instrumentation import OperationStats
+    from journal import JournalStorage
+    from todo_manager import TodoManager
+    from ui import TodoUI
+
+
+def main(journal_dir: Optional[str] = None, stats_path: Optional[str] = None):
+    """
+    Main entry point for the Todo Console App.
+    Initializes the TodoManager and TodoUI, then runs the application loop.
+    
+    Args:
+        journal_dir (str | None): Directory for durable task storage; tasks
+            are kept in memory only when omitted
+        stats_path (str | None): JSON file the operation statistics are
+            dumped to periodically and on exit
+    """
+    print("🌟 Welcome to the Todo Console App! 🌟")
+    
+    # Initialize the TodoManager and TodoUI; changes are saved in the
+    # background so the menu never waits on the disk
+    storage = AutosaveStorage(JournalStorage(journal_dir)) if journal_dir else None
+    # Operations are always timed here for the Stats menu; at menu speed
+    # the wrappers cost nothing noticeable
+    stats = OperationStats()
+    if stats_path:
+        stats.dump_every(stats_path)
+    manager = TodoManager(storage, UndoHistory(), stats)
+    ui = TodoUI(manager)
+    
+    try:
+        run_loop(ui)
+    finally:
+        # Write any unsaved changes and the final statistics before exiting
+        manager.close()
+    
+    print("✨ Application exited. Have a great day! ✨")
+
+
+def run_loop(ui: TodoUI) -> None:
+    """
+    Run the interactive menu loop until the user chooses to exit.
+    
+    Args:
+        ui (TodoUI): The console UI to drive
+    """
+    # Application loop
+    while True:
+        # Show the main menu
+        ui.show_menu()
+        
+        # Get the user's menu choice
+        choice = ui.get_menu_choice()
+        
+        # Route the choice to the appropriate handler
+        if choice == '1':
+            ui.handle_add_task()
+        elif choice == '2':
+            ui.handle_view_tasks()
+        elif choice == '3':
+            ui.handle_update_task()
+        elif choice == '4':
+            ui.handle_delete_task()
+        elif choice == '5':
+            ui.handle_complete_task()
+        elif choice == '6':
+            ui.handle_search_tasks()
+        elif choice == '7':
+            ui.handle_import_tasks()
+        elif choice == '8':
+            ui.handle_export_tasks()
+        elif choice == '9':
+            ui.handle_undo()
+        elif choice == '10':
+            ui.handle_redo()
+        elif choice == '11':
+            ui.handle_stats()
+        elif choice == '12':
+            print("\n👋 Thank you for using the Todo Console App. Goodbye! 👋")
+            break
+        
+        # Pause before showing the menu again
+        input("\n🔹 Press Enter to continue...")
+
+
+if __name__ == "__main__":
+    # Subcommands and batch mode run without prompts; see cli.py
+    try:
+        from .cli import main as cli_main
+    except ImportError:
+        from cli import main as cli_main
+    sys.exit(cli_main())
\ No newline at end of file
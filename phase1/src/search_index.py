@@ -0,0 +1,201 @@
+# [Task]: Task Search
+# [From]: plan.md §TodoManager Class, specify.md §Features
+
+import heapq
+import operator
+import re
+from bisect import bisect_left, insort
+from itertools import compress
+from typing import Dict, List, Set, Tuple
+
+try:
+    from .task import Task
+except ImportError:
+    from task import Task
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Title matches rank above description matches
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text (str): The text to split
+
+    Returns:
+        list[str]: The word tokens, in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+class SearchIndex:
+    """
+    Inverted index over task titles and descriptions.
+
+    Responsibilities:
+    - Map every word to the IDs of the tasks containing it
+    - Keep a sorted vocabulary for prefix matching
+    - Rank matching tasks by how well they match the query
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        # term -> {task ID: weight of the term in that task}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        # Sorted list of terms, searched with bisect for prefixes. New terms
+        # wait in _new_terms and removed ones linger in _removed_terms until
+        # the next search brings the list up to date in one step.
+        self._terms: List[str] = []
+        self._new_terms: Set[str] = set()
+        self._removed_terms: Set[str] = set()
+
+    def add(self, task: Task) -> None:
+        """
+        Index the title and description of a task.
+
+        Args:
+            task (Task): The task to index
+        """
+        for term, weight in self._term_weights(task).items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if term in self._removed_terms:
+                    self._removed_terms.discard(term)
+                else:
+                    self._new_terms.add(term)
+            postings[task.id] = weight
+
+    def remove(self, task: Task) -> None:
+        """
+        Remove a task from the index.
+
+        Must be called with the task's text as it was when it was indexed,
+        i.e. before its title or description changes.
+
+        Args:
+            task (Task): The task to remove
+        """
+        for term in self._term_weights(task):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(task.id, None)
+            if not postings:
+                del self._postings[term]
+                if term in self._new_terms:
+                    self._new_terms.discard(term)
+                else:
+                    self._removed_terms.add(term)
+
+    def search(self, query: str, limit: int = 20) -> List[int]:
+        """
+        Find the tasks matching every word of the query.
+
+        Each query word matches any indexed word it is a prefix of, so
+        "gro" finds "groceries". Results are ranked by the summed weight
+        of the matched words, with title matches weighing more.
+
+        Args:
+            query (str): Words to search for
+            limit (int): Maximum number of task IDs to return
+
+        Returns:
+            list[int]: Matching task IDs, best match first
+        """
+        return [task_id for _, task_id in self.ranked(query, limit)]
+
+    def ranked(self, query: str, limit: int = 20) -> List[Tuple[int, int]]:
+        """
+        Find the tasks matching every word of the query, with their scores.
+
+        Scores only depend on the task itself, so results of several
+        indexes (e.g. one per shard) can be merged by score.
+
+        Args:
+            query (str): Words to search for
+            limit (int): Maximum number of results to return
+
+        Returns:
+            list[tuple[int, int]]: (score, task ID) pairs, best match first
+        """
+        tokens = tokenize(query)
+        if not tokens or limit <= 0:
+            return []
+        self._sync_terms()
+
+        # Intersect from the most selective word so the lists stay small;
+        # filter() and map() keep the per-task work in C
+        matches = sorted((self._prefix_scores(token) for token in set(tokens)), key=len)
+        task_ids = list(matches[0])
+        for other in matches[1:]:
+            task_ids = list(filter(other.__contains__, task_ids))
+
+        # Sum the weights of every matched word per task
+        totals = [0] * len(task_ids)
+        for match in matches:
+            totals = list(map(operator.add, totals, map(match.__getitem__, task_ids)))
+
+        # Highest score first, ties broken by lowest (oldest) ID. Scores take
+        # only a few distinct values, so walk them from the top down.
+        best: List[Tuple[int, int]] = []
+        for score in sorted(set(totals), reverse=True):
+            tied = compress(task_ids, map(score.__eq__, totals))
+            best.extend((score, task_id) for task_id in heapq.nsmallest(limit - len(best), tied))
+            if len(best) >= limit:
+                break
+        return best
+
+    def _prefix_scores(self, prefix: str) -> Dict[int, int]:
+        """
+        Collect the best weight per task over all terms starting with prefix.
+
+        The returned dictionary may be an internal postings map and must
+        not be modified.
+        """
+        start = end = bisect_left(self._terms, prefix)
+        while end < len(self._terms) and self._terms[end].startswith(prefix):
+            end += 1
+
+        # A single matching term needs no merging
+        if end - start == 1:
+            return self._postings.get(self._terms[start], {})
+
+        scores: Dict[int, int] = {}
+        for term in self._terms[start:end]:
+            for task_id, weight in self._postings.get(term, {}).items():
+                if weight > scores.get(task_id, 0):
+                    scores[task_id] = weight
+        return scores
+
+    def _sync_terms(self) -> None:
+        """
+        Bring the sorted term list up to date with added and removed terms.
+
+        A few changes are inserted in place; many changes (such as the
+        initial build) are handled with one sort.
+        """
+        if len(self._new_terms) > 64 or len(self._removed_terms) > len(self._terms) // 4:
+            self._terms = sorted(self._postings)
+            self._removed_terms.clear()
+        else:
+            for term in self._new_terms:
+                insort(self._terms, term)
+        self._new_terms.clear()
+
+    @staticmethod
+    def _term_weights(task: Task) -> Dict[str, int]:
+        """
+        Weigh every word of a task, counting repeated words once per field.
+        """
+        weights: Dict[str, int] = {}
+        for term in set(tokenize(task.description)):
+            weights[term] = DESCRIPTION_WEIGHT
+        for term in set(tokenize(task.title)):
+            weights[term] = weights.get(term, 0) + TITLE_WEIGHT
+        return weights
@@ -0,0 +1,419 @@
+# [Task]: HTTP API Server
+# [From]: plan.md §TodoManager Class, specify.md §F1-F5
+
+"""
+HTTP/JSON API for the Todo Console App.
+
+Endpoints:
+    GET    /tasks                    List tasks (?status=pending|completed,
+                                     ?offset=, ?limit=); supports ETag and
+                                     If-None-Match
+    POST   /tasks                    Add a task {"title", "description"}, or
+                                     many tasks from a JSON array of them
+    PATCH  /tasks                    Update many tasks from a JSON array of
+                                     {"id", "title", "description"}
+    GET    /tasks/<id>               Show a task
+    PATCH  /tasks/<id>               Update a task {"title", "description"}
+    DELETE /tasks/<id>               Delete a task
+    POST   /tasks/<id>/toggle        Toggle a task's completion status
+    POST   /tasks/delete             Delete many tasks {"ids": [...]}
+    POST   /tasks/toggle             Toggle many tasks {"ids": [...]}
+    GET    /stats                    Task counts by status
+
+Connections are kept alive unless the client asks otherwise, and
+pipelined requests on a connection are answered in order.
+
+Usage:
+    python src/server.py [--host HOST] [--port PORT] [--journal DIR]
+"""
+
+import argparse
+import asyncio
+import json
+import secrets
+import sys
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    from .async_manager import AsyncTodoManager
+    from .journal import JournalStorage
+except ImportError:
+    from async_manager import AsyncTodoManager
+    from journal import JournalStorage
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+# Largest request body accepted, in bytes
+MAX_BODY = 16 * 2 ** 20
+# Default and largest page size of GET /tasks
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 10_000
+
+REASONS = {200: "OK", 201: "Created", 204: "No Content", 304: "Not Modified",
+           400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error"}
+STATUS_FILTERS = {'pending': False, 'completed': True}
+
+# (status, JSON payload or None, extra headers)
+Response = Tuple[int, object, Dict[str, str]]
+
+
+class HTTPError(ValueError):
+    """A request that cannot be served, answered with the given status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TodoServer:
+    """
+    Serves the task operations of an AsyncTodoManager over HTTP/1.1.
+
+    Responsibilities:
+    - Parse requests and route them to manager operations
+    - Keep connections open and answer pipelined requests in order
+    - Tag task lists with an ETag that changes with every change, so
+      clients can poll cheaply with If-None-Match
+
+    ETags combine a change counter with a random token drawn when the
+    server starts, so an ETag kept from before a restart never matches,
+    even though a journal brings back tasks that have since changed.
+    """
+
+    def __init__(self, manager: AsyncTodoManager):
+        """
+        Initialize the server for a manager.
+
+        Args:
+            manager (AsyncTodoManager): The manager whose tasks are served
+        """
+        self.manager = manager
+        # Bumped on every change; with the token, the ETag of every task list
+        self._version = 0
+        self._token = secrets.token_hex(8)
+        manager.manager.add_change_listener(self._on_tasks_changed)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve requests on one connection until the client closes it.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's input
+            writer (asyncio.StreamWriter): The connection's output
+        """
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await self.read_request(reader)
+                except HTTPError as e:
+                    self.write_response(writer, (e.status, {'error': str(e)}, {}), keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, headers, body, keep_alive = request
+                try:
+                    response = await self.dispatch(method, target, headers, body)
+                except HTTPError as e:
+                    response = (e.status, {'error': str(e)}, {})
+                except ValueError as e:
+                    response = (400, {'error': str(e)}, {})
+                except Exception as e:  # e.g. RecursionError from deeply nested JSON, or a storage error
+                    # The manager may be left mid-change, so answer and hang up
+                    response = (500, {'error': f"internal server error: {type(e).__name__}"}, {})
+                    keep_alive = False
+                self.write_response(writer, response, keep_alive)
+                # Only waits if the client stopped reading its responses
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple]:
+        """
+        Read one request from a connection.
+
+        Returns:
+            tuple | None: (method, target, headers, body, keep_alive), or
+                None if the client closed the connection
+
+        Raises:
+            HTTPError: If the request is malformed or too large
+        """
+        try:
+            line = await reader.readline()
+            if not line:
+                return None
+            headers = {}
+            while True:
+                header = await reader.readline()
+                if header in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = header.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            raise HTTPError(400, "request line or header too long")
+
+        parts = line.decode("latin-1").split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            raise HTTPError(400, "malformed request line")
+        method, target, version = parts
+
+        if "transfer-encoding" in headers:
+            raise HTTPError(411, "chunked bodies are not supported; send Content-Length")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(400, "invalid Content-Length")
+        if length < 0:
+            raise HTTPError(400, "invalid Content-Length")
+        if length > MAX_BODY:
+            raise HTTPError(413, f"request body exceeds {MAX_BODY} bytes")
+        body = await reader.readexactly(length) if length else b""
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method.upper(), target, headers, body, keep_alive
+
+    async def dispatch(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Response:
+        """
+        Route a request to the matching manager operation.
+
+        Returns:
+            tuple: (status, JSON payload or None, extra headers)
+
+        Raises:
+            HTTPError: If no endpoint matches
+            ValueError: If the body or a parameter is invalid
+        """
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        manager = self.manager
+
+        if parts == ["tasks"]:
+            if method == "GET":
+                return await self.list_tasks(parse_qs(url.query), headers)
+            if method == "POST":
+                data = parse_body(body)
+                if isinstance(data, list):
+                    tasks = await manager.add_tasks(task_fields(item) for item in data)
+                    return 201, [task.to_dict() for task in tasks], {}
+                task = await manager.add_task(*task_fields(data))
+                return 201, task.to_dict(), {}
+            if method == "PATCH":
+                data = parse_body(body)
+                if not isinstance(data, list):
+                    raise ValueError("expected a JSON array of task updates")
+                updates = [(task_id(require_object(item).get("id")), *update_fields(item)) for item in data]
+                if not await manager.update_tasks(updates):
+                    raise HTTPError(404, "a task was not found; nothing was updated")
+                return 204, None, {}
+            raise HTTPError(405, f"{method} not allowed on /tasks")
+
+        if parts in (["tasks", "delete"], ["tasks", "toggle"]):
+            if method != "POST":
+                raise HTTPError(405, f"{method} not allowed on {url.path}")
+            ids = require_object(parse_body(body)).get("ids")
+            if not isinstance(ids, list):
+                raise ValueError('expected {"ids": [...]}')
+            operation = manager.delete_tasks if parts[1] == "delete" else manager.toggle_many
+            if not await operation(map(task_id, ids)):
+                raise HTTPError(404, "a task was not found; nothing was changed")
+            return 204, None, {}
+
+        if parts == ["stats"] and method == "GET":
+            return 200, await manager.count_by_status(), {}
+
+        if len(parts) in (2, 3) and parts[0] == "tasks":
+            identifier = task_id(parts[1])
+            if len(parts) == 3:
+                if parts[2] != "toggle":
+                    raise HTTPError(404, f"no endpoint {url.path}")
+                if method != "POST":
+                    raise HTTPError(405, f"{method} not allowed on {url.path}")
+                if not await manager.toggle_complete(identifier):
+                    raise HTTPError(404, f"task {identifier} not found")
+                return 200, (await manager.get_task(identifier)).to_dict(), {}
+            if method == "GET":
+                task = await manager.get_task(identifier)
+            elif method in ("PATCH", "PUT"):
+                title, description = update_fields(parse_body(body))
+                if not await manager.update_task(identifier, title, description):
+                    raise HTTPError(404, f"task {identifier} not found")
+                task = await manager.get_task(identifier)
+            elif method == "DELETE":
+                if not await manager.delete_task(identifier):
+                    raise HTTPError(404, f"task {identifier} not found")
+                return 204, None, {}
+            else:
+                raise HTTPError(405, f"{method} not allowed on {url.path}")
+            if task is None:
+                raise HTTPError(404, f"task {identifier} not found")
+            return 200, task.to_dict(), {}
+
+        raise HTTPError(404, f"no endpoint {url.path}")
+
+    async def list_tasks(self, query: Dict[str, List[str]], headers: Dict[str, str]) -> Response:
+        """
+        Answer GET /tasks, or 304 if the client's copy is current.
+        """
+        etag = f'"{self._token}-{self._version}"'
+        if etag in headers.get("if-none-match", ""):
+            return 304, None, {"ETag": etag}
+
+        status = query.get("status", [None])[0]
+        if status is not None and status not in STATUS_FILTERS:
+            raise ValueError("status must be 'pending' or 'completed'")
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", [str(DEFAULT_LIMIT)])[0])
+        if offset < 0 or not 0 < limit <= MAX_LIMIT:
+            raise ValueError(f"offset must be >= 0 and limit between 1 and {MAX_LIMIT}")
+
+        tasks = await self.manager.get_task_page(offset, limit, STATUS_FILTERS.get(status))
+        return 200, [task.to_dict() for task in tasks], {"ETag": etag}
+
+    @staticmethod
+    def write_response(writer: asyncio.StreamWriter, response: Response, keep_alive: bool) -> None:
+        """
+        Write a response with its headers in a single call.
+        """
+        status, payload, extra = response
+        body = b"" if payload is None else json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        head = [f"HTTP/1.1 {status} {REASONS[status]}",
+                f"Content-Length: {len(body)}",
+                "Connection: keep-alive" if keep_alive else "Connection: close"]
+        if payload is not None:
+            head.append("Content-Type: application/json")
+        head.extend(f"{name}: {value}" for name, value in extra.items())
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+    def _on_tasks_changed(self, events) -> None:
+        """Invalidate the ETag of every task list."""
+        self._version += 1
+
+
+def parse_body(body: bytes):
+    """
+    Decode a JSON request body.
+
+    Raises:
+        ValueError: If the body is empty or not valid JSON
+    """
+    if not body:
+        raise ValueError("missing JSON body")
+    try:
+        return json.loads(body)
+    except ValueError:
+        raise ValueError("body is not valid JSON")
+
+
+def require_object(data) -> Dict:
+    """
+    Check that a decoded JSON value is an object.
+
+    Raises:
+        ValueError: If it is not
+    """
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object")
+    return data
+
+
+def task_fields(data) -> Tuple[str, str]:
+    """
+    Return the (title, description) of a task object from a request.
+
+    Raises:
+        ValueError: If the object has no string title
+    """
+    data = require_object(data)
+    title = data.get("title")
+    description = data.get("description", "")
+    if not isinstance(title, str) or not isinstance(description, str):
+        raise ValueError("title and description must be strings")
+    return title, description
+
+
+def update_fields(data) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the (title, description) of a task update from a request;
+    either may be None to leave the field unchanged.
+
+    Raises:
+        ValueError: If the object has a title or description that is not a string
+    """
+    data = require_object(data)
+    title = data.get("title")
+    description = data.get("description")
+    if not isinstance(title, (str, type(None))) or not isinstance(description, (str, type(None))):
+        raise ValueError("title and description must be strings")
+    return title, description
+
+
+def task_id(value) -> int:
+    """
+    Convert a task ID from a path or body to an int.
+
+    Raises:
+        ValueError: If it is not a positive integer
+    """
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
+    raise ValueError(f"invalid task ID: {value!r}")
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, journal: Optional[str] = None,
+                ready=None) -> None:
+    """
+    Serve the API until cancelled, then commit and close the task store.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): Port to listen on; 0 picks a free port
+        journal (str | None): Journal directory; None keeps tasks in memory
+        ready (callable | None): Called with the bound (host, port) once listening
+    """
+    async with AsyncTodoManager(JournalStorage(journal) if journal else None) as manager:
+        server = await asyncio.start_server(TodoServer(manager).handle_connection, host, port)
+        async with server:
+            address = server.sockets[0].getsockname()[:2]
+            if ready is not None:
+                ready(address)
+            await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point: parse options and serve until interrupted.
+
+    Args:
+        argv (list[str] | None): Arguments without the program name;
+            defaults to sys.argv[1:]
+
+    Returns:
+        int: Exit status, 0 on success
+    """
+    parser = argparse.ArgumentParser(prog="todo-server", description="Serve the todo list over HTTP/JSON.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"interface to listen on (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"port to listen on, 0 for any free port (default {DEFAULT_PORT})")
+    parser.add_argument("--journal", metavar="DIR", help="keep tasks in a journal in this directory")
+    args = parser.parse_args(argv)
+
+    def announce(address):
+        print(f"Serving on http://{address[0]}:{address[1]}", flush=True)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.journal, announce))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,532 @@
+# [Task]: Sharded Task Manager
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+import heapq
+import multiprocessing
+import os
+import re
+import threading
+from contextlib import ExitStack
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .events import ADDED, DELETED, TOGGLED, UPDATED, ChangeEvent, EventBus
+    from .journal import JournalStorage
+    from .task import Task, validate_description, validate_title
+    from .todo_manager import TodoManager
+except ImportError:
+    from events import ADDED, DELETED, TOGGLED, UPDATED, ChangeEvent, EventBus
+    from journal import JournalStorage
+    from task import Task, validate_description, validate_title
+    from todo_manager import TodoManager
+
+DEFAULT_SHARDS = 4
+# Journal directory of each shard inside the manager's directory
+SHARD_DIRECTORY = "shard{number}"
+SHARD_PATTERN = re.compile(r"shard\d+")
+
+# Tasks cross the process boundary as plain tuples, which pickle far
+# faster than Task objects
+Row = Tuple[int, str, str, bool]
+as_row = attrgetter('id', 'title', 'description', 'completed')
+
+
+class ShardTodoManager(TodoManager):
+    """
+    TodoManager holding one shard's tasks inside a worker process.
+
+    IDs are handed out by the coordinating ShardedTodoManager, so tasks
+    are inserted with their IDs already assigned, and not necessarily in
+    ID order when several threads add tasks at once. Unfiltered views
+    therefore read the sorted ID index rather than the store's insertion
+    order. The extra methods return rows instead of Task objects for
+    cheap transfer.
+    """
+
+    def insert_tasks(self, items: List[Tuple[int, str, str]]) -> None:
+        """
+        Store new tasks with coordinator-assigned IDs, in ascending ID order.
+
+        Args:
+            items (list[tuple[int, str, str]]): Validated (id, title, description)
+        """
+        self._insert_tasks([Task(task_id, title, description) for task_id, title, description in items])
+        self._next_id = max(self._next_id, items[-1][0] + 1)
+
+    def next_task_id(self) -> int:
+        """Return the next ID this shard has not seen."""
+        return self._next_id
+
+    def row(self, task_id: int) -> Optional[Row]:
+        """Return a task as a row, or None if not found."""
+        task = self._tasks.get(task_id)
+        return None if task is None else as_row(task)
+
+    def rows(self, completed: Optional[bool] = None) -> List[Row]:
+        """Return the tasks as rows in ID order, optionally filtered by status."""
+        if completed is None:
+            keys, _, _ = self._sorted_range('id', None)
+            return [as_row(self._tasks[key[-1]]) for key in keys]
+        return list(map(as_row, self.iter_tasks(completed)))
+
+    def rows_by_id(self, task_ids: List[int]) -> List[Row]:
+        """Return the given tasks as rows."""
+        return [as_row(self._tasks[task_id]) for task_id in task_ids]
+
+    def ordered_ids(self, completed: Optional[bool], limit: int) -> List[int]:
+        """Return the first IDs in ID order, optionally filtered by status."""
+        if completed is None:
+            keys, _, _ = self._sorted_range('id', None)
+            return [key[-1] for key in keys.slice(0, limit)]
+        return self._status_index.page(completed, 0, limit)
+
+    def missing(self, task_ids: List[int]) -> List[int]:
+        """Return the given IDs that do not belong to a task."""
+        return [task_id for task_id in task_ids if task_id not in self._tasks]
+
+    def toggle_state(self, task_id: int) -> Optional[bool]:
+        """Toggle a task and return its new status, or None if not found."""
+        if not self.toggle_complete(task_id):
+            return None
+        return self._tasks[task_id].completed
+
+    def toggle_states(self, task_ids: List[int]) -> Optional[Dict[int, bool]]:
+        """Toggle many tasks and return their new statuses, or None if any is missing."""
+        if not self.toggle_many(task_ids):
+            return None
+        return {task_id: self._tasks[task_id].completed for task_id in task_ids}
+
+    def ranked_search(self, query: str, limit: int) -> List[Tuple[int, Row]]:
+        """Search this shard and return (score, row) pairs, best match first."""
+        if self._search_index is None:
+            self._build_search_index()
+        return [(score, as_row(self._tasks[task_id]))
+                for score, task_id in self._search_index.ranked(query, limit)]
+
+
+def serve_shard(connection, directory: Optional[str]) -> None:
+    """
+    Worker process main loop: answer (method, args) requests for one shard.
+
+    Replies are (failed, result or exception) tuples; a method that raises
+    fails only its own request. The loop ends on a 'close' request or when
+    the coordinator goes away.
+
+    Args:
+        connection: This worker's end of the pipe to the coordinator
+        directory (str | None): The shard's journal directory, if any
+    """
+    manager = ShardTodoManager(JournalStorage(directory) if directory else None)
+    try:
+        while True:
+            try:
+                name, args = connection.recv()
+            except EOFError:
+                return
+            if name == 'close':
+                manager.close()
+                connection.send((False, None))
+                return
+            try:
+                result = getattr(manager, name)(*args)
+            except Exception as e:
+                try:
+                    connection.send((True, e))
+                except Exception:
+                    # The exception itself could not be pickled
+                    connection.send((True, RuntimeError(f"{name} failed: {e!r}")))
+                continue
+            connection.send((False, result))
+    finally:
+        manager.close()
+        connection.close()
+
+
+class ShardedTodoManager:
+    """
+    Task manager that spreads tasks over worker processes by ID.
+
+    Responsibilities:
+    - Hand out globally unique task IDs and send each task to shard
+      ``id % shards``
+    - Present the TodoManager API, running list views and searches as
+      scatter-gather requests merged back into ID (or rank) order
+    - Check bulk changes on every shard before applying any of them
+    - Notify change listeners in the coordinating process
+
+    Each shard is a process with its own TodoManager (and journal, when a
+    directory is given), reached over a pipe. Calls from several threads
+    run concurrently as long as they go to different shards. Returned
+    tasks are copies; re-read a task after changing it.
+    """
+
+    def __init__(self, shards: int = DEFAULT_SHARDS, directory: Optional[str] = None):
+        """
+        Start the shard processes.
+
+        Args:
+            shards (int): Number of worker processes
+            directory (str | None): Directory holding one journal per
+                shard; None keeps tasks in memory
+
+        Raises:
+            ValueError: If shards is not positive, or the directory holds
+                a different number of shards
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            existing = [name for name in os.listdir(directory) if SHARD_PATTERN.fullmatch(name)]
+            if existing and len(existing) != shards:
+                raise ValueError(f"{directory} holds {len(existing)} shards, not {shards}")
+
+        self._connections = []
+        self._processes = []
+        # One lock per pipe so a request and its reply are never interleaved
+        self._locks = [threading.RLock() for _ in range(shards)]
+        for number in range(shards):
+            parent, child = multiprocessing.Pipe()
+            shard_directory = (os.path.join(directory, SHARD_DIRECTORY.format(number=number))
+                               if directory is not None else None)
+            process = multiprocessing.Process(target=serve_shard, args=(child, shard_directory), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+        self._next_id = max(self._gather('next_task_id'))
+        self._id_lock = threading.Lock()
+        self._events = EventBus()
+
+    @property
+    def shard_count(self) -> int:
+        """Number of shard processes."""
+        return len(self._connections)
+
+    def add_task(self, title: str, description: str = "") -> Task:
+        """
+        Add a new task; see TodoManager.add_task.
+
+        Raises:
+            ValueError: If title is empty or exceeds character limits
+        """
+        title = validate_title(title)
+        validate_description(description)
+        task_id = self._allocate_ids(1)
+        self._call(self._shard(task_id), 'insert_tasks', [(task_id, title, description)])
+        task = Task(task_id, title, description)
+        if self._events.active:
+            self._events.publish([ChangeEvent(ADDED, task_id, {'title': title, 'description': description,
+                                                               'completed': False})])
+        return task
+
+    def add_tasks(self, items: Iterable[Tuple[str, str]]) -> List[Task]:
+        """
+        Add many tasks at once; see TodoManager.add_tasks.
+
+        Raises:
+            ValueError: If any title or description is invalid
+        """
+        validated = [(validate_title(title), validate_description(description))
+                     for title, description in items]
+        first_id = self._allocate_ids(len(validated))
+        tasks = [Task(first_id + offset, title, description)
+                 for offset, (title, description) in enumerate(validated)]
+
+        per_shard: Dict[int, List[Tuple[int, str, str]]] = {}
+        for task in tasks:
+            per_shard.setdefault(self._shard(task.id), []).append((task.id, task.title, task.description))
+        self._scatter({shard: ('insert_tasks', (items,)) for shard, items in per_shard.items()})
+        if self._events.active:
+            self._events.publish(ChangeEvent(ADDED, task.id, {'title': task.title, 'description': task.description,
+                                                              'completed': False}) for task in tasks)
+        return tasks
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Return all tasks in ID order, gathered from every shard.
+        """
+        return list(self.iter_tasks())
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """
+        Iterate over the tasks in ID order, optionally filtered by status.
+
+        Args:
+            completed (bool | None): Only yield completed (True) or pending
+                (False) tasks; None yields every task
+
+        Returns:
+            Iterator[Task]: Copies of the tasks at the time of the call
+        """
+        rows = heapq.merge(*self._gather('rows', completed), key=itemgetter(0))
+        return (Task(*row) for row in rows)
+
+    def task_count(self) -> int:
+        """Return the number of stored tasks."""
+        return sum(self._gather('task_count'))
+
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        Return how many tasks are completed and how many are pending.
+        """
+        counts = self._gather('count_by_status')
+        return {'completed': sum(count['completed'] for count in counts),
+                'pending': sum(count['pending'] for count in counts)}
+
+    def get_task_page(self, offset: int, limit: int, completed: Optional[bool] = None) -> List[Task]:
+        """
+        Return a slice of the task list; see TodoManager.get_task_page.
+
+        Every shard sends the IDs that could fall on the page; only the
+        tasks actually on it are fetched.
+        """
+        ids = list(islice(heapq.merge(*self._gather('ordered_ids', completed, offset + limit)),
+                          offset, offset + limit))
+        per_shard: Dict[int, List[int]] = {}
+        for task_id in ids:
+            per_shard.setdefault(self._shard(task_id), []).append(task_id)
+        rows = {}
+        for shard_rows in self._scatter({shard: ('rows_by_id', (task_ids,))
+                                         for shard, task_ids in per_shard.items()}).values():
+            rows.update((row[0], row) for row in shard_rows)
+        return [Task(*rows[task_id]) for task_id in ids]
+
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """
+        Find and return a copy of a single task by ID.
+
+        Returns:
+            Task | None: The task if found, None otherwise
+        """
+        row = self._call(self._shard(task_id), 'row', task_id)
+        return None if row is None else Task(*row)
+
+    def update_task(self, task_id: int, title: Optional[str] = None,
+                    description: Optional[str] = None) -> bool:
+        """
+        Update task title and/or description; see TodoManager.update_task.
+
+        Raises:
+            ValueError: If the new title or description is invalid
+        """
+        if title is not None:
+            title = validate_title(title)
+        if description is not None:
+            validate_description(description)
+        if not self._call(self._shard(task_id), 'update_task', task_id, title, description):
+            return False
+        if self._events.active:
+            self._events.publish([ChangeEvent(UPDATED, task_id, self._update_fields(title, description))])
+        return True
+
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Remove a task; see TodoManager.delete_task.
+        """
+        if not self._call(self._shard(task_id), 'delete_task', task_id):
+            return False
+        if self._events.active:
+            self._events.publish([ChangeEvent(DELETED, task_id, {})])
+        return True
+
+    def toggle_complete(self, task_id: int) -> bool:
+        """
+        Toggle task completion status; see TodoManager.toggle_complete.
+        """
+        completed = self._call(self._shard(task_id), 'toggle_state', task_id)
+        if completed is None:
+            return False
+        if self._events.active:
+            self._events.publish([ChangeEvent(TOGGLED, task_id, {'completed': completed})])
+        return True
+
+    def update_tasks(self, updates: Iterable[Tuple[int, Optional[str], Optional[str]]]) -> bool:
+        """
+        Update many tasks at once; see TodoManager.update_tasks.
+
+        Raises:
+            ValueError: If any title or description is invalid
+        """
+        validated = []
+        for task_id, title, description in updates:
+            if title is not None:
+                title = validate_title(title)
+            if description is not None:
+                validate_description(description)
+            validated.append((task_id, title, description))
+
+        per_shard = self._group(validated, itemgetter(0))
+        with self._locked(per_shard):
+            if not self._all_exist(per_shard, itemgetter(0)):
+                return False
+            self._scatter({shard: ('update_tasks', (items,)) for shard, items in per_shard.items()})
+        if self._events.active:
+            self._events.publish(ChangeEvent(UPDATED, task_id, self._update_fields(title, description))
+                                 for task_id, title, description in validated)
+        return True
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> bool:
+        """
+        Delete many tasks at once; see TodoManager.delete_tasks.
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        per_shard = self._group(task_ids)
+        with self._locked(per_shard):
+            if not self._all_exist(per_shard):
+                return False
+            self._scatter({shard: ('delete_tasks', (ids,)) for shard, ids in per_shard.items()})
+        if self._events.active:
+            self._events.publish(ChangeEvent(DELETED, task_id, {}) for task_id in task_ids)
+        return True
+
+    def toggle_many(self, task_ids: Iterable[int]) -> bool:
+        """
+        Toggle many tasks at once; see TodoManager.toggle_many.
+        """
+        task_ids = list(task_ids)
+        per_shard = self._group(task_ids)
+        with self._locked(per_shard):
+            if not self._all_exist(per_shard):
+                return False
+            states = {}
+            for shard_states in self._scatter({shard: ('toggle_states', (ids,))
+                                               for shard, ids in per_shard.items()}).values():
+                states.update(shard_states)
+        if self._events.active:
+            self._events.publish(ChangeEvent(TOGGLED, task_id, {'completed': states[task_id]})
+                                 for task_id in task_ids)
+        return True
+
+    def search(self, query: str, limit: int = 20) -> List[Task]:
+        """
+        Search task titles and descriptions on every shard; see TodoManager.search.
+
+        Each shard returns its best matches with their scores, which are
+        merged into one ranking.
+        """
+        ranked = heapq.merge(*self._gather('ranked_search', query, limit),
+                             key=lambda match: (-match[0], match[1][0]))
+        return [Task(*row) for _, row in islice(ranked, limit)]
+
+    def add_change_listener(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Register a callable to be notified of changes; see TodoManager.add_change_listener.
+        """
+        self._events.subscribe(listener)
+
+    def remove_change_listener(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Stop notifying a previously registered listener.
+        """
+        self._events.unsubscribe(listener)
+
+    def batch_changes(self) -> ContextManager[None]:
+        """
+        Deliver the change events of a block of operations as one batch.
+        """
+        return self._events.batch()
+
+    def close(self) -> None:
+        """
+        Commit every shard's pending changes and stop the shard processes.
+        """
+        if not self._processes:
+            return
+        self._gather('close')
+        for connection, process in zip(self._connections, self._processes):
+            connection.close()
+            process.join()
+        self._processes = []
+
+    def _allocate_ids(self, count: int) -> int:
+        """
+        Reserve a block of consecutive task IDs atomically.
+        """
+        with self._id_lock:
+            first_id = self._next_id
+            self._next_id = first_id + count
+            return first_id
+
+    def _shard(self, task_id: int) -> int:
+        """Return the number of the shard holding a task."""
+        return task_id % len(self._connections)
+
+    def _group(self, items: List, key: Callable[[Any], int] = int) -> Dict[int, List]:
+        """Split items by the shard of their task ID, keeping their order."""
+        per_shard: Dict[int, List] = {}
+        for item in items:
+            per_shard.setdefault(self._shard(key(item)), []).append(item)
+        return per_shard
+
+    def _all_exist(self, per_shard: Dict[int, List], key: Callable[[Any], int] = int) -> bool:
+        """Check that every task referenced by per-shard items exists."""
+        missing = self._scatter({shard: ('missing', ([key(item) for item in items],))
+                                 for shard, items in per_shard.items()})
+        return not any(missing.values())
+
+    def _call(self, shard: int, name: str, *args) -> Any:
+        """
+        Run a method on one shard and return its result.
+
+        Raises:
+            Exception: Whatever the shard's method raised, e.g. ValueError
+        """
+        connection = self._connections[shard]
+        with self._locks[shard]:
+            connection.send((name, args))
+            failed, value = connection.recv()
+        if failed:
+            raise value
+        return value
+
+    def _scatter(self, requests: Dict[int, Tuple[str, tuple]]) -> Dict[int, Any]:
+        """
+        Send one request to each of several shards, then collect the replies,
+        so the shards work in parallel.
+
+        Args:
+            requests (dict): Mapping of shard number to (method name, args)
+
+        Returns:
+            dict: Mapping of shard number to result
+
+        Raises:
+            Exception: Whatever any shard's method raised, after every reply is read
+        """
+        with self._locked(requests):
+            for shard, request in requests.items():
+                self._connections[shard].send(request)
+            replies = {shard: self._connections[shard].recv() for shard in requests}
+        for failed, value in replies.values():
+            if failed:
+                raise value
+        return {shard: value for shard, (_, value) in replies.items()}
+
+    def _gather(self, name: str, *args) -> List[Any]:
+        """Run a method on every shard and return the results in shard order."""
+        results = self._scatter({shard: (name, args) for shard in range(len(self._connections))})
+        return [results[shard] for shard in range(len(self._connections))]
+
+    def _locked(self, shards: Iterable[int]) -> ContextManager:
+        """
+        Hold the pipe locks of the given shards, acquired in shard order so
+        threads locking overlapping shards cannot deadlock.
+        """
+        stack = ExitStack()
+        for shard in sorted(shards):
+            stack.enter_context(self._locks[shard])
+        return stack
+
+    @staticmethod
+    def _update_fields(title: Optional[str], description: Optional[str]) -> Dict[str, str]:
+        """Return the fields set by an update, for its change event."""
+        fields = {}
+        if title is not None:
+            fields['title'] = title
+        if description is not None:
+            fields['description'] = description
+        return fields
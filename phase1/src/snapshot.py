@@ -0,0 +1,288 @@
+# [Task]: Binary Task Snapshot
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections.abc import MutableMapping, ValuesView
+from itertools import chain, compress, filterfalse
+from typing import Dict, Iterable, Iterator, Optional, Set
+
+try:
+    from .task import Task, insert_in_id_order
+except ImportError:
+    from task import Task, insert_in_id_order
+
+# File layout:
+#   header   HEADER, see below
+#   heap     UTF-8 title and description of every task, back to back
+#   padding  to an 8-byte boundary
+#   table    one fixed-width RECORD per task, in insertion order
+MAGIC = b"TODOSNP1"
+# Written in native byte order; a snapshot from a machine with the other
+# byte order is rejected instead of being misread
+BYTE_ORDER_MARK = 0x01020304
+# magic, byte order mark, flags, task count, next ID, completed count, table offset
+HEADER = struct.Struct("=8sIIqqqq")
+# id, heap offset, title length, description length (in bytes), completed
+RECORD = struct.Struct("=qqHHB3x")
+
+# Header flag set when the table's IDs are ascending, so lookups can bisect
+FLAG_ASCENDING = 1
+
+
+def write_snapshot(path: str, tasks: Iterable[Task], next_id: int) -> None:
+    """
+    Write tasks to a binary snapshot file and fsync it.
+
+    Args:
+        path (str): The file to write; an existing file is replaced
+        tasks (Iterable[Task]): All tasks, in insertion order
+        next_id (int): The next task ID to hand out
+    """
+    table = bytearray()
+    pack = RECORD.pack
+    offset = HEADER.size
+    count = completed = 0
+    ascending = True
+    last_id = None
+
+    with open(path, "wb") as snapshot:
+        snapshot.write(bytes(HEADER.size))
+        for task in tasks:
+            title = task.title.encode("utf-8")
+            description = task.description.encode("utf-8")
+            snapshot.write(title + description)
+            table += pack(task.id, offset, len(title), len(description), task.completed)
+            offset += len(title) + len(description)
+            count += 1
+            completed += task.completed
+            if last_id is not None and task.id <= last_id:
+                ascending = False
+            last_id = task.id
+
+        padding = -offset % 8
+        snapshot.write(bytes(padding))
+        snapshot.write(table)
+        snapshot.seek(0)
+        snapshot.write(HEADER.pack(MAGIC, BYTE_ORDER_MARK, FLAG_ASCENDING if ascending else 0,
+                                   count, next_id, completed, offset + padding))
+        snapshot.flush()
+        os.fsync(snapshot.fileno())
+
+
+class SnapshotTasks(MutableMapping):
+    """
+    Task store backed by a memory-mapped snapshot file.
+
+    Opening a snapshot only reads its header, so it takes the same time
+    for ten tasks or a million. A task's title and description are
+    decoded when the task is first looked up, and the decoded Task is kept
+    so later changes stick. Tasks added, changed or deleted afterwards
+    live in memory next to the read-only file.
+
+    Behaves like the dict TodoManager keeps its tasks in: ID -> Task in
+    insertion order.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a snapshot file into memory.
+
+        Args:
+            path (str): The snapshot file written by write_snapshot()
+
+        Raises:
+            ValueError: If the file is not a snapshot or has the wrong byte order
+        """
+        with open(path, "rb") as snapshot:
+            self._mmap = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"{path} is not a task snapshot")
+        magic, mark, flags, count, next_id, completed, table_offset = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a task snapshot")
+        if mark != BYTE_ORDER_MARK:
+            raise ValueError(f"{path} was written with a different byte order")
+
+        self.next_id = next_id
+        self._count = count
+        self._completed = completed
+        self._ascending = bool(flags & FLAG_ASCENDING)
+
+        # Column views over the record table; reading them copies nothing
+        self._table = memoryview(self._mmap)[table_offset:table_offset + count * RECORD.size]
+        slots = self._table.cast('q')
+        self._ids = slots[0::3]
+        self._offsets = slots[1::3]
+        halves = self._table.cast('H')
+        self._title_lengths = halves[8::12]
+        self._description_lengths = halves[9::12]
+        self._completed_flags = self._table[20::24]
+
+        # Tasks decoded from the file, tasks added since, and deleted file tasks
+        self._touched: Dict[int, Task] = {}
+        self._added: Dict[int, Task] = {}
+        self._deleted: Set[int] = set()
+        # ID -> table position, only built for snapshots with unordered IDs
+        self._positions: Optional[Dict[int, int]] = None
+
+    def __getitem__(self, task_id: int) -> Task:
+        """
+        Return a task, decoding it from the file on first access.
+
+        Raises:
+            KeyError: If there is no task with that ID
+        """
+        task = self._touched.get(task_id)
+        if task is None:
+            task = self._added.get(task_id)
+        if task is not None:
+            return task
+        position = self._position(task_id)
+        if position < 0:
+            raise KeyError(task_id)
+        # setdefault keeps one Task per ID even if two threads decode it at once
+        return self._touched.setdefault(task_id, self._decode(position))
+
+    def __setitem__(self, task_id: int, task: Task) -> None:
+        """
+        Store a task, replacing the file's version if there is one.
+
+        A deleted file task that is stored again (by an undo) takes its
+        place in the file back, and tasks added since the snapshot are
+        kept in ID order, so iteration order stays the file's order.
+        """
+        if self._position(task_id, deleted=True) >= 0:
+            self._deleted.discard(task_id)
+            self._touched[task_id] = task
+        elif task_id in self._added:
+            self._added[task_id] = task
+        else:
+            insert_in_id_order(self._added, [task])
+
+    def __delitem__(self, task_id: int) -> None:
+        """
+        Delete a task.
+
+        Raises:
+            KeyError: If there is no task with that ID
+        """
+        if task_id in self._added:
+            del self._added[task_id]
+            return
+        if self._position(task_id) < 0:
+            raise KeyError(task_id)
+        self._deleted.add(task_id)
+        self._touched.pop(task_id, None)
+
+    def __contains__(self, task_id) -> bool:
+        """Check for a task without decoding it."""
+        return task_id in self._added or self._position(task_id) >= 0
+
+    def __len__(self) -> int:
+        """Return the number of tasks."""
+        return self._count - len(self._deleted) + len(self._added)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the task IDs in insertion order."""
+        ids = filterfalse(self._deleted.__contains__, self._ids) if self._deleted else iter(self._ids)
+        return chain(ids, self._added)
+
+    def values(self) -> ValuesView:
+        """
+        Return a view of the tasks in insertion order.
+
+        Iterating it walks the record table in order instead of looking
+        each ID up, and keeps every task it decodes, so each view and
+        lookup hands out the same Task object and later changes show up
+        in references callers hold.
+        """
+        return _SnapshotValues(self)
+
+    def count_completed(self) -> int:
+        """
+        Return the number of completed tasks without decoding the file.
+        """
+        completed = self._completed
+        for task_id in chain(self._deleted, self._touched):
+            completed -= self._completed_flags[self._position(task_id, deleted=True)]
+        return completed + sum(task.completed for task in chain(self._touched.values(), self._added.values()))
+
+    def status_ids(self) -> Dict[bool, Set[int]]:
+        """
+        Return the sets of pending and of completed task IDs.
+
+        Returns:
+            dict: {False: pending IDs, True: completed IDs}
+        """
+        completed = set(compress(self._ids, self._completed_flags))
+        pending = set(self._ids).difference(completed)
+        for task_id in self._deleted:
+            completed.discard(task_id)
+            pending.discard(task_id)
+        for task in chain(self._touched.values(), self._added.values()):
+            (pending if task.completed else completed).discard(task.id)
+            (completed if task.completed else pending).add(task.id)
+        return {False: pending, True: completed}
+
+    def close(self) -> None:
+        """
+        Release the memory map. The store must not be used afterwards.
+        """
+        for view in (self._ids, self._offsets, self._title_lengths,
+                     self._description_lengths, self._completed_flags, self._table):
+            view.release()
+        self._mmap.close()
+
+    def _position(self, task_id: int, deleted: bool = False) -> int:
+        """
+        Return the table position of a task from the file, or -1.
+
+        Deleted tasks are reported as missing unless deleted is True.
+        """
+        if task_id in self._deleted and not deleted:
+            return -1
+        if not self._ascending:
+            if self._positions is None:
+                self._positions = {file_id: position for position, file_id in enumerate(self._ids)}
+            return self._positions.get(task_id, -1)
+        position = bisect_left(self._ids, task_id)
+        if position < self._count and self._ids[position] == task_id:
+            return position
+        return -1
+
+    def _decode(self, position: int) -> Task:
+        """
+        Build the Task stored at a table position.
+        """
+        offset = self._offsets[position]
+        middle = offset + self._title_lengths[position]
+        end = middle + self._description_lengths[position]
+        return Task(self._ids[position], self._mmap[offset:middle].decode("utf-8"),
+                    self._mmap[middle:end].decode("utf-8"), bool(self._completed_flags[position]))
+
+    def _iter_tasks(self) -> Iterator[Task]:
+        """
+        Yield every task in insertion order, decoding and keeping untouched ones.
+        """
+        touched = self._touched
+        deleted = self._deleted
+        decode = self._decode
+        for position, task_id in enumerate(self._ids):
+            if task_id in deleted:
+                continue
+            task = touched.get(task_id)
+            if task is None:
+                task = touched.setdefault(task_id, decode(position))
+            yield task
+        yield from self._added.values()
+
+
+class _SnapshotValues(ValuesView):
+    """Values view of a SnapshotTasks store that walks the record table in order."""
+
+    def __iter__(self) -> Iterator[Task]:
+        return self._mapping._iter_tasks()
@@ -0,0 +1,207 @@
+# [Task]: Sorted Task Views
+# [From]: plan.md §TodoManager Class, specify.md §F2: View Tasks
+
+from bisect import bisect_left, insort
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    from .task import Task
+except ImportError:
+    from task import Task
+
+# Sort key per sortable field; every key ends with the task ID, so keys
+# are unique and equal values keep ID order
+SORT_KEYS: Dict[str, Callable[[Task], Tuple]] = {
+    'id': lambda task: (task.id,),
+    'title': lambda task: (task.title.casefold(), task.id),
+    'description': lambda task: (task.description.casefold(), task.id),
+    'status': lambda task: (task.completed, task.id),
+}
+
+# Keys per bucket; buckets split when they grow to twice this
+BUCKET_SIZE = 512
+
+
+class SortedKeyList:
+    """
+    Sorted list of unique keys with positional access (an order-statistic
+    list).
+
+    Keys live in buckets of a few hundred, so inserting or removing moves
+    at most one bucket's worth of items. A Fenwick tree over the bucket
+    lengths turns a position into a bucket and a key into its rank in
+    O(log n), so "items 5000-5050" or "how many keys are smaller" never
+    scan the list.
+    """
+
+    def __init__(self, keys: Iterable = ()):
+        """
+        Build the list from any keys.
+
+        Args:
+            keys (Iterable): Initial keys, in any order
+        """
+        ordered = sorted(keys)
+        self._buckets: List[List] = [ordered[i:i + BUCKET_SIZE] for i in range(0, len(ordered), BUCKET_SIZE)]
+        self._maxes: List = [bucket[-1] for bucket in self._buckets]
+        self._len = len(ordered)
+        self._rebuild_tree()
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return self._len
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the keys in order."""
+        return chain.from_iterable(self._buckets)
+
+    def add(self, key: Any) -> None:
+        """
+        Insert a key.
+
+        Args:
+            key: The key; must not already be in the list
+        """
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._len = 1
+            self._rebuild_tree()
+            return
+
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            index -= 1
+            self._buckets[index].append(key)
+            self._maxes[index] = key
+        else:
+            insort(self._buckets[index], key)
+        self._len += 1
+
+        bucket = self._buckets[index]
+        if len(bucket) > 2 * BUCKET_SIZE:
+            self._buckets[index:index + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+            self._maxes[index:index + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(index, 1)
+
+    def extend(self, keys: Iterable) -> None:
+        """
+        Append keys that are larger than every stored key, e.g. newly
+        added task IDs, filling whole buckets with a single tree rebuild.
+
+        Args:
+            keys (Iterable): The keys, sorted and unique
+        """
+        keys = list(keys)
+        if len(keys) < len(self._buckets):
+            # Fewer keys than buckets: updating the tree per key is cheaper
+            for key in keys:
+                self.add(key)
+            return
+        self._len += len(keys)
+        if self._buckets and len(self._buckets[-1]) < BUCKET_SIZE:
+            room = BUCKET_SIZE - len(self._buckets[-1])
+            self._buckets[-1].extend(keys[:room])
+            self._maxes[-1] = self._buckets[-1][-1]
+            keys = keys[room:]
+        for start in range(0, len(keys), BUCKET_SIZE):
+            self._buckets.append(keys[start:start + BUCKET_SIZE])
+            self._maxes.append(self._buckets[-1][-1])
+        self._rebuild_tree()
+
+    def remove(self, key: Any) -> None:
+        """
+        Remove a key.
+
+        Raises:
+            KeyError: If the key is not in the list
+        """
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            raise KeyError(key)
+        bucket = self._buckets[index]
+        position = bisect_left(bucket, key)
+        if bucket[position] != key:
+            raise KeyError(key)
+        del bucket[position]
+        self._len -= 1
+
+        if not bucket:
+            del self._buckets[index]
+            del self._maxes[index]
+            self._rebuild_tree()
+            return
+        self._maxes[index] = bucket[-1]
+        self._tree_add(index, -1)
+
+    def rank(self, key: Any) -> int:
+        """
+        Return the number of keys smaller than the given key.
+
+        Args:
+            key: Any key comparable with the stored ones, e.g. a prefix
+                tuple such as (True,) to find where True-first keys start
+        """
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return self._len
+        return self._prefix(index) + bisect_left(self._buckets[index], key)
+
+    def slice(self, start: int, stop: int) -> List:
+        """
+        Return the keys at positions start (inclusive) to stop (exclusive).
+        """
+        start = max(start, 0)
+        stop = min(stop, self._len)
+        if start >= stop:
+            return []
+        index, offset = self._locate(start)
+        keys = self._buckets[index][offset:offset + stop - start]
+        for bucket in islice(self._buckets, index + 1, None):
+            if len(keys) >= stop - start:
+                break
+            keys.extend(bucket[:stop - start - len(keys)])
+        return keys
+
+    def _locate(self, position: int) -> Tuple[int, int]:
+        """
+        Return (bucket index, offset in bucket) of a position, walking the
+        Fenwick tree down from its highest power of two.
+        """
+        index = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            probe = index + step
+            if probe < len(self._tree) and self._tree[probe] <= position:
+                index = probe
+                position -= self._tree[probe]
+            step >>= 1
+        return index, position
+
+    def _prefix(self, index: int) -> int:
+        """Return the number of keys in the buckets before the given one."""
+        total = 0
+        while index:
+            total += self._tree[index]
+            index &= index - 1
+        return total
+
+    def _tree_add(self, index: int, delta: int) -> None:
+        """Change the recorded length of one bucket."""
+        index += 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def _rebuild_tree(self) -> None:
+        """Build the Fenwick tree over the bucket lengths in linear time."""
+        tree = [0] + [len(bucket) for bucket in self._buckets]
+        for index in range(1, len(tree)):
+            parent = index + (index & -index)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+        self._tree = tree
+
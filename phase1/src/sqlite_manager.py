@@ -0,0 +1,661 @@
+# [Task]: SQLite Task Storage
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+import sqlite3
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from .events import ADDED, DELETED, TOGGLED, UPDATED, ChangeEvent, EventBus
+    from .history import DELETE, RESTORE, TOGGLE, UPDATE, Entry, UndoHistory
+    from .instrumentation import OperationStats
+    from .search_index import tokenize
+    from .task import Task, validate_description, validate_title
+except ImportError:
+    from events import ADDED, DELETED, TOGGLED, UPDATED, ChangeEvent, EventBus
+    from history import DELETE, RESTORE, TOGGLE, UPDATE, Entry, UndoHistory
+    from instrumentation import OperationStats
+    from search_index import tokenize
+    from task import Task, validate_description, validate_title
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+"""
+
+# Statements are kept as constants so sqlite3's statement cache reuses
+# the prepared form on every call
+INSERT_TASK = "INSERT INTO tasks (id, title, description, completed) VALUES (?, ?, ?, ?)"
+SELECT_TASK = "SELECT id, title, description, completed FROM tasks WHERE id = ?"
+SELECT_ALL = "SELECT id, title, description, completed FROM tasks ORDER BY id"
+SELECT_BY_STATUS = "SELECT id, title, description, completed FROM tasks WHERE completed = ? ORDER BY id"
+SELECT_PAGE = "SELECT id, title, description, completed FROM tasks ORDER BY id LIMIT ? OFFSET ?"
+SELECT_STATUS_PAGE = ("SELECT id, title, description, completed FROM tasks WHERE completed = ? "
+                      "ORDER BY id LIMIT ? OFFSET ?")
+COUNT_TASKS = "SELECT COUNT(*) FROM tasks"
+COUNT_BY_STATUS = "SELECT completed, COUNT(*) FROM tasks GROUP BY completed"
+NEXT_ID = "SELECT COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'tasks'), 0) + 1"
+UPDATE_TITLE = "UPDATE tasks SET title = ? WHERE id = ?"
+UPDATE_DESCRIPTION = "UPDATE tasks SET description = ? WHERE id = ?"
+UPDATE_FIELDS = ("UPDATE tasks SET title = COALESCE(?, title), "
+                 "description = COALESCE(?, description) WHERE id = ?")
+DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+TOGGLE_TASK = "UPDATE tasks SET completed = 1 - completed WHERE id = ?"
+SELECT_COMPLETED = "SELECT completed FROM tasks WHERE id = ?"
+
+# Full-text index over titles and descriptions, created on the first
+# search and kept up to date by triggers after that
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_search USING fts5(
+    title, description, content='tasks', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_search_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_search (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_search_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_search (tasks_search, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_search_update AFTER UPDATE OF title, description ON tasks BEGIN
+    INSERT INTO tasks_search (tasks_search, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO tasks_search (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+"""
+SEARCH_TABLE_EXISTS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_search'"
+REBUILD_SEARCH = "INSERT INTO tasks_search (tasks_search) VALUES ('rebuild')"
+# Whether a task matches a full-text query, e.g. 'title : "gro"*'
+FULL_TEXT_MATCH = "(id IN (SELECT rowid FROM tasks_search WHERE tasks_search MATCH ?))"
+
+# ORDER BY columns per sortable field, and the index that serves them
+# (created on the first sorted view of the field). Text sorts with
+# SQLite's NOCASE collation, which folds ASCII letters only.
+SORT_COLUMNS = {
+    'id': ('id',),
+    'title': ('title COLLATE NOCASE', 'id'),
+    'description': ('description COLLATE NOCASE', 'id'),
+    'status': ('completed', 'id'),
+}
+SORT_INDEXES = {
+    'title': "CREATE INDEX IF NOT EXISTS idx_tasks_title ON tasks (title COLLATE NOCASE)",
+    'description': "CREATE INDEX IF NOT EXISTS idx_tasks_description ON tasks (description COLLATE NOCASE)",
+}
+# Most IDs bound to one IN (...) query
+MAX_VARIABLES = 500
+
+
+def _row_to_task(row: Tuple) -> Task:
+    """Convert a (id, title, description, completed) row into a Task."""
+    return Task(row[0], row[1], row[2], bool(row[3]))
+
+
+def _row(task: Task) -> Tuple[int, str, str, bool]:
+    """Return the fields needed to put a deleted task back."""
+    return task.id, task.title, task.description, task.completed
+
+
+def _previous_fields(task: Task, title: Optional[str],
+                     description: Optional[str]) -> Tuple[int, Optional[str], Optional[str]]:
+    """Return the update that reverts setting the given fields of a task."""
+    return (task.id, task.title if title is not None else None,
+            task.description if description is not None else None)
+
+
+def _update_fields(title: Optional[str], description: Optional[str]) -> Dict[str, str]:
+    """Return the fields set by an update, for its change event."""
+    fields = {}
+    if title is not None:
+        fields['title'] = title
+    if description is not None:
+        fields['description'] = description
+    return fields
+
+
+class SQLiteTodoManager:
+    """
+    Manages todo tasks in a SQLite database.
+
+    Drop-in alternative to TodoManager with the same method signatures,
+    so TodoUI and TodoGUI can use either one: it searches with an FTS5
+    full-text index, sorts with ORDER BY, notifies change listeners and
+    supports undo, redo and operation statistics. Returned tasks are
+    snapshots of the stored rows; re-read a task after changing it.
+    """
+
+    def __init__(self, path: str = ":memory:", history: Optional[UndoHistory] = None,
+                 stats: Optional[OperationStats] = None):
+        """
+        Open (or create) the task database.
+
+        Args:
+            path (str): Database file path, or ":memory:" for a private database
+            history (UndoHistory | None): Records how to revert each change,
+                for undo() and redo(); None disables undo
+            stats (OperationStats | None): Optional call statistics; see TodoManager
+        """
+        self._conn = sqlite3.connect(path, cached_statements=64)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        # Whether the full-text index exists; False if SQLite lacks FTS5
+        self._full_text: Optional[bool] = True if self._conn.execute(SEARCH_TABLE_EXISTS).fetchone() else None
+        self._events = EventBus()
+        self._history = history
+        self._stats = stats
+        if stats is not None:
+            stats.instrument(self)
+
+    def add_task(self, title: str, description: str = "") -> Task:
+        """
+        Add a new task to the database.
+
+        Args:
+            title (str): The title of the task (required, 1-200 characters)
+            description (str): The description of the task (optional, max 1000 characters)
+
+        Returns:
+            Task: The created task
+
+        Raises:
+            ValueError: If title is empty or exceeds character limits
+        """
+        title = validate_title(title)
+        validate_description(description)
+
+        with self._conn:
+            cursor = self._conn.execute(INSERT_TASK, (None, title, description, 0))
+        task = Task(cursor.lastrowid, title, description)
+        if self._history is not None:
+            self._history.record(DELETE, (task.id,))
+        self._publish_added([task])
+        return task
+
+    def add_tasks(self, items: Iterable[Tuple[str, str]]) -> List[Task]:
+        """
+        Add many tasks in one transaction with a single executemany call.
+
+        Every item is validated before anything is written, so either all
+        tasks are added or none are.
+
+        Args:
+            items (Iterable[tuple[str, str]]): (title, description) pairs
+
+        Returns:
+            list[Task]: The created tasks in the order given
+
+        Raises:
+            ValueError: If any title or description is invalid
+        """
+        validated = [(validate_title(title), validate_description(description))
+                     for title, description in items]
+
+        with self._conn:
+            next_id = self._conn.execute(NEXT_ID).fetchone()[0]
+            tasks = [Task(next_id + offset, title, description)
+                     for offset, (title, description) in enumerate(validated)]
+            self._conn.executemany(INSERT_TASK, (
+                (task.id, task.title, task.description, 0) for task in tasks))
+        if self._history is not None and tasks:
+            self._history.record(DELETE, range(tasks[0].id, tasks[-1].id + 1))
+        self._publish_added(tasks)
+        return tasks
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Return all tasks in insertion order.
+
+        Returns:
+            list[Task]: The stored tasks
+        """
+        return list(self.iter_tasks())
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """
+        Iterate over tasks in insertion order, streaming from the database.
+
+        Args:
+            completed (bool | None): Only yield completed (True) or pending
+                (False) tasks; None yields every task
+
+        Returns:
+            Iterator[Task]: An iterator over the stored tasks
+        """
+        if completed is None:
+            return map(_row_to_task, self._conn.execute(SELECT_ALL))
+        return map(_row_to_task, self._conn.execute(SELECT_BY_STATUS, (int(completed),)))
+
+    def task_count(self) -> int:
+        """
+        Return the number of stored tasks.
+
+        Returns:
+            int: The number of tasks in the database
+        """
+        return self._conn.execute(COUNT_TASKS).fetchone()[0]
+
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        Return how many tasks are completed and how many are pending.
+
+        Returns:
+            dict: {'completed': int, 'pending': int}
+        """
+        counts = dict(self._conn.execute(COUNT_BY_STATUS).fetchall())
+        return {'completed': counts.get(1, 0), 'pending': counts.get(0, 0)}
+
+    def get_task_page(self, offset: int, limit: int, completed: Optional[bool] = None) -> List[Task]:
+        """
+        Return a slice of the task list, e.g. the rows currently on screen.
+
+        Args:
+            offset (int): Position of the first task to return
+            limit (int): Maximum number of tasks to return
+            completed (bool | None): Only count completed (True) or pending
+                (False) tasks; None pages through every task
+
+        Returns:
+            list[Task]: Up to ``limit`` tasks starting at ``offset``
+        """
+        if completed is None:
+            rows = self._conn.execute(SELECT_PAGE, (limit, offset))
+        else:
+            rows = self._conn.execute(SELECT_STATUS_PAGE, (int(completed), limit, offset))
+        return [_row_to_task(row) for row in rows]
+
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """
+        Find and return a single task by ID.
+
+        Args:
+            task_id (int): The ID of the task to retrieve
+
+        Returns:
+            Task | None: The task if found, None otherwise
+        """
+        row = self._conn.execute(SELECT_TASK, (task_id,)).fetchone()
+        return _row_to_task(row) if row else None
+
+    def update_task(self, task_id: int, title: Optional[str] = None,
+                    description: Optional[str] = None) -> bool:
+        """
+        Update task title and/or description.
+
+        Args:
+            task_id (int): The ID of the task to update
+            title (str | None): New title for the task (optional)
+            description (str | None): New description for the task (optional)
+
+        Returns:
+            bool: True if update was successful, False if task not found
+        """
+        task = self.get_task(task_id)
+        if task is None:
+            return False
+
+        # Validate both fields before changing anything
+        if title is not None:
+            title = validate_title(title)
+        if description is not None:
+            validate_description(description)
+
+        with self._conn:
+            if title is not None:
+                self._conn.execute(UPDATE_TITLE, (title, task_id))
+            if description is not None:
+                self._conn.execute(UPDATE_DESCRIPTION, (description, task_id))
+        if self._history is not None:
+            self._history.record(UPDATE, (_previous_fields(task, title, description),))
+        if self._events.active:
+            self._events.publish([ChangeEvent(UPDATED, task_id, _update_fields(title, description))])
+        return True
+
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Remove a task from the database.
+
+        Args:
+            task_id (int): The ID of the task to delete
+
+        Returns:
+            bool: True if deletion was successful, False if task not found
+        """
+        task = self.get_task(task_id) if self._history is not None else None
+        with self._conn:
+            if self._conn.execute(DELETE_TASK, (task_id,)).rowcount == 0:
+                return False
+        if self._history is not None:
+            self._history.record(RESTORE, (_row(task),))
+        if self._events.active:
+            self._events.publish([ChangeEvent(DELETED, task_id, {})])
+        return True
+
+    def toggle_complete(self, task_id: int) -> bool:
+        """
+        Toggle task completion status.
+
+        Args:
+            task_id (int): The ID of the task to toggle
+
+        Returns:
+            bool: True if toggle was successful, False if task not found
+        """
+        with self._conn:
+            if self._conn.execute(TOGGLE_TASK, (task_id,)).rowcount == 0:
+                return False
+        if self._history is not None:
+            self._history.record(TOGGLE, (task_id,))
+        if self._events.active:
+            completed = bool(self._conn.execute(SELECT_COMPLETED, (task_id,)).fetchone()[0])
+            self._events.publish([ChangeEvent(TOGGLED, task_id, {'completed': completed})])
+        return True
+
+    def update_tasks(self, updates: Iterable[Tuple[int, Optional[str], Optional[str]]]) -> bool:
+        """
+        Update many tasks in one transaction.
+
+        Args:
+            updates (Iterable[tuple[int, str | None, str | None]]):
+                (task_id, title, description) triples; None keeps a field
+
+        Returns:
+            bool: True if all tasks were updated, False if any task was not found
+
+        Raises:
+            ValueError: If any title or description is invalid
+        """
+        updates = list(updates)
+        # Check every update in order as TodoManager does: a missing task
+        # returns False before any later update is validated
+        previous = self._fetch(list(dict.fromkeys(task_id for task_id, _, _ in updates)))
+        validated = []
+        for task_id, title, description in updates:
+            if task_id not in previous:
+                return False
+            if title is not None:
+                title = validate_title(title)
+            if description is not None:
+                validate_description(description)
+            validated.append((title, description, task_id))
+
+        if not self._apply_all(UPDATE_FIELDS, validated):
+            return False
+        if self._history is not None and validated:
+            # Reverted last to first, so a task updated twice ends at its first text
+            self._history.record(UPDATE, [_previous_fields(previous[task_id], title, description)
+                                          for title, description, task_id in reversed(validated)])
+        if self._events.active:
+            self._events.publish(ChangeEvent(UPDATED, task_id, _update_fields(title, description))
+                                 for title, description, task_id in validated)
+        return True
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> bool:
+        """
+        Delete many tasks in one transaction.
+
+        Args:
+            task_ids (Iterable[int]): IDs of the tasks to delete
+
+        Returns:
+            bool: True if all tasks were deleted, False if any task was not found
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        previous = self._fetch(task_ids) if self._history is not None else {}
+        if not self._apply_all(DELETE_TASK, [(task_id,) for task_id in task_ids]):
+            return False
+        if self._history is not None and task_ids:
+            self._history.record(RESTORE, [_row(previous[task_id]) for task_id in task_ids])
+        if self._events.active:
+            self._events.publish(ChangeEvent(DELETED, task_id, {}) for task_id in task_ids)
+        return True
+
+    def toggle_many(self, task_ids: Iterable[int]) -> bool:
+        """
+        Toggle the completion status of many tasks in one transaction.
+
+        Args:
+            task_ids (Iterable[int]): IDs of the tasks to toggle
+
+        Returns:
+            bool: True if all tasks were toggled, False if any task was not found
+        """
+        task_ids = list(task_ids)
+        if not self._apply_all(TOGGLE_TASK, [(task_id,) for task_id in task_ids]):
+            return False
+        if self._history is not None and task_ids:
+            self._history.record(TOGGLE, task_ids)
+        if self._events.active:
+            states = {task.id: task.completed for task in self._fetch(task_ids).values()}
+            self._events.publish(ChangeEvent(TOGGLED, task_id, {'completed': states[task_id]})
+                                 for task_id in task_ids)
+        return True
+
+    def get_sorted_page(self, sort_by: str, offset: int, limit: int, descending: bool = False,
+                        completed: Optional[bool] = None) -> List[Task]:
+        """
+        Return a slice of the tasks sorted by a field; see TodoManager.get_sorted_page.
+
+        Text sorts case-insensitively for ASCII letters only (SQLite's
+        NOCASE collation), and ties are broken by ID. The index for a
+        field is created on its first sorted view.
+
+        Raises:
+            ValueError: If sort_by is not a sortable field
+        """
+        direction = " DESC" if descending else ""
+        order = ", ".join(column + direction for column in self._sort_columns(sort_by))
+        where, args = ("", ()) if completed is None else ("WHERE completed = ? ", (int(completed),))
+        rows = self._conn.execute(f"SELECT id, title, description, completed FROM tasks {where}"
+                                  f"ORDER BY {order} LIMIT ? OFFSET ?", args + (limit, max(offset, 0)))
+        return [_row_to_task(row) for row in rows]
+
+    def task_rank(self, task_id: int, sort_by: str) -> Optional[int]:
+        """
+        Return a task's position in the task list sorted by a field; see TodoManager.task_rank.
+
+        Raises:
+            ValueError: If sort_by is not a sortable field
+        """
+        columns = self._sort_columns(sort_by)
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        values = {'id': (task.id,), 'title': (task.title, task.id),
+                  'description': (task.description, task.id), 'status': (int(task.completed), task.id)}[sort_by]
+        placeholders = ", ".join("?" * len(values))
+        return self._conn.execute(f"SELECT COUNT(*) FROM tasks WHERE ({', '.join(columns)}) < ({placeholders})",
+                                  values).fetchone()[0]
+
+    def search(self, query: str, limit: int = 20) -> List[Task]:
+        """
+        Find tasks whose title or description contains every word of the query.
+
+        Words match by prefix ("gro" finds "groceries") and title matches
+        rank first, as in TodoManager.search. The full-text index is
+        created on the first call; without FTS5 support in SQLite, words
+        match anywhere in the text, with a scan of every task.
+
+        Args:
+            query (str): Words to search for
+            limit (int): Maximum number of tasks to return
+
+        Returns:
+            list[Task]: Matching tasks, best match first
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or limit <= 0:
+            return []
+        if self._full_text is None:
+            self._full_text = self._create_search_index()
+        if self._full_text:
+            # Title matches weigh three times as much as description matches, as in SearchIndex
+            title = description = FULL_TEXT_MATCH
+            patterns = [(f'title : "{token}"*', f'description : "{token}"*') for token in tokens]
+            where, where_args = FULL_TEXT_MATCH, [" ".join(f'"{token}"*' for token in tokens)]
+        else:
+            # Tokens are word characters, so only "_" needs escaping
+            title, description = "(title LIKE ? ESCAPE '\\')", "(description LIKE ? ESCAPE '\\')"
+            patterns = [("%" + token.replace("_", "\\_") + "%",) * 2 for token in tokens]
+            where = " AND ".join(f"({title} OR {description})" for _ in tokens)
+            where_args = [pattern for pair in patterns for pattern in pair]
+        score = " + ".join(f"{title} * 3 + {description}" for _ in tokens)
+        rows = self._conn.execute(f"SELECT id, title, description, completed FROM tasks WHERE {where} "
+                                  f"ORDER BY {score} DESC, id LIMIT ?",
+                                  where_args + [pattern for pair in patterns for pattern in pair] + [limit])
+        return [_row_to_task(row) for row in rows]
+
+    def undo(self) -> bool:
+        """
+        Revert the most recent change; see TodoManager.undo.
+
+        Returns:
+            bool: True if a change was undone, False if there is nothing to undo
+        """
+        if self._history is None:
+            return False
+        entry = self._history.pop_undo()
+        if entry is None:
+            return False
+        with self._history.replaying('undo'):
+            self._apply_entry(entry)
+        return True
+
+    def redo(self) -> bool:
+        """
+        Apply again the most recently undone change; see TodoManager.redo.
+
+        Returns:
+            bool: True if a change was redone, False if there is nothing to redo
+        """
+        if self._history is None:
+            return False
+        entry = self._history.pop_redo()
+        if entry is None:
+            return False
+        with self._history.replaying('redo'):
+            self._apply_entry(entry)
+        return True
+
+    def can_undo(self) -> bool:
+        """Check whether there is a change to undo."""
+        return self._history is not None and self._history.can_undo
+
+    def can_redo(self) -> bool:
+        """Check whether there is an undone change to redo."""
+        return self._history is not None and self._history.can_redo
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return the call statistics of every operation used so far; see TodoManager.stats.
+        """
+        return self._stats.snapshot() if self._stats is not None else {}
+
+    def add_change_listener(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Register a callable to be notified of changes; see TodoManager.add_change_listener.
+        """
+        self._events.subscribe(listener)
+
+    def remove_change_listener(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Stop notifying a previously registered listener.
+        """
+        self._events.unsubscribe(listener)
+
+    def batch_changes(self) -> ContextManager[None]:
+        """
+        Deliver the change events of a block of operations as one batch.
+        """
+        return self._events.batch()
+
+    def _apply_entry(self, entry: Entry) -> None:
+        """
+        Apply the inverse deltas of one undo step, last recorded first.
+        """
+        with self.batch_changes():
+            for kind, items in reversed(entry):
+                if kind == DELETE:
+                    self.delete_tasks(items)
+                elif kind == RESTORE:
+                    # Put the rows back with their IDs, so they sort into place
+                    with self._conn:
+                        self._conn.executemany(INSERT_TASK, (
+                            (task_id, title, description, int(completed))
+                            for task_id, title, description, completed in items))
+                    self._history.record(DELETE, [row[0] for row in items])
+                    self._publish_added([Task(*row) for row in items])
+                elif kind == UPDATE:
+                    self.update_tasks(items)
+                elif kind == TOGGLE:
+                    self.toggle_many(items)
+
+    def _publish_added(self, tasks: List[Task]) -> None:
+        """Notify listeners of newly stored tasks."""
+        if self._events.active:
+            self._events.publish(ChangeEvent(ADDED, task.id, {'title': task.title, 'description': task.description,
+                                                              'completed': task.completed}) for task in tasks)
+
+    def _fetch(self, task_ids: Sequence[int]) -> Dict[int, Task]:
+        """Return the given tasks that exist, keyed by ID."""
+        tasks = {}
+        for start in range(0, len(task_ids), MAX_VARIABLES):
+            chunk = task_ids[start:start + MAX_VARIABLES]
+            rows = self._conn.execute("SELECT id, title, description, completed FROM tasks "
+                                      f"WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+            tasks.update((row[0], _row_to_task(row)) for row in rows)
+        return tasks
+
+    def _sort_columns(self, sort_by: str) -> Tuple[str, ...]:
+        """
+        Return the ORDER BY columns of a field, creating its index if needed.
+
+        Raises:
+            ValueError: If sort_by is not a sortable field
+        """
+        columns = SORT_COLUMNS.get(sort_by)
+        if columns is None:
+            raise ValueError(f"Cannot sort by {sort_by!r}; choose one of {', '.join(SORT_COLUMNS)}")
+        index = SORT_INDEXES.get(sort_by)
+        if index is not None:
+            self._conn.execute(index)
+        return columns
+
+    def _create_search_index(self) -> bool:
+        """
+        Create the full-text index and fill it from the stored tasks.
+
+        Returns:
+            bool: False if this SQLite build has no FTS5 support
+        """
+        try:
+            self._conn.executescript(SEARCH_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        with self._conn:
+            self._conn.execute(REBUILD_SEARCH)
+        return True
+
+    def _apply_all(self, statement: str, rows: List[Tuple]) -> bool:
+        """
+        Run a per-task statement for every row, rolling back if any task is missing.
+
+        Returns:
+            bool: True if every row matched a task, False if nothing was changed
+        """
+        with self._conn:
+            cursor = self._conn.executemany(statement, rows)
+            if cursor.rowcount != len(rows):
+                self._conn.rollback()
+                return False
+        return True
+
+    def close(self) -> None:
+        """
+        Close the database connection, then write the final statistics dump.
+        """
+        self._conn.close()
+        if self._stats is not None:
+            self._stats.close()
@@ -0,0 +1,165 @@
+# [Task]: Completion Status Index
+# [From]: plan.md §TodoManager Class, specify.md §F5: Complete Task
+
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+try:
+    from .sorted_index import SortedKeyList
+except ImportError:
+    from sorted_index import SortedKeyList
+
+
+class StatusIndex:
+    """
+    Secondary index from completion status to task IDs.
+
+    Responsibilities:
+    - Keep the set of pending and of completed task IDs
+    - Count tasks per status in O(1)
+    - Provide each status's IDs, or every ID (status None), in ascending
+      order and by position, sorting once and then keeping the order up
+      to date as tasks change
+    - Optionally postpone building the ID sets until they are needed
+
+    An order is built on its first read, as when a filter is opened or a
+    list is scrolled far down, so orders nobody reads cost nothing. From
+    then on a SortedKeyList follows every change, so a toggle or delete
+    moves at most one bucket of IDs. IDs larger than every ordered one,
+    as new tasks get, are appended to a plain list first and moved over
+    in one go when the order is next needed.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._ids: Dict[bool, Set[int]] = {False: set(), True: set()}
+        # Ordered copies of the ID sets, and of their union under None,
+        # built on first use
+        self._ordered: Dict[Optional[bool], Optional[SortedKeyList]] = {False: None, True: None, None: None}
+        # IDs larger than every ordered ID, in the order they were added
+        self._new_ids: Dict[Optional[bool], List[int]] = {False: [], True: [], None: []}
+        # Largest ID ever ordered per status; anything above it is new
+        self._largest: Dict[Optional[bool], int] = {False: 0, True: 0, None: 0}
+        # Set by defer(): builds the ID sets on first use, while only the
+        # counts are kept up to date
+        self._load: Optional[Callable[[], Dict[bool, Set[int]]]] = None
+        self._counts: Dict[bool, int] = {}
+
+    def defer(self, counts: Dict[bool, int], load: Callable[[], Dict[bool, Set[int]]]) -> None:
+        """
+        Postpone building the ID sets until ordered IDs are first needed.
+
+        Until then add() and discard() only adjust the counts, so load()
+        must return the sets as they are when it is called, not as they
+        were when defer() was.
+
+        Args:
+            counts (dict): Current number of tasks per status, {False: n, True: n}
+            load (callable): Returns the current ID sets, {False: set, True: set}
+        """
+        self._counts = dict(counts)
+        self._load = load
+
+    def add(self, task_id: int, completed: bool) -> None:
+        """
+        Record a task under the given status.
+        """
+        if self._load is not None:
+            self._counts[completed] += 1
+            return
+        self._ids[completed].add(task_id)
+        self._insert(completed, task_id)
+        self._insert(None, task_id)
+
+    def discard(self, task_id: int, completed: bool) -> None:
+        """
+        Forget a task recorded under the given status.
+        """
+        if self._load is not None:
+            self._counts[completed] -= 1
+            return
+        ids = self._ids[completed]
+        if task_id not in ids:
+            return
+        ids.discard(task_id)
+        self._remove(completed, task_id)
+        self._remove(None, task_id)
+
+    def move(self, task_id: int, completed: bool) -> None:
+        """
+        Move a recorded task to the given status, e.g. when it is toggled.
+
+        Unlike discard() followed by add(), the order of every ID is left
+        alone, since the task keeps its position there.
+        """
+        if self._load is not None:
+            self._counts[not completed] -= 1
+            self._counts[completed] += 1
+            return
+        if task_id in self._ids[not completed]:
+            self._ids[not completed].discard(task_id)
+            self._remove(not completed, task_id)
+        self._ids[completed].add(task_id)
+        self._insert(completed, task_id)
+
+    def count(self, completed: bool) -> int:
+        """
+        Return the number of tasks with the given status.
+        """
+        if self._load is not None:
+            return self._counts[completed]
+        return len(self._ids[completed])
+
+    def ordered_ids(self, completed: Optional[bool]) -> Iterator[int]:
+        """
+        Iterate over the IDs of the tasks with the given status, or of
+        every task if the status is None, in ascending order.
+
+        The index must not change while the iterator is in use.
+        """
+        return chain(self._order(completed), self._new_ids[completed])
+
+    def page(self, completed: Optional[bool], offset: int, limit: int) -> List[int]:
+        """
+        Return up to ``limit`` IDs with the given status, or of any status
+        if it is None, starting at position ``offset`` in ascending order.
+        """
+        ordered = self._order(completed)
+        self._merge_new(completed)
+        return ordered.slice(offset, offset + limit)
+
+    def _order(self, completed: Optional[bool]) -> SortedKeyList:
+        """Return a status's ordered IDs, building them on first use."""
+        if self._load is not None:
+            self._ids, self._load = self._load(), None
+        ordered = self._ordered[completed]
+        if ordered is None:
+            ids = self._ids[False] | self._ids[True] if completed is None else self._ids[completed]
+            ordered = self._ordered[completed] = SortedKeyList(ids)
+            self._largest[completed] = max(ids, default=0)
+        return ordered
+
+    def _insert(self, completed: Optional[bool], task_id: int) -> None:
+        """Add an ID to an order, if that order has been built."""
+        ordered = self._ordered[completed]
+        if ordered is None:
+            return
+        if task_id > self._largest[completed]:
+            self._largest[completed] = task_id
+            self._new_ids[completed].append(task_id)
+            return
+        self._merge_new(completed)
+        ordered.add(task_id)
+
+    def _remove(self, completed: Optional[bool], task_id: int) -> None:
+        """Remove an ID from an order, if that order has been built."""
+        ordered = self._ordered[completed]
+        if ordered is not None:
+            self._merge_new(completed)
+            ordered.remove(task_id)
+
+    def _merge_new(self, completed: Optional[bool]) -> None:
+        """Move the IDs added since the last merge into the ordered list."""
+        if self._new_ids[completed]:
+            self._ordered[completed].extend(self._new_ids[completed])
+            self._new_ids[completed] = []
@@ -0,0 +1,131 @@
+# [Task]: Compact Task Record
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+import heapq
+from collections.abc import Mapping, MutableMapping
+from operator import attrgetter
+from typing import Dict, Iterator, List
+
+# Field order matches the original task dictionary shape
+TASK_FIELDS = ('id', 'title', 'description', 'completed')
+
+MAX_TITLE_LENGTH = 200
+MAX_DESCRIPTION_LENGTH = 1000
+
+
+def validate_title(title: str) -> str:
+    """
+    Validate a task title and return it stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If title is empty or exceeds 200 characters
+    """
+    if not title or len(title.strip()) == 0:
+        raise ValueError("Title cannot be empty")
+    if len(title) > MAX_TITLE_LENGTH:
+        raise ValueError("Title cannot exceed 200 characters")
+    return title.strip()
+
+
+def validate_description(description: str) -> str:
+    """
+    Validate a task description and return it unchanged.
+
+    Raises:
+        ValueError: If description exceeds 1000 characters
+    """
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        raise ValueError("Description cannot exceed 1000 characters")
+    return description
+
+
+def insert_in_id_order(store: MutableMapping[int, "Task"], tasks: List["Task"]) -> None:
+    """
+    Add new tasks to a store kept in ascending ID order.
+
+    Tasks with IDs above every stored one are simply appended. Lower IDs
+    (tasks put back by undo, or replayed after them) are moved into place
+    by taking the stored tasks with higher IDs off the end of the dict and
+    adding them back after the new ones, so the cost grows with the
+    number of tasks moved. Stores other than dicts, such as SnapshotTasks,
+    keep ID order themselves.
+
+    Args:
+        store (MutableMapping[int, Task]): Tasks keyed by ID
+        tasks (list[Task]): The new tasks, in any order
+    """
+    if type(store) is not dict:
+        store.update((task.id, task) for task in tasks)
+        return
+    by_id = attrgetter('id')
+    tasks = sorted(tasks, key=by_id)
+    if tasks and store and next(reversed(store)) > tasks[0].id:
+        later = []
+        while store and next(reversed(store)) > tasks[0].id:
+            later.append(store.popitem()[1])
+        tasks = heapq.merge(tasks, reversed(later), key=by_id)
+    store.update((task.id, task) for task in tasks)
+
+
+class Task(Mapping):
+    """
+    A single todo task stored with __slots__ instead of a per-task dict.
+
+    Tasks behave as read-only mappings, so existing code that reads
+    task['id'], task['title'], etc. keeps working unchanged. Use
+    to_dict() when a real dictionary is needed.
+    """
+
+    __slots__ = TASK_FIELDS
+
+    def __init__(self, task_id: int, title: str, description: str = "", completed: bool = False):
+        """
+        Initialize a task record.
+
+        Args:
+            task_id (int): The unique ID of the task
+            title (str): The title of the task
+            description (str): The description of the task
+            completed (bool): Whether the task is completed
+        """
+        self.id = task_id
+        self.title = title
+        self.description = description
+        self.completed = completed
+
+    def __getitem__(self, key: str):
+        """
+        Return a field value by name, mirroring dictionary access.
+
+        Raises:
+            KeyError: If key is not one of the task fields
+        """
+        if key not in TASK_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names in dictionary order."""
+        return iter(TASK_FIELDS)
+
+    def __len__(self) -> int:
+        """Return the number of fields in a task."""
+        return len(TASK_FIELDS)
+
+    def __repr__(self) -> str:
+        """Return a dictionary-like representation of the task."""
+        return f"Task({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict:
+        """
+        Return the task as a plain dictionary.
+
+        Returns:
+            dict: A new dictionary with id, title, description and completed
+        """
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'completed': self.completed
+        }
@@ -0,0 +1,211 @@
+# [Task]: Task Import/Export
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+import csv
+import json
+import os
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    from .task import Task, validate_description, validate_title
+except ImportError:
+    from task import Task, validate_description, validate_title
+
+FORMATS = ('jsonl', 'csv')
+CSV_FIELDS = ['id', 'title', 'description', 'completed']
+
+# Tasks validated and added per add_tasks() call while importing
+BATCH_SIZE = 10_000
+
+# Read/write buffer size, so multi-gigabyte files stream in large chunks
+BUFFER_SIZE = 1 << 20
+
+# Values of the CSV 'completed' column read as True (case-insensitive)
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 'done', 'x'}
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """
+    Return the file format, taken from fmt or else from the file extension.
+
+    Args:
+        path (str): The file path, e.g. "tasks.csv"
+        fmt (str | None): An explicit format, 'jsonl' or 'csv'
+
+    Returns:
+        str: 'jsonl' or 'csv'
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt is None:
+        extension = os.path.splitext(path)[1].lower().lstrip('.')
+        fmt = 'jsonl' if extension in ('json', 'ndjson') else extension
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', expected one of: {', '.join(FORMATS)}")
+    return fmt
+
+
+def read_tasks(stream: TextIO, fmt: str) -> Iterator[Tuple[int, str, str, bool]]:
+    """
+    Stream task rows from a JSON Lines or CSV file, one line at a time.
+
+    JSON lines are objects with a "title" and optional "description" and
+    "completed"; CSV files have a header row naming at least a title
+    column. Any id field is ignored, since imported tasks get new IDs.
+
+    Args:
+        stream (TextIO): The open file; CSV files should be opened with newline=""
+        fmt (str): 'jsonl' or 'csv'
+
+    Returns:
+        Iterator[tuple[int, str, str, bool]]: (line number, title,
+        description, completed) per task; the text is not validated yet
+
+    Raises:
+        ValueError: If a line cannot be parsed
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        if reader.fieldnames is None or 'title' not in reader.fieldnames:
+            raise ValueError("line 1: CSV header must include a 'title' column")
+        for row in reader:
+            completed = (row.get('completed') or '').strip().lower() in TRUE_VALUES
+            yield reader.line_num, row['title'] or "", row.get('description') or "", completed
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            title = record['title']
+            description = record.get('description', "")
+            completed = record.get('completed', False)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise ValueError(f"line {line_number}: expected a JSON object with a title") from None
+        if not isinstance(title, str) or not isinstance(description, str):
+            raise ValueError(f"line {line_number}: title and description must be strings")
+        yield line_number, title, description, bool(completed)
+
+
+def write_tasks(tasks: Iterable[Task], stream: TextIO, fmt: str) -> int:
+    """
+    Stream tasks to a JSON Lines or CSV file.
+
+    Args:
+        tasks (Iterable[Task]): The tasks to write, e.g. manager.iter_tasks()
+        stream (TextIO): The open file; CSV files should be opened with newline=""
+        fmt (str): 'jsonl' or 'csv'
+
+    Returns:
+        int: Number of tasks written
+    """
+    count = 0
+    if fmt == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(CSV_FIELDS)
+        for task in tasks:
+            writer.writerow((task['id'], task['title'], task['description'], int(task['completed'])))
+            count += 1
+        return count
+
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    for task in tasks:
+        stream.write(encode({'id': task['id'], 'title': task['title'],
+                             'description': task['description'], 'completed': task['completed']}) + "\n")
+        count += 1
+    return count
+
+
+def import_tasks(manager, rows: Iterable[Tuple[int, str, str, bool]], batch_size: int = BATCH_SIZE) -> int:
+    """
+    Add streamed task rows to a manager in validated batches.
+
+    Each batch is validated and added by one add_tasks() call, so the
+    title and description limits are the same as for add_task. Only one
+    batch is held in memory at a time. If a row is invalid, the batches
+    before it stay imported and nothing from its own batch is added.
+
+    Args:
+        manager: The TodoManager (or compatible manager) to add tasks to
+        rows (Iterable): (line number, title, description, completed) tuples
+        batch_size (int): Number of rows added per batch
+
+    Returns:
+        int: Number of tasks imported
+
+    Raises:
+        ValueError: If a row is invalid; the message starts with its line number
+    """
+    rows = iter(rows)
+    imported = 0
+    while True:
+        batch: List[Tuple[int, str, str, bool]] = list(islice(rows, batch_size))
+        if not batch:
+            return imported
+        try:
+            tasks = manager.add_tasks([(title, description) for _, title, description, _ in batch])
+        except ValueError:
+            raise _locate_error(batch) from None
+        done = [task['id'] for task, row in zip(tasks, batch) if row[3]]
+        if done:
+            manager.toggle_many(done)
+        imported += len(tasks)
+
+
+def import_file(manager, path: str, fmt: Optional[str] = None, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Import tasks from a JSON Lines or CSV file.
+
+    Args:
+        manager: The TodoManager (or compatible manager) to add tasks to
+        path (str): The file to read
+        fmt (str | None): 'jsonl' or 'csv'; taken from the extension if omitted
+        batch_size (int): Number of rows added per batch
+
+    Returns:
+        int: Number of tasks imported
+
+    Raises:
+        ValueError: If the format is unknown or a row is invalid
+        OSError: If the file cannot be read
+    """
+    fmt = detect_format(path, fmt)
+    with open(path, encoding="utf-8", newline="", buffering=BUFFER_SIZE) as stream:
+        return import_tasks(manager, read_tasks(stream, fmt), batch_size)
+
+
+def export_file(manager, path: str, fmt: Optional[str] = None) -> int:
+    """
+    Export every task to a JSON Lines or CSV file.
+
+    Args:
+        manager: The TodoManager (or compatible manager) to export
+        path (str): The file to write; an existing file is replaced
+        fmt (str | None): 'jsonl' or 'csv'; taken from the extension if omitted
+
+    Returns:
+        int: Number of tasks exported
+
+    Raises:
+        ValueError: If the format is unknown
+        OSError: If the file cannot be written
+    """
+    fmt = detect_format(path, fmt)
+    with open(path, "w", encoding="utf-8", newline="", buffering=BUFFER_SIZE) as stream:
+        return write_tasks(manager.iter_tasks(), stream, fmt)
+
+
+def _locate_error(batch: List[Tuple[int, str, str, bool]]) -> ValueError:
+    """
+    Find the first invalid row of a rejected batch and describe it.
+    """
+    for line_number, title, description, _ in batch:
+        try:
+            validate_title(title)
+            validate_description(description)
+        except ValueError as e:
+            return ValueError(f"line {line_number}: {e}")
+    return ValueError("invalid task in batch")
@@ -1,168 +1,844 @@
-# [Task]: T-010
-# [From]: specify.md §F5: Complete Task, plan.md §TodoManager Class
-
-from typing import Dict, List, Optional
-
-
-class TodoManager:
-    """
-    Manages todo tasks in memory.
-    
-    Responsibilities:
-    - Store tasks in memory
-    - Generate unique IDs for tasks
-    - Provide methods to manipulate tasks
-    """
-    
-    def __init__(self):
-        """Initialize the TodoManager with an empty task list and starting ID."""
-        self._tasks: List[Dict] = []
-        self._next_id: int = 1
-    
-    def add_task(self, title: str, description: str = "") -> Dict:
-        """
-        Add a new task to the task list.
-        
-        Args:
-            title (str): The title of the task (required, 1-200 characters)
-            description (str): The description of the task (optional, max 1000 characters)
-            
-        Returns:
-            dict: The created task dictionary
-            
-        Raises:
-            ValueError: If title is empty or exceeds character limits
-        """
-        # Validate title
-        if not title or len(title.strip()) == 0:
-            raise ValueError("Title cannot be empty")
-        
-        if len(title) > 200:
-            raise ValueError("Title cannot exceed 200 characters")
-        
-        if len(description) > 1000:
-            raise ValueError("Description cannot exceed 1000 characters")
-        
-        # Create task dictionary with auto-incrementing ID
-        task = {
-            'id': self._next_id,
-            'title': title.strip(),
-            'description': description,
-            'completed': False
-        }
-        
-        # Add to tasks list
-        self._tasks.append(task)
-        
-        # Increment the next ID
-        self._next_id += 1
-        
-        # Return the created task
-        return task
-    
-    def get_all_tasks(self) -> List[Dict]:
-        """
-        Return all tasks from memory.
-        
-        Returns:
-            list[dict]: A copy of the tasks list to prevent external modification
-        """
-        # Return a copy of the tasks list to prevent external modification
-        return self._tasks.copy()
-    
-    def get_task(self, task_id: int) -> Optional[Dict]:
-        """
-        Find and return a single task by ID.
-        
-        Args:
-            task_id (int): The ID of the task to retrieve
-            
-        Returns:
-            dict | None: The task dictionary if found, None otherwise
-        """
-        # Search _tasks for matching ID
-        for task in self._tasks:
-            if task['id'] == task_id:
-                return task
-        # Return None if task not found
-        return None
-    
-    def update_task(self, task_id: int, title: Optional[str] = None, 
-                   description: Optional[str] = None) -> bool:
-        """
-        Update task title and/or description.
-        
-        Args:
-            task_id (int): The ID of the task to update
-            title (str | None): New title for the task (optional)
-            description (str | None): New description for the task (optional)
-            
-        Returns:
-            bool: True if update was successful, False if task not found
-        """
-        # Find the task to update
-        task = self.get_task(task_id)
-        
-        # Return False if task doesn't exist
-        if task is None:
-            return False
-        
-        # Update title if provided
-        if title is not None:
-            if not title or len(title.strip()) == 0:
-                raise ValueError("Title cannot be empty")
-            if len(title) > 200:
-                raise ValueError("Title cannot exceed 200 characters")
-            task['title'] = title.strip()
-        
-        # Update description if provided
-        if description is not None:
-            if len(description) > 1000:
-                raise ValueError("Description cannot exceed 1000 characters")
-            task['description'] = description
-        
-        # Return True to indicate successful update
-        return True
-    
-    def delete_task(self, task_id: int) -> bool:
-        """
-        Remove a task from the list.
-        
-        Args:
-            task_id (int): The ID of the task to delete
-            
-        Returns:
-            bool: True if deletion was successful, False if task not found
-        """
-        # Find the index of the task with the given ID
-        for i, task in enumerate(self._tasks):
-            if task['id'] == task_id:
-                # Remove the task from the list
-                del self._tasks[i]
-                return True
-        # Return False if task not found
-        return False
-    
-    def toggle_complete(self, task_id: int) -> bool:
-        """
-        Toggle task completion status.
-        
-        Args:
-            task_id (int): The ID of the task to toggle
-            
-        Returns:
-            bool: True if toggle was successful, False if task not found
-        """
-        # Find the task to toggle
-        task = self.get_task(task_id)
-        
-        # Return False if task doesn't exist
-        if task is None:
-            return False
-        
-        # Toggle the 'completed' field
-        task['completed'] = not task['completed']
-        
-        # Return True to indicate successful toggle
-        return True
-
+# [Task]: T-010
+# [From]: specify.md §F5: Complete Task, plan.md §TodoManager Class
+
+from itertools import islice
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
+
+try:
+    from .events import ADDED, DELETED, TOGGLED, UPDATED, ChangeEvent, EventBus
+    from .history import DELETE, RESTORE, TOGGLE, UPDATE, Entry, UndoHistory
+    from .instrumentation import OperationStats
+    from .search_index import SearchIndex
+    from .sorted_index import SORT_KEYS, SortedKeyList
+    from .status_index import StatusIndex
+    from .task import Task, insert_in_id_order, validate_description, validate_title
+except ImportError:
+    from events import ADDED, DELETED, TOGGLED, UPDATED, ChangeEvent, EventBus
+    from history import DELETE, RESTORE, TOGGLE, UPDATE, Entry, UndoHistory
+    from instrumentation import OperationStats
+    from search_index import SearchIndex
+    from sorted_index import SORT_KEYS, SortedKeyList
+    from status_index import StatusIndex
+    from task import Task, insert_in_id_order, validate_description, validate_title
+
+# Change event kind for each change record operation
+CHANGE_KINDS = {'add': ADDED, 'update': UPDATED, 'delete': DELETED, 'toggle': TOGGLED}
+
+# Unfiltered pages starting further down than this come from the ordered
+# ID index rather than from skipping over the store
+SCAN_OFFSET = 1_000
+
+
+class TodoManager:
+    """
+    Manages todo tasks in memory.
+    
+    Responsibilities:
+    - Store tasks in memory as compact Task records
+    - Generate unique IDs for tasks
+    - Provide methods to manipulate tasks
+    - Record every change to an optional persistence backend
+    - Search task titles and descriptions
+    - Track which tasks are pending and which are completed
+    - Keep tasks sorted by title, description, status or ID for sorted views
+    - Notify listeners about every change
+    - Undo and redo changes, when given an undo history
+    - Time its operations, when given operation statistics
+    """
+    
+    # Class of the completion status index; subclasses may swap in their own
+    _status_index_type = StatusIndex
+    
+    def __init__(self, storage=None, history: Optional[UndoHistory] = None,
+                 stats: Optional[OperationStats] = None):
+        """
+        Initialize the TodoManager with an empty task store and starting ID.
+        
+        Args:
+            storage: Optional persistence backend (e.g. JournalStorage). When
+                given, its saved state is loaded and every change is recorded.
+            history (UndoHistory | None): Records how to revert each change,
+                for undo() and redo(); None disables undo
+            stats (OperationStats | None): Collects call counts, latencies
+                and copied list sizes, read with stats(); None leaves the
+                methods unwrapped
+        """
+        # Tasks keyed by ID; dicts keep insertion order for get_all_tasks().
+        # A backend may hand over a dict-like store instead (see SnapshotTasks).
+        self._tasks: MutableMapping[int, Task] = {}
+        self._next_id: int = 1
+        self._storage = storage
+        # Full-text index, built on the first search and kept up to date after
+        self._search_index: Optional[SearchIndex] = None
+        # Task IDs per completion status, for filtered views and counts
+        self._status_index = self._status_index_type()
+        # Sort keys per (field, grouped by status), built on the first
+        # sorted view of that kind and kept up to date after
+        self._sorted_indexes: Dict[Tuple[str, bool], SortedKeyList] = {}
+        # Delivers change events to listeners in coalesced batches
+        self._events = EventBus()
+        self._history = history
+        self._stats = stats
+        if stats is not None:
+            stats.instrument(self)
+        
+        # Restore previously saved tasks from the backend
+        if storage is not None:
+            self._tasks, self._next_id = storage.load()
+            status_ids = getattr(self._tasks, 'status_ids', None)
+            if status_ids is not None:
+                # A lazily loaded store is only scanned when a filtered view needs it
+                completed = self._tasks.count_completed()
+                self._status_index.defer({False: len(self._tasks) - completed, True: completed}, status_ids)
+            else:
+                for task in self._tasks.values():
+                    self._status_index.add(task.id, task.completed)
+    
+    def add_task(self, title: str, description: str = "") -> Task:
+        """
+        Add a new task to the task list.
+        
+        Args:
+            title (str): The title of the task (required, 1-200 characters)
+            description (str): The description of the task (optional, max 1000 characters)
+            
+        Returns:
+            Task: The created task, readable like a dictionary
+            
+        Raises:
+            ValueError: If title is empty or exceeds character limits
+        """
+        # Validate title and description
+        title = validate_title(title)
+        validate_description(description)
+        
+        # Create task record with auto-incrementing ID
+        task = Task(self._allocate_ids(1), title, description)
+        
+        # Add to the task store
+        self._tasks[task.id] = task
+        self._status_index.add(task.id, False)
+        self._index(task)
+        if self._history is not None:
+            self._history.record(DELETE, (task.id,))
+        
+        self._record(self._add_record(task))
+        
+        # Return the created task
+        return task
+    
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Return all tasks from memory.
+        
+        Returns:
+            list[Task]: A copy of the tasks list to prevent external modification
+        """
+        # Return a copy of the tasks list to prevent external modification
+        return list(self._tasks.values())
+    
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """
+        Iterate over tasks in insertion order without copying the list.
+        
+        Tasks are read-only mappings, so callers cannot modify the store
+        through the iterator. Do not add or delete tasks while iterating.
+        
+        Args:
+            completed (bool | None): Only yield completed (True) or pending
+                (False) tasks; None yields every task
+            
+        Returns:
+            Iterator[Task]: An iterator over the stored tasks
+        """
+        if completed is None:
+            return iter(self._tasks.values())
+        # Only touch the tasks with the requested status, in ID order
+        return map(self._tasks.__getitem__, self._status_index.ordered_ids(completed))
+    
+    def task_count(self) -> int:
+        """
+        Return the number of stored tasks.
+        
+        Returns:
+            int: The number of tasks in memory
+        """
+        return len(self._tasks)
+    
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        Return how many tasks are completed and how many are pending.
+        
+        Returns:
+            dict: {'completed': int, 'pending': int}
+        """
+        return {'completed': self._status_index.count(True), 'pending': self._status_index.count(False)}
+    
+    def get_task_page(self, offset: int, limit: int, completed: Optional[bool] = None) -> List[Task]:
+        """
+        Return a slice of the task list, e.g. the rows currently on screen.
+        
+        Pages come from ID-ordered indexes that are built on first use and
+        updated with every change, so a page far down the list costs
+        O(log n + limit) rather than a walk over the tasks before it.
+        
+        Args:
+            offset (int): Position of the first task to return
+            limit (int): Maximum number of tasks to return
+            completed (bool | None): Only count completed (True) or pending
+                (False) tasks; None pages through every task
+            
+        Returns:
+            list[Task]: Up to ``limit`` tasks starting at ``offset``
+        """
+        if completed is None and offset < SCAN_OFFSET:
+            # Near the top skipping over IDs is cheaper than building the
+            # ordered index; the store is kept in ID order
+            ids = islice(self._tasks, max(offset, 0), max(offset + limit, 0))
+        else:
+            ids = self._status_index.page(completed, offset, limit)
+        # Only the tasks on the page are looked up, so stores that decode
+        # lazily only decode those
+        return [self._tasks[task_id] for task_id in ids]
+    
+    def get_sorted_page(self, sort_by: str, offset: int, limit: int, descending: bool = False,
+                        completed: Optional[bool] = None) -> List[Task]:
+        """
+        Return a slice of the tasks sorted by a field, e.g. tasks 5000-5050 by title.
+        
+        The sort order is kept in an index that is built on first use and
+        updated with every change, so a page costs O(log n + limit)
+        rather than a sort of the whole list.
+        
+        Args:
+            sort_by (str): 'id', 'title', 'description' or 'status'; text
+                sorts case-insensitively and ties are broken by ID
+            offset (int): Position of the first task to return
+            limit (int): Maximum number of tasks to return
+            descending (bool): Sort from the largest value down
+            completed (bool | None): Only count completed (True) or pending
+                (False) tasks; None pages through every task
+            
+        Returns:
+            list[Task]: Up to ``limit`` tasks starting at ``offset``
+            
+        Raises:
+            ValueError: If sort_by is not a sortable field
+        """
+        keys, start, stop = self._sorted_range(sort_by, completed)
+        offset = max(offset, 0)
+        if descending:
+            page = keys.slice(max(stop - offset - limit, start), stop - offset)[::-1]
+        else:
+            page = keys.slice(start + offset, min(start + offset + limit, stop))
+        return [self._tasks[key[-1]] for key in page]
+    
+    def task_rank(self, task_id: int, sort_by: str) -> Optional[int]:
+        """
+        Return a task's position in the task list sorted by a field.
+        
+        Args:
+            task_id (int): The ID of the task
+            sort_by (str): 'id', 'title', 'description' or 'status'
+            
+        Returns:
+            int | None: The zero-based ascending position, None if task not found
+            
+        Raises:
+            ValueError: If sort_by is not a sortable field
+        """
+        keys, _, _ = self._sorted_range(sort_by, None)
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        return keys.rank(SORT_KEYS[sort_by](task))
+    
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """
+        Find and return a single task by ID.
+        
+        Args:
+            task_id (int): The ID of the task to retrieve
+            
+        Returns:
+            Task | None: The task if found, None otherwise
+        """
+        # Look up the task by ID, None if not found
+        return self._tasks.get(task_id)
+    
+    def update_task(self, task_id: int, title: Optional[str] = None, 
+                   description: Optional[str] = None) -> bool:
+        """
+        Update task title and/or description.
+        
+        Args:
+            task_id (int): The ID of the task to update
+            title (str | None): New title for the task (optional)
+            description (str | None): New description for the task (optional)
+            
+        Returns:
+            bool: True if update was successful, False if task not found
+        """
+        # Find the task to update
+        task = self.get_task(task_id)
+        
+        # Return False if task doesn't exist
+        if task is None:
+            return False
+        
+        # Validate both fields before changing anything
+        if title is not None:
+            title = validate_title(title)
+        if description is not None:
+            validate_description(description)
+        
+        self._unindex(task)
+        if self._history is not None:
+            self._history.record(UPDATE, (self._previous_fields(task, title, description),))
+        
+        # Update title if provided
+        if title is not None:
+            task.title = title
+        
+        # Update description if provided
+        if description is not None:
+            task.description = description
+        
+        self._index(task)
+        self._record(self._update_record(task_id, title, description))
+        
+        # Return True to indicate successful update
+        return True
+    
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Remove a task from the list.
+        
+        Args:
+            task_id (int): The ID of the task to delete
+            
+        Returns:
+            bool: True if deletion was successful, False if task not found
+        """
+        # Remove the task from the store, False if task not found
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+        
+        self._status_index.discard(task_id, task.completed)
+        self._unindex(task)
+        if self._history is not None:
+            self._history.record(RESTORE, (self._row(task),))
+        self._record({'op': 'delete', 'id': task_id})
+        return True
+    
+    def toggle_complete(self, task_id: int) -> bool:
+        """
+        Toggle task completion status.
+        
+        Args:
+            task_id (int): The ID of the task to toggle
+            
+        Returns:
+            bool: True if toggle was successful, False if task not found
+        """
+        # Find the task to toggle
+        task = self.get_task(task_id)
+        
+        # Return False if task doesn't exist
+        if task is None:
+            return False
+        
+        # Toggle the 'completed' field
+        self._set_completed(task, not task.completed)
+        if self._history is not None:
+            self._history.record(TOGGLE, (task_id,))
+        self._record({'op': 'toggle', 'id': task_id})
+        
+        # Return True to indicate successful toggle
+        return True
+    
+    def add_tasks(self, items: Iterable[Tuple[str, str]]) -> List[Task]:
+        """
+        Add many tasks at once, assigning their IDs in one contiguous block.
+        
+        Every item is validated before anything is added, so either all
+        tasks are added or none are.
+        
+        Args:
+            items (Iterable[tuple[str, str]]): (title, description) pairs
+            
+        Returns:
+            list[Task]: The created tasks in the order given
+            
+        Raises:
+            ValueError: If any title or description is invalid
+        """
+        # Validate every item in one pass before changing anything
+        validated = [(validate_title(title), validate_description(description))
+                     for title, description in items]
+        
+        # Create the task records with a block of consecutive IDs
+        first_id = self._allocate_ids(len(validated))
+        tasks = [Task(first_id + offset, title, description)
+                 for offset, (title, description) in enumerate(validated)]
+        self._insert_tasks(tasks)
+        if self._history is not None and tasks:
+            # The block of new IDs is kept as a range, whatever its length
+            self._history.record(DELETE, range(first_id, first_id + len(tasks)))
+        return tasks
+    
+    def update_tasks(self, updates: Iterable[Tuple[int, Optional[str], Optional[str]]]) -> bool:
+        """
+        Update many tasks at once.
+        
+        Every update is checked before anything changes: if a task is
+        missing nothing is updated and False is returned, and an invalid
+        title or description raises ValueError with nothing updated.
+        
+        Args:
+            updates (Iterable[tuple[int, str | None, str | None]]):
+                (task_id, title, description) triples; None keeps a field
+            
+        Returns:
+            bool: True if all tasks were updated, False if any task was not found
+            
+        Raises:
+            ValueError: If any title or description is invalid
+        """
+        # Look up and validate every update before changing anything
+        validated = []
+        for task_id, title, description in updates:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return False
+            if title is not None:
+                title = validate_title(title)
+            if description is not None:
+                validate_description(description)
+            validated.append((task, title, description))
+        
+        if self._history is not None and validated:
+            # Reverted last to first, so a task updated twice ends at its first text
+            self._history.record(UPDATE, [self._previous_fields(task, title, description)
+                                          for task, title, description in reversed(validated)])
+        
+        for task, title, description in validated:
+            self._unindex(task)
+            if title is not None:
+                task.title = title
+            if description is not None:
+                task.description = description
+            self._index(task)
+        
+        self._record_batch(self._update_record(task.id, title, description)
+                           for task, title, description in validated)
+        return True
+    
+    def delete_tasks(self, task_ids: Iterable[int]) -> bool:
+        """
+        Delete many tasks at once.
+        
+        If any task is missing nothing is deleted.
+        
+        Args:
+            task_ids (Iterable[int]): IDs of the tasks to delete
+            
+        Returns:
+            bool: True if all tasks were deleted, False if any task was not found
+        """
+        # Drop duplicate IDs while keeping their order
+        task_ids = list(dict.fromkeys(task_ids))
+        if not self._tasks.keys() >= set(task_ids):
+            return False
+        
+        if self._history is not None and task_ids:
+            self._history.record(RESTORE, [self._row(self._tasks[task_id]) for task_id in task_ids])
+        
+        # Remove all tasks in one sweep
+        for task_id in task_ids:
+            task = self._tasks.pop(task_id)
+            self._status_index.discard(task_id, task.completed)
+            self._unindex(task)
+        
+        self._record_batch({'op': 'delete', 'id': task_id} for task_id in task_ids)
+        return True
+    
+    def toggle_many(self, task_ids: Iterable[int]) -> bool:
+        """
+        Toggle the completion status of many tasks at once.
+        
+        If any task is missing nothing is toggled.
+        
+        Args:
+            task_ids (Iterable[int]): IDs of the tasks to toggle
+            
+        Returns:
+            bool: True if all tasks were toggled, False if any task was not found
+        """
+        try:
+            tasks = [self._tasks[task_id] for task_id in task_ids]
+        except KeyError:
+            return False
+        
+        for task in tasks:
+            self._set_completed(task, not task.completed)
+        if self._history is not None and tasks:
+            self._history.record(TOGGLE, [task.id for task in tasks])
+        
+        self._record_batch({'op': 'toggle', 'id': task.id} for task in tasks)
+        return True
+    
+    def search(self, query: str, limit: int = 20) -> List[Task]:
+        """
+        Find tasks whose title or description contains every word of the query.
+        
+        Words match by prefix ("gro" finds "groceries") and results are
+        ranked with title matches first. The search index is built on the
+        first call and updated incrementally afterwards.
+        
+        Args:
+            query (str): Words to search for
+            limit (int): Maximum number of tasks to return
+            
+        Returns:
+            list[Task]: Matching tasks, best match first
+        """
+        if self._search_index is None:
+            self._build_search_index()
+        return [self._tasks[task_id] for task_id in self._search_index.search(query, limit)]
+    
+    def undo(self) -> bool:
+        """
+        Revert the most recent change (a bulk operation counts as one).
+        
+        Only the change's inverse delta is applied, so undoing costs the
+        same as the change itself, however many tasks there are.
+        
+        Returns:
+            bool: True if a change was undone, False if there is nothing to undo
+        """
+        if self._history is None:
+            return False
+        entry = self._history.pop_undo()
+        if entry is None:
+            return False
+        with self._history.replaying('undo'):
+            self._apply_entry(entry)
+        return True
+    
+    def redo(self) -> bool:
+        """
+        Apply again the most recently undone change.
+        
+        Making any other change after an undo discards the redo steps.
+        
+        Returns:
+            bool: True if a change was redone, False if there is nothing to redo
+        """
+        if self._history is None:
+            return False
+        entry = self._history.pop_redo()
+        if entry is None:
+            return False
+        with self._history.replaying('redo'):
+            self._apply_entry(entry)
+        return True
+    
+    def can_undo(self) -> bool:
+        """
+        Check whether there is a change to undo.
+        
+        Returns:
+            bool: True if undo() would revert a change
+        """
+        return self._history is not None and self._history.can_undo
+    
+    def can_redo(self) -> bool:
+        """
+        Check whether there is an undone change to redo.
+        
+        Returns:
+            bool: True if redo() would apply a change again
+        """
+        return self._history is not None and self._history.can_redo
+    
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return the call statistics of every operation used so far.
+        
+        Returns:
+            dict: Mapping of method name to its call count, p50/p95/p99 and
+                max latency in microseconds and tasks copied into returned
+                lists (see OperationStats.snapshot); empty when the manager
+                was created without operation statistics
+        """
+        return self._stats.snapshot() if self._stats is not None else {}
+    
+    def add_change_listener(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Register a callable to be notified of changes.
+        
+        The listener is called as listener(events) with a list of
+        ChangeEvent tuples (kind, task_id, fields). A bulk operation, or
+        every change inside a batch_changes() block, arrives as one list in
+        which several changes to the same task are merged into one event.
+        
+        Args:
+            listener (callable): The function to notify
+        """
+        self._events.subscribe(listener)
+    
+    def remove_change_listener(self, listener: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Stop notifying a previously registered listener.
+        
+        Args:
+            listener (callable): The function to stop notifying
+        """
+        self._events.unsubscribe(listener)
+    
+    def batch_changes(self) -> ContextManager[None]:
+        """
+        Deliver the change events of a block of operations as one batch.
+        
+        Example:
+            with manager.batch_changes():
+                manager.add_task("Buy milk")
+                manager.toggle_complete(1)
+        
+        Returns:
+            A context manager; listeners are notified when it exits
+        """
+        return self._events.batch()
+    
+    def close(self) -> None:
+        """
+        Commit pending changes and release the persistence backend, if any,
+        then write the final statistics dump.
+        """
+        if self._storage is not None:
+            self._storage.close()
+        if self._stats is not None:
+            self._stats.close()
+    
+    def _allocate_ids(self, count: int) -> int:
+        """
+        Reserve a block of consecutive task IDs.
+        
+        Args:
+            count (int): Number of IDs to reserve
+            
+        Returns:
+            int: The first ID of the block
+        """
+        first_id = self._next_id
+        self._next_id = first_id + count
+        return first_id
+    
+    def _build_search_index(self) -> None:
+        """
+        Index every task for search.
+        """
+        search_index = SearchIndex()
+        for task in self.iter_tasks():
+            search_index.add(task)
+        self._search_index = search_index
+    
+    def _insert_tasks(self, tasks: List[Task]) -> None:
+        """
+        Store new, validated tasks and record them as one batch.
+        
+        The store stays in ID order, so tasks put back by undo take their
+        old place in get_all_tasks() and unfiltered pages.
+        
+        Args:
+            tasks (list[Task]): The tasks to store, with their IDs assigned
+        """
+        insert_in_id_order(self._tasks, tasks)
+        for task in tasks:
+            self._status_index.add(task.id, task.completed)
+            self._index(task)
+        
+        self._record_batch(self._add_record(task) for task in tasks)
+    
+    def _apply_entry(self, entry: Entry) -> None:
+        """
+        Apply the inverse deltas of one undo step, last recorded first.
+        
+        Args:
+            entry (list): (kind, items) deltas from the undo history
+        """
+        with self.batch_changes():
+            for kind, items in reversed(entry):
+                if kind == DELETE:
+                    self.delete_tasks(items)
+                elif kind == RESTORE:
+                    tasks = [Task(*row) for row in items]
+                    self._insert_tasks(tasks)
+                    self._history.record(DELETE, [task.id for task in tasks])
+                elif kind == UPDATE:
+                    self.update_tasks(items)
+                elif kind == TOGGLE:
+                    self.toggle_many(items)
+    
+    def _record(self, record: Dict) -> None:
+        """
+        Persist a change record, then publish the matching change events.
+        
+        Args:
+            record (dict): The change record, e.g. {'op': 'toggle', 'id': 3}
+        """
+        if self._storage is not None:
+            self._persist(record)
+        if self._events.active:
+            self._notify(record)
+    
+    def _persist(self, record: Dict) -> None:
+        """
+        Send a change record to the persistence backend, compacting when due.
+        """
+        self._storage.append(record)
+        if self._storage.needs_compaction():
+            self._storage.compact(self.iter_tasks(), self._next_id)
+    
+    def _notify(self, record: Dict) -> None:
+        """
+        Publish the change events of a change record.
+        """
+        changes = record['records'] if record['op'] == 'batch' else (record,)
+        self._events.publish(map(self._change_event, changes))
+    
+    def _set_completed(self, task: Task, completed: bool) -> None:
+        """
+        Set a task's completion status and move it to the matching status set.
+        """
+        if self._sorted_indexes:
+            self._unsort(task, status_only=True)
+        task.completed = completed
+        self._status_index.move(task.id, completed)
+        if self._sorted_indexes:
+            self._sort(task, status_only=True)
+    
+    def _index(self, task: Task) -> None:
+        """
+        Add a task to the search and sort indexes that have been built.
+        """
+        if self._search_index is not None:
+            self._search_index.add(task)
+        if self._sorted_indexes:
+            self._sort(task)
+    
+    def _unindex(self, task: Task) -> None:
+        """
+        Remove a task from the search and sort indexes that have been built.
+        """
+        if self._search_index is not None:
+            self._search_index.remove(task)
+        if self._sorted_indexes:
+            self._unsort(task)
+    
+    def _sorted_range(self, sort_by: str, completed: Optional[bool]) -> Tuple[SortedKeyList, int, int]:
+        """
+        Return the sort index for a view and the positions its tasks span.
+        
+        A status-filtered view uses keys that start with the status, so
+        pending and completed tasks each form one contiguous run.
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Cannot sort by {sort_by!r}; choose one of {', '.join(SORT_KEYS)}")
+        by_status = completed is not None
+        keys = self._sorted_indexes.get((sort_by, by_status))
+        if keys is None:
+            keys = SortedKeyList(self._sort_key(sort_by, by_status, task) for task in self.iter_tasks())
+            self._sorted_indexes[(sort_by, by_status)] = keys
+        if not by_status:
+            return keys, 0, len(keys)
+        boundary = keys.rank((True,))
+        return (keys, boundary, len(keys)) if completed else (keys, 0, boundary)
+    
+    def _sort(self, task: Task, status_only: bool = False) -> None:
+        """
+        Add a task to the sort indexes, or only those keyed on its status.
+        """
+        for (field, by_status), keys in self._sorted_indexes.items():
+            if not status_only or by_status or field == 'status':
+                keys.add(self._sort_key(field, by_status, task))
+    
+    def _unsort(self, task: Task, status_only: bool = False) -> None:
+        """
+        Remove a task from the sort indexes, or only those keyed on its status.
+        """
+        for (field, by_status), keys in self._sorted_indexes.items():
+            if not status_only or by_status or field == 'status':
+                keys.remove(self._sort_key(field, by_status, task))
+    
+    def _record_batch(self, records: Iterable[Dict]) -> None:
+        """
+        Send a group of change records as one atomic batch record.
+        
+        The records are only built when a persistence backend or a change
+        listener is attached.
+        
+        Args:
+            records (Iterable[dict]): The change records of the batch
+        """
+        if self._storage is not None or self._events.active:
+            records = list(records)
+            if records:
+                self._record({'op': 'batch', 'records': records})
+    
+    def _change_event(self, record: Dict) -> ChangeEvent:
+        """
+        Build the change event for a change record.
+        """
+        task_id = record['id']
+        if record['op'] == 'toggle':
+            fields = {'completed': self._tasks[task_id].completed}
+        else:
+            fields = {key: value for key, value in record.items() if key != 'op' and key != 'id'}
+        return ChangeEvent(CHANGE_KINDS[record['op']], task_id, fields)
+    
+    @staticmethod
+    def _sort_key(field: str, by_status: bool, task: Task) -> Tuple:
+        """
+        Build a task's key in the sort index of a field.
+        """
+        key = SORT_KEYS[field](task)
+        return (task.completed,) + key if by_status else key
+    
+    @staticmethod
+    def _row(task: Task) -> Tuple[int, str, str, bool]:
+        """
+        Return the fields needed to put a deleted task back.
+        """
+        return task.id, task.title, task.description, task.completed
+    
+    @staticmethod
+    def _previous_fields(task: Task, title: Optional[str],
+                         description: Optional[str]) -> Tuple[int, Optional[str], Optional[str]]:
+        """
+        Return the update that reverts setting the given fields of a task.
+        """
+        return (task.id, task.title if title is not None else None,
+                task.description if description is not None else None)
+    
+    @staticmethod
+    def _add_record(task: Task) -> Dict:
+        """
+        Build the change record describing a newly added task.
+        """
+        return {'op': 'add', 'id': task.id, 'title': task.title,
+                'description': task.description, 'completed': task.completed}
+    
+    @staticmethod
+    def _update_record(task_id: int, title: Optional[str], description: Optional[str]) -> Dict:
+        """
+        Build the change record describing the fields set by an update.
+        """
+        record = {'op': 'update', 'id': task_id}
+        if title is not None:
+            record['title'] = title
+        if description is not None:
+            record['description'] = description
+        return record
\ No newline at end of file
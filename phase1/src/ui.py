@@ -1,323 +1,541 @@
-# [Task]: T-018
-# [From]: specify.md §Journey 5: Mark Task Complete, plan.md §TodoUI Class
-
-from typing import Tuple
-from todo_manager import TodoManager
-
-
-class TodoUI:
-    """
-    Handles user interaction and display for the Todo application.
-    
-    Responsibilities:
-    - Display menus and prompts
-    - Handle user input
-    - Format and display task information
-    """
-    
-    def __init__(self, manager: TodoManager):
-        """
-        Initialize the TodoUI with a TodoManager instance.
-        
-        Args:
-            manager (TodoManager): The TodoManager instance to interact with
-        """
-        self.manager = manager
-    
-    def show_menu(self) -> None:
-        """
-        Display the main menu options to the user.
-        """
-        print("\n" + "="*50)
-        print("           TODO CONSOLE APP")
-        print("="*50)
-        print("What would you like to do?")
-        print("1. ➕ Add Task")
-        print("2. 📋 View All Tasks")
-        print("3. ✏️  Update Task")
-        print("4. 🗑️  Delete Task")
-        print("5. ✅ Mark Task Complete/Incomplete")
-        print("6. 🚪 Exit")
-        print("-"*50)
-    
-    def get_menu_choice(self) -> str:
-        """
-        Get and validate the user's menu choice.
-        
-        Returns:
-            str: The validated menu choice
-        """
-        while True:
-            try:
-                choice = input("Enter your choice (1-6): ").strip()
-                
-                # Validate the choice
-                if choice in ['1', '2', '3', '4', '5', '6']:
-                    return choice
-                else:
-                    print("Invalid choice. Please enter a number between 1 and 6.")
-            except KeyboardInterrupt:
-                print("\n\nOperation cancelled by user.")
-                return '6'  # Return '6' to exit
-            except EOFError:
-                print("\n\nOperation cancelled.")
-                return '6'  # Return '6' to exit
-    
-    def prompt_task_details(self) -> Tuple[str, str]:
-        """
-        Prompt the user for task title and description.
-        
-        Returns:
-            tuple[str, str]: A tuple containing the title and description
-        """
-        while True:
-            try:
-                title = input("Enter task title (required): ").strip()
-                
-                if not title:
-                    print("Title cannot be empty. Please try again.")
-                    continue
-                
-                if len(title) > 200:
-                    print("Title is too long. Please enter a title with 200 characters or less.")
-                    continue
-                
-                break
-            except KeyboardInterrupt:
-                print("\n\nOperation cancelled by user.")
-                return "", ""
-            except EOFError:
-                print("\n\nOperation cancelled.")
-                return "", ""
-        
-        try:
-            description = input("Enter task description (optional): ")
-            
-            if len(description) > 1000:
-                print("Description is too long. Truncating to 1000 characters.")
-                description = description[:1000]
-        except KeyboardInterrupt:
-            print("\n\nOperation cancelled by user.")
-            description = ""
-        except EOFError:
-            print("\n\nOperation cancelled.")
-            description = ""
-        
-        return title, description
-    
-    def handle_add_task(self) -> None:
-        """
-        Handle the process of adding a new task.
-        """
-        print("\n➕ Adding New Task...")
-        
-        # Get task details from user
-        title, description = self.prompt_task_details()
-        
-        # Check if operation was cancelled
-        if not title:
-            print("❌ Add task operation cancelled.")
-            return
-        
-        try:
-            # Add the task using the manager
-            task = self.manager.add_task(title, description)
-            
-            # Confirm the task was added
-            print(f"✅ Task added successfully! Your task ID is: {task['id']}")
-        except ValueError as e:
-            print(f"❌ Error adding task: {e}")
-        except Exception as e:
-            print(f"❌ An unexpected error occurred: {e}")
-    
-    def display_tasks(self, tasks: list) -> None:
-        """
-        Display a formatted list of tasks.
-        
-        Args:
-            tasks (list): List of task dictionaries to display
-        """
-        if not tasks:
-            print("\n📭 No tasks found. Your list is empty!")
-            return
-        
-        print("\n📋 Task List:")
-        print("=" * 80)
-        print(f"{'ID':<4} {'Status':<10} {'Title':<30} {'Description'}")
-        print("-" * 80)
-        
-        for task in tasks:
-            status = "✅ Done" if task['completed'] else "⏳ Pending"
-            title = task['title'][:27] + "..." if len(task['title']) > 30 else task['title']
-            description = task['description'][:35] + "..." if len(task['description']) > 35 else task['description']
-            print(f"{task['id']:<4} {status:<10} {title:<30} {description}")
-        print("=" * 80)
-    
-    def handle_view_tasks(self) -> None:
-        """
-        Handle the process of viewing all tasks.
-        """
-        print("\n📋 Retrieving all tasks...")
-        
-        # Get all tasks from the manager
-        tasks = self.manager.get_all_tasks()
-        
-        # Display the tasks
-        self.display_tasks(tasks)
-    
-    def handle_update_task(self) -> None:
-        """
-        Handle the process of updating a task.
-        """
-        print("\n✏️  Updating Task...")
-        
-        # Get task ID from user
-        try:
-            task_id_input = input("Enter task ID to update: ").strip()
-            
-            if not task_id_input:
-                print("❌ Update operation cancelled.")
-                return
-            
-            task_id = int(task_id_input)
-        except ValueError:
-            print("❌ Invalid task ID. Please enter a number.")
-            return
-        except KeyboardInterrupt:
-            print("\n\n❌ Update operation cancelled by user.")
-            return
-        except EOFError:
-            print("\n\n❌ Update operation cancelled.")
-            return
-        
-        # Check if task exists
-        task = self.manager.get_task(task_id)
-        if not task:
-            print(f"❌ Task with ID {task_id} not found.")
-            return
-        
-        print(f"📝 Current task: {task['title']}")
-        
-        # Ask what to update
-        try:
-            print("💡 Leave blank to keep current value.")
-            new_title = input(f"📝 New title (current: '{task['title']}'): ").strip()
-            
-            if new_title == "":
-                new_title = None  # Keep current title
-            elif len(new_title) > 200:
-                print("❌ Title is too long. Update cancelled.")
-                return
-            
-            new_description = input(f"📝 New description (current: '{task['description']}'): ")
-            
-            if new_description == "":
-                new_description = None  # Keep current description
-            elif len(new_description) > 1000:
-                print("❌ Description is too long. Update cancelled.")
-                return
-            
-            # Update the task
-            success = self.manager.update_task(task_id, new_title, new_description)
-            
-            if success:
-                print(f"✅ Task {task_id} updated successfully!")
-            else:
-                print(f"❌ Failed to update task {task_id}.")
-        except KeyboardInterrupt:
-            print("\n\n❌ Update operation cancelled by user.")
-        except EOFError:
-            print("\n\n❌ Update operation cancelled.")
-    
-    def handle_delete_task(self) -> None:
-        """
-        Handle the process of deleting a task.
-        """
-        print("\n🗑️  Deleting Task...")
-        
-        # Get task ID from user
-        try:
-            task_id_input = input("Enter task ID to delete: ").strip()
-            
-            if not task_id_input:
-                print("❌ Delete operation cancelled.")
-                return
-            
-            task_id = int(task_id_input)
-        except ValueError:
-            print("❌ Invalid task ID. Please enter a number.")
-            return
-        except KeyboardInterrupt:
-            print("\n\n❌ Delete operation cancelled by user.")
-            return
-        except EOFError:
-            print("\n\n❌ Delete operation cancelled.")
-            return
-        
-        # Check if task exists
-        task = self.manager.get_task(task_id)
-        if not task:
-            print(f"❌ Task with ID {task_id} not found.")
-            return
-        
-        print(f"📝 Task to delete: {task['title']}")
-        
-        # Confirm deletion
-        try:
-            confirm = input("❓ Are you sure you want to delete this task? (y/N): ").strip().lower()
-            
-            if confirm not in ['y', 'yes']:
-                print("❌ Delete operation cancelled.")
-                return
-            
-            # Delete the task
-            success = self.manager.delete_task(task_id)
-            
-            if success:
-                print(f"✅ Task {task_id} deleted successfully!")
-            else:
-                print(f"❌ Failed to delete task {task_id}.")
-        except KeyboardInterrupt:
-            print("\n\n❌ Delete operation cancelled by user.")
-        except EOFError:
-            print("\n\n❌ Delete operation cancelled.")
-    
-    def handle_complete_task(self) -> None:
-        """
-        Handle the process of marking a task as complete/incomplete.
-        """
-        print("\n✅ Toggling Task Completion Status...")
-        
-        # Get task ID from user
-        try:
-            task_id_input = input("Enter task ID to toggle completion status: ").strip()
-            
-            if not task_id_input:
-                print("❌ Mark complete operation cancelled.")
-                return
-            
-            task_id = int(task_id_input)
-        except ValueError:
-            print("❌ Invalid task ID. Please enter a number.")
-            return
-        except KeyboardInterrupt:
-            print("\n\n❌ Mark complete operation cancelled by user.")
-            return
-        except EOFError:
-            print("\n\n❌ Mark complete operation cancelled.")
-            return
-        
-        # Check if task exists
-        task = self.manager.get_task(task_id)
-        if not task:
-            print(f"❌ Task with ID {task_id} not found.")
-            return
-        
-        # Toggle completion status
-        success = self.manager.toggle_complete(task_id)
-        
-        if success:
-            status = "✅ completed" if task['completed'] else "⏳ incomplete"
-            print(f"✅ Task {task_id} marked as {status}!")
-        else:
-            print(f"❌ Failed to toggle completion status for task {task_id}.")
\ No newline at end of file
+# [Task]: T-018
+# [From]: specify.md §Journey 5: Mark Task Complete, plan.md §TodoUI Class
+
+import sys
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
+try:
+    from .task_io import export_file, import_file
+    from .todo_manager import TodoManager
+except ImportError:
+    from task_io import export_file, import_file
+    from todo_manager import TodoManager
+
+# Number of tasks shown per page of the task list
+PAGE_SIZE = 20
+
+
+class TodoUI:
+    """
+    Handles user interaction and display for the Todo application.
+    
+    Responsibilities:
+    - Display menus and prompts
+    - Handle user input
+    - Format and display task information
+    """
+    
+    def __init__(self, manager: TodoManager):
+        """
+        Initialize the TodoUI with a TodoManager instance.
+        
+        Args:
+            manager (TodoManager): The TodoManager instance to interact with
+        """
+        self.manager = manager
+    
+    def show_menu(self) -> None:
+        """
+        Display the main menu options to the user.
+        """
+        print("\n" + "="*50)
+        print("           TODO CONSOLE APP")
+        print("="*50)
+        print("What would you like to do?")
+        print("1. ➕ Add Task")
+        print("2. 📋 View All Tasks")
+        print("3. ✏️  Update Task")
+        print("4. 🗑️  Delete Task")
+        print("5. ✅ Mark Task Complete/Incomplete")
+        print("6. 🔍 Search Tasks")
+        print("7. 📥 Import Tasks")
+        print("8. 📤 Export Tasks")
+        print("9. ↩️  Undo")
+        print("10. ↪️  Redo")
+        print("11. 📊 Stats")
+        print("12. 🚪 Exit")
+        print("-"*50)
+    
+    def get_menu_choice(self) -> str:
+        """
+        Get and validate the user's menu choice.
+        
+        Returns:
+            str: The validated menu choice
+        """
+        while True:
+            try:
+                choice = input("Enter your choice (1-12): ").strip()
+                
+                # Validate the choice
+                if choice in ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12']:
+                    return choice
+                else:
+                    print("Invalid choice. Please enter a number between 1 and 12.")
+            except KeyboardInterrupt:
+                print("\n\nOperation cancelled by user.")
+                return '12'  # Return '12' to exit
+            except EOFError:
+                print("\n\nOperation cancelled.")
+                return '12'  # Return '12' to exit
+    
+    def prompt_task_details(self) -> Tuple[str, str]:
+        """
+        Prompt the user for task title and description.
+        
+        Returns:
+            tuple[str, str]: A tuple containing the title and description
+        """
+        while True:
+            try:
+                title = input("Enter task title (required): ").strip()
+                
+                if not title:
+                    print("Title cannot be empty. Please try again.")
+                    continue
+                
+                if len(title) > 200:
+                    print("Title is too long. Please enter a title with 200 characters or less.")
+                    continue
+                
+                break
+            except KeyboardInterrupt:
+                print("\n\nOperation cancelled by user.")
+                return "", ""
+            except EOFError:
+                print("\n\nOperation cancelled.")
+                return "", ""
+        
+        try:
+            description = input("Enter task description (optional): ")
+            
+            if len(description) > 1000:
+                print("Description is too long. Truncating to 1000 characters.")
+                description = description[:1000]
+        except KeyboardInterrupt:
+            print("\n\nOperation cancelled by user.")
+            description = ""
+        except EOFError:
+            print("\n\nOperation cancelled.")
+            description = ""
+        
+        return title, description
+    
+    def handle_add_task(self) -> None:
+        """
+        Handle the process of adding a new task.
+        """
+        print("\n➕ Adding New Task...")
+        
+        # Get task details from user
+        title, description = self.prompt_task_details()
+        
+        # Check if operation was cancelled
+        if not title:
+            print("❌ Add task operation cancelled.")
+            return
+        
+        try:
+            # Add the task using the manager
+            task = self.manager.add_task(title, description)
+            
+            # Confirm the task was added
+            print(f"✅ Task added successfully! Your task ID is: {task['id']}")
+        except ValueError as e:
+            print(f"❌ Error adding task: {e}")
+        except Exception as e:
+            print(f"❌ An unexpected error occurred: {e}")
+    
+    def display_tasks(self, tasks: Iterable, total: Optional[int] = None,
+                      page_size: int = PAGE_SIZE) -> None:
+        """
+        Display tasks one page at a time, with next/previous/jump navigation.
+        
+        Tasks are read from the iterable only as pages are reached, so the
+        first page appears equally fast for ten tasks or a million. Pages
+        already read are kept, so going back does not read them again.
+        
+        Args:
+            tasks (Iterable): Tasks to display, e.g. a list or manager.iter_tasks()
+            total (int | None): Number of tasks, if known, to show the page count
+            page_size (int): Number of tasks per page
+        """
+        tasks = iter(tasks)
+        pages: List[list] = []
+        page_count = -(-total // page_size) if total else None
+        current = 0
+        
+        while True:
+            # Read up to one page past the current one to know if there is a next
+            while len(pages) <= current + 1:
+                page = list(islice(tasks, page_size))
+                if not page:
+                    break
+                pages.append(page)
+            
+            if not pages:
+                print("\n📭 No tasks found. Your list is empty!")
+                return
+            current = min(current, len(pages) - 1)
+            has_next = current + 1 < len(pages)
+            if not has_next:
+                page_count = len(pages)
+            self.write_page(pages[current], current + 1, page_count)
+            
+            # A list that fits on one page needs no navigation
+            if len(pages) == 1:
+                return
+            
+            default = 'n' if has_next else 'q'
+            try:
+                choice = input(f"(N)ext, (P)revious, page number or (Q)uit [{default.upper()}]: ").strip().lower()
+            except (KeyboardInterrupt, EOFError):
+                print()
+                return
+            choice = choice or default
+            
+            if choice in ('n', 'next'):
+                current += 1
+            elif choice in ('p', 'prev', 'previous'):
+                current = max(current - 1, 0)
+            elif choice.isdigit() and int(choice) > 0:
+                current = int(choice) - 1
+            elif choice in ('q', 'quit'):
+                return
+            else:
+                print("Invalid choice. Enter N, P, a page number or Q.")
+    
+    def write_page(self, page: list, number: int, page_count: Optional[int]) -> None:
+        """
+        Write one page of the task table to stdout in a single chunk.
+        
+        Args:
+            page (list): The tasks on the page
+            number (int): The 1-based page number
+            page_count (int | None): Total number of pages, None if not yet known
+        """
+        lines = [
+            "",
+            f"📋 Task List (page {number} of {page_count or '?'}):",
+            "=" * 80,
+            f"{'ID':<4} {'Status':<10} {'Title':<30} {'Description'}",
+            "-" * 80,
+        ]
+        lines.extend(map(format_task_row, page))
+        lines.append("=" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
+    def handle_view_tasks(self) -> None:
+        """
+        Handle the process of viewing all tasks, optionally filtered by status.
+        """
+        counts = self.manager.count_by_status()
+        print(f"\n📊 {counts['pending']} pending, {counts['completed']} completed")
+        
+        try:
+            choice = input("Show (A)ll, (P)ending or (C)ompleted tasks? [A]: ").strip().lower()
+        except KeyboardInterrupt:
+            print("\n\n❌ View operation cancelled by user.")
+            return
+        except EOFError:
+            print("\n\n❌ View operation cancelled.")
+            return
+        
+        # Map the choice to a status filter; anything else shows all tasks
+        completed = {'p': False, 'pending': False, 'c': True, 'completed': True}.get(choice)
+        
+        print("\n📋 Retrieving tasks...")
+        
+        # Display the tasks straight from the manager without copying them
+        total = self.manager.task_count() if completed is None else \
+            counts['completed' if completed else 'pending']
+        self.display_tasks(self.manager.iter_tasks(completed=completed), total)
+    
+    def handle_search_tasks(self) -> None:
+        """
+        Handle the process of searching tasks by title and description.
+        """
+        print("\n🔍 Searching Tasks...")
+        
+        try:
+            query = input("Enter search words: ").strip()
+        except KeyboardInterrupt:
+            print("\n\n❌ Search operation cancelled by user.")
+            return
+        except EOFError:
+            print("\n\n❌ Search operation cancelled.")
+            return
+        
+        if not query:
+            print("❌ Search operation cancelled.")
+            return
+        
+        # Show the best matches first
+        results = self.manager.search(query, limit=50)
+        self.display_tasks(results, len(results))
+    
+    def handle_import_tasks(self) -> None:
+        """
+        Handle the process of importing tasks from a JSON Lines or CSV file.
+        """
+        print("\n📥 Importing Tasks...")
+        
+        try:
+            path = input("Enter file to import (.jsonl or .csv): ").strip()
+        except KeyboardInterrupt:
+            print("\n\n❌ Import operation cancelled by user.")
+            return
+        except EOFError:
+            print("\n\n❌ Import operation cancelled.")
+            return
+        
+        if not path:
+            print("❌ Import operation cancelled.")
+            return
+        
+        try:
+            count = import_file(self.manager, path)
+            print(f"✅ Imported {count} tasks from {path}.")
+        except ValueError as e:
+            print(f"❌ Error importing tasks: {e}")
+        except OSError as e:
+            print(f"❌ Could not read {path}: {e}")
+    
+    def handle_export_tasks(self) -> None:
+        """
+        Handle the process of exporting all tasks to a JSON Lines or CSV file.
+        """
+        print("\n📤 Exporting Tasks...")
+        
+        try:
+            path = input("Enter file to export to (.jsonl or .csv): ").strip()
+        except KeyboardInterrupt:
+            print("\n\n❌ Export operation cancelled by user.")
+            return
+        except EOFError:
+            print("\n\n❌ Export operation cancelled.")
+            return
+        
+        if not path:
+            print("❌ Export operation cancelled.")
+            return
+        
+        try:
+            count = export_file(self.manager, path)
+            print(f"✅ Exported {count} tasks to {path}.")
+        except ValueError as e:
+            print(f"❌ Error exporting tasks: {e}")
+        except OSError as e:
+            print(f"❌ Could not write {path}: {e}")
+    
+    def handle_update_task(self) -> None:
+        """
+        Handle the process of updating a task.
+        """
+        print("\n✏️  Updating Task...")
+        
+        # Get task ID from user
+        try:
+            task_id_input = input("Enter task ID to update: ").strip()
+            
+            if not task_id_input:
+                print("❌ Update operation cancelled.")
+                return
+            
+            task_id = int(task_id_input)
+        except ValueError:
+            print("❌ Invalid task ID. Please enter a number.")
+            return
+        except KeyboardInterrupt:
+            print("\n\n❌ Update operation cancelled by user.")
+            return
+        except EOFError:
+            print("\n\n❌ Update operation cancelled.")
+            return
+        
+        # Check if task exists
+        task = self.manager.get_task(task_id)
+        if not task:
+            print(f"❌ Task with ID {task_id} not found.")
+            return
+        
+        print(f"📝 Current task: {task['title']}")
+        
+        # Ask what to update
+        try:
+            print("💡 Leave blank to keep current value.")
+            new_title = input(f"📝 New title (current: '{task['title']}'): ").strip()
+            
+            if new_title == "":
+                new_title = None  # Keep current title
+            elif len(new_title) > 200:
+                print("❌ Title is too long. Update cancelled.")
+                return
+            
+            new_description = input(f"📝 New description (current: '{task['description']}'): ")
+            
+            if new_description == "":
+                new_description = None  # Keep current description
+            elif len(new_description) > 1000:
+                print("❌ Description is too long. Update cancelled.")
+                return
+            
+            # Update the task
+            success = self.manager.update_task(task_id, new_title, new_description)
+            
+            if success:
+                print(f"✅ Task {task_id} updated successfully!")
+            else:
+                print(f"❌ Failed to update task {task_id}.")
+        except KeyboardInterrupt:
+            print("\n\n❌ Update operation cancelled by user.")
+        except EOFError:
+            print("\n\n❌ Update operation cancelled.")
+    
+    def handle_delete_task(self) -> None:
+        """
+        Handle the process of deleting a task.
+        """
+        print("\n🗑️  Deleting Task...")
+        
+        # Get task ID from user
+        try:
+            task_id_input = input("Enter task ID to delete: ").strip()
+            
+            if not task_id_input:
+                print("❌ Delete operation cancelled.")
+                return
+            
+            task_id = int(task_id_input)
+        except ValueError:
+            print("❌ Invalid task ID. Please enter a number.")
+            return
+        except KeyboardInterrupt:
+            print("\n\n❌ Delete operation cancelled by user.")
+            return
+        except EOFError:
+            print("\n\n❌ Delete operation cancelled.")
+            return
+        
+        # Check if task exists
+        task = self.manager.get_task(task_id)
+        if not task:
+            print(f"❌ Task with ID {task_id} not found.")
+            return
+        
+        print(f"📝 Task to delete: {task['title']}")
+        
+        # Confirm deletion
+        try:
+            confirm = input("❓ Are you sure you want to delete this task? (y/N): ").strip().lower()
+            
+            if confirm not in ['y', 'yes']:
+                print("❌ Delete operation cancelled.")
+                return
+            
+            # Delete the task
+            success = self.manager.delete_task(task_id)
+            
+            if success:
+                print(f"✅ Task {task_id} deleted successfully!")
+            else:
+                print(f"❌ Failed to delete task {task_id}.")
+        except KeyboardInterrupt:
+            print("\n\n❌ Delete operation cancelled by user.")
+        except EOFError:
+            print("\n\n❌ Delete operation cancelled.")
+    
+    def handle_undo(self) -> None:
+        """
+        Handle undoing the most recent change.
+        """
+        if self.manager.undo():
+            print("↩️  Last change undone.")
+        else:
+            print("ℹ️  Nothing to undo.")
+    
+    def handle_redo(self) -> None:
+        """
+        Handle redoing the most recently undone change.
+        """
+        if self.manager.redo():
+            print("↪️  Change redone.")
+        else:
+            print("ℹ️  Nothing to redo.")
+    
+    def handle_stats(self) -> None:
+        """
+        Handle showing the call counts and latencies of the manager's operations.
+        """
+        stats = self.manager.stats()
+        if not stats:
+            print("ℹ️  No operations recorded yet.")
+            return
+        
+        print("\n📊 Operation Statistics (latencies in µs):")
+        print("-" * 86)
+        print(f"{'Operation':<18} {'Calls':>8} {'p50':>10} {'p95':>10} {'p99':>10} {'Max':>10} {'Copied':>12}")
+        print("-" * 86)
+        for name, entry in stats.items():
+            print(f"{name:<18} {entry['calls']:>8} {entry['p50_us']:>10.1f} {entry['p95_us']:>10.1f} "
+                  f"{entry['p99_us']:>10.1f} {entry['max_us']:>10.1f} {entry['copied']:>12}")
+        print("-" * 86)
+    
+    def handle_complete_task(self) -> None:
+        """
+        Handle the process of marking a task as complete/incomplete.
+        """
+        print("\n✅ Toggling Task Completion Status...")
+        
+        # Get task ID from user
+        try:
+            task_id_input = input("Enter task ID to toggle completion status: ").strip()
+            
+            if not task_id_input:
+                print("❌ Mark complete operation cancelled.")
+                return
+            
+            task_id = int(task_id_input)
+        except ValueError:
+            print("❌ Invalid task ID. Please enter a number.")
+            return
+        except KeyboardInterrupt:
+            print("\n\n❌ Mark complete operation cancelled by user.")
+            return
+        except EOFError:
+            print("\n\n❌ Mark complete operation cancelled.")
+            return
+        
+        # Check if task exists
+        task = self.manager.get_task(task_id)
+        if not task:
+            print(f"❌ Task with ID {task_id} not found.")
+            return
+        
+        # Toggle completion status
+        success = self.manager.toggle_complete(task_id)
+        
+        if success:
+            # Re-read the task, since some managers return detached snapshots
+            task = self.manager.get_task(task_id)
+            status = "✅ completed" if task['completed'] else "⏳ incomplete"
+            print(f"✅ Task {task_id} marked as {status}!")
+        else:
+            print(f"❌ Failed to toggle completion status for task {task_id}.")
+
+
+def format_task_row(task) -> str:
+    """
+    Format a task as one row of the task table.
+    
+    Args:
+        task: The task to format
+        
+    Returns:
+        str: The table row, without a trailing newline
+    """
+    status = "✅ Done" if task['completed'] else "⏳ Pending"
+    title = task['title'][:27] + "..." if len(task['title']) > 30 else task['title']
+    description = task['description'][:35] + "..." if len(task['description']) > 35 else task['description']
+    return f"{task['id']:<4} {status:<10} {title:<30} {description}"
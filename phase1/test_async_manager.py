@@ -0,0 +1,94 @@
+# [Task]: Asyncio Task Manager
+# [From]: plan.md §TodoManager Class
+
+"""
+Test script to verify the asyncio facade of the Todo Console App manager.
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from async_manager import AsyncTodoManager
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+CLIENTS = 500
+
+
+def test_async_manager():
+    """
+    Test awaitable operations, write batching and error reporting.
+    """
+    print("Testing Async Manager for Todo Console App...")
+    print("="*50)
+
+    async def scenario(directory):
+        async with AsyncTodoManager(JournalStorage(directory)) as manager:
+            # Test 1: Concurrent writes are committed in a few batches
+            tasks = await asyncio.gather(*(manager.add_task(f"Task {i}") for i in range(CLIENTS)))
+            assert sorted(task['id'] for task in tasks) == list(range(1, CLIENTS + 1))
+            assert manager.commits < CLIENTS // 10
+            print("   + PASSED: Concurrent writes share commits")
+
+            # Test 2: Readers run alongside writers and see applied writes
+            results = await asyncio.gather(
+                *(manager.toggle_complete(task_id) for task_id in range(1, 101)),
+                *(manager.get_task(task_id) for task_id in range(1, 101)))
+            assert results[:100] == [True] * 100
+            assert all(task['completed'] for task in await manager.get_task_page(0, 100))
+            print("   + PASSED: Reads and writes run concurrently")
+
+            # Test 3: Failures are reported to their own caller only
+            outcomes = await asyncio.gather(manager.add_task(""), manager.update_task(1, "Renamed"),
+                                            manager.delete_task(9999), return_exceptions=True)
+            assert isinstance(outcomes[0], ValueError)
+            assert outcomes[1:] == [True, False]
+            assert (await manager.get_task(1))['title'] == "Renamed"
+            print("   + PASSED: Errors reach only the failing caller")
+
+            # Test 4: A write failing with any exception mid-batch does not stall the rest
+            outcomes = await asyncio.wait_for(asyncio.gather(
+                manager.add_task("Before"), manager.update_task(2, 123), manager.add_task("After"),
+                return_exceptions=True), timeout=5)
+            assert isinstance(outcomes[1], Exception) and not isinstance(outcomes[1], ValueError)
+            assert [task['title'] for task in outcomes[::2]] == ["Before", "After"]
+            assert (await manager.get_task(2))['title'] == "Task 1"
+            assert (await manager.add_task("Later"))['title'] == "Later"
+            print("   + PASSED: Unexpected errors fail only their own write")
+
+            return [task.to_dict() for task in await manager.get_all_tasks()]
+
+    with tempfile.TemporaryDirectory() as directory:
+        expected = asyncio.run(scenario(directory))
+
+        # Test 5: Every awaited write was committed to the journal
+        restored = TodoManager(JournalStorage(directory))
+        assert [task.to_dict() for task in restored.iter_tasks()] == expected
+        restored.close()
+        print("   + PASSED: Awaited writes are durable")
+
+
+def test_async_manager_in_memory():
+    """
+    Test the facade without a persistence backend.
+    """
+    async def scenario():
+        manager = AsyncTodoManager()
+        task = await manager.add_task("Buy groceries")
+        assert await manager.toggle_complete(task['id'])
+        assert (await manager.get_task(task['id']))['completed'] is True
+        assert manager.commits == 0
+        await manager.close()
+
+    asyncio.run(scenario())
+    print("   + PASSED: Works without a persistence backend")
+
+
+if __name__ == "__main__":
+    test_async_manager()
+    test_async_manager_in_memory()
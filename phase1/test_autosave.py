@@ -0,0 +1,209 @@
+# [Task]: Debounced Autosave
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+"""
+Test script to verify background autosaving in the Todo Console App.
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from autosave import AutosaveStorage, merge_change
+from history import UndoHistory
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+
+def fold(records):
+    """Return the records left after folding the given ones together."""
+    pending = []
+    for record in records:
+        merge_change(pending, record)
+    return pending
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def snapshot(manager):
+    """Return the manager's tasks as plain dictionaries, in list order."""
+    return [task.to_dict() for task in manager.iter_tasks()]
+
+
+def test_merge_change():
+    """
+    Test that repeated edits of one task fold into few records.
+    """
+    print("Testing Autosave for Todo Console App...")
+    print("="*50)
+
+    add = {'op': 'add', 'id': 1, 'title': "A", 'description': "", 'completed': False}
+    assert fold([add, {'op': 'update', 'id': 1, 'title': "B"}, {'op': 'toggle', 'id': 1}]) == \
+        [{'op': 'add', 'id': 1, 'title': "B", 'description': "", 'completed': True}]
+    assert add['title'] == "A"
+    assert fold([{'op': 'update', 'id': 1, 'title': "B"}, {'op': 'toggle', 'id': 1},
+                 {'op': 'update', 'id': 1, 'description': "C"}]) == \
+        [{'op': 'update', 'id': 1, 'title': "B", 'description': "C"}, {'op': 'toggle', 'id': 1}]
+    assert fold([{'op': 'toggle', 'id': 1}, {'op': 'toggle', 'id': 1}]) == []
+    assert fold([{'op': 'update', 'id': 1, 'title': "B"}, {'op': 'delete', 'id': 1}]) == \
+        [{'op': 'delete', 'id': 1}]
+    assert [record['op'] for record in fold([add, {'op': 'delete', 'id': 1}])] == ['add', 'delete']
+    print("   + PASSED: Repeated edits are folded")
+
+
+def test_autosave_round_trip():
+    """
+    Test that folded, reordered changes restore to the same task list.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        storage = AutosaveStorage(JournalStorage(directory), quiet_period=60)
+        manager = TodoManager(storage, UndoHistory())
+        manager.add_tasks((f"Task {i}", "") for i in range(5))
+        for i in range(50):
+            manager.update_task(1, f"Edit {i}")
+            manager.toggle_complete(2)
+        manager.delete_task(3)
+        manager.add_task("Six")
+        manager.undo()
+        manager.undo()
+        manager.redo()
+        assert storage.dirty_count == 6 and storage.writes == 0
+        assert os.path.getsize(storage.storage.log_path) == 0
+        print("   + PASSED: Changes wait for the quiet period")
+
+        expected = snapshot(manager)
+        manager.close()
+        assert storage.dirty_count == 0 and storage.writes == 1
+        restored = TodoManager(JournalStorage(directory))
+        assert snapshot(restored) == expected
+        assert restored.add_task("Seven")['id'] == 7
+        restored.close()
+    print("   + PASSED: Unsaved changes are written on close")
+
+
+def test_background_writes():
+    """
+    Test that the writer thread saves after a quiet period or a full batch.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        storage = AutosaveStorage(JournalStorage(directory), quiet_period=0.05)
+        manager = TodoManager(storage)
+        manager.add_task("Buy groceries")
+        wait_until(lambda: storage.writes == 1)
+        assert storage.dirty_count == 0 and os.path.getsize(storage.storage.log_path) > 0
+        manager.close()
+        manager.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = AutosaveStorage(JournalStorage(directory), quiet_period=60, max_dirty=10)
+        manager = TodoManager(storage)
+        for i in range(9):
+            manager.add_task(f"Task {i}")
+        time.sleep(0.05)
+        assert storage.writes == 0
+        manager.add_task("Task 9")
+        wait_until(lambda: storage.writes == 1)
+        manager.close()
+    print("   + PASSED: The writer saves in the background")
+
+    try:
+        AutosaveStorage(None, max_dirty=0)
+        assert False, "max_dirty=0 was accepted"
+    except ValueError:
+        pass
+
+
+class FlakyStorage:
+    """Backend wrapper whose appends or flushes fail on demand."""
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.append_error = None
+        self.flush_error = None
+        self.closed = False
+
+    def load(self):
+        return self.storage.load()
+
+    def append(self, record):
+        if self.append_error is not None:
+            error, self.append_error = self.append_error, None
+            raise error
+        self.storage.append(record)
+
+    def flush(self):
+        if self.flush_error is not None:
+            raise self.flush_error
+        self.storage.flush()
+
+    def needs_compaction(self):
+        return self.storage.needs_compaction()
+
+    def compact(self, tasks, next_id):
+        self.storage.compact(tasks, next_id)
+
+    def close(self):
+        self.closed = True
+        self.storage.close()
+
+
+def test_write_errors():
+    """
+    Test that failed writes keep the writer alive and are reported.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Test 1: Any background error is kept, the writer retries, and the
+        # next flush reports it once the changes are saved
+        backend = FlakyStorage(JournalStorage(directory))
+        storage = AutosaveStorage(backend, quiet_period=0.05)
+        manager = TodoManager(storage)
+        backend.append_error = TypeError("cannot encode record")
+        manager.add_task("Buy groceries")
+        wait_until(lambda: storage.last_error is not None)
+        manager.add_task("Walk the dog")
+        wait_until(lambda: storage.writes == 1 and storage.last_error is None)
+        assert storage.dirty_count == 0
+        backend.append_error = TypeError("cannot encode record")
+        manager.toggle_complete(1)
+        wait_until(lambda: storage.last_error is not None)
+        try:
+            storage.flush()
+            assert False, "the background error was not raised"
+        except TypeError:
+            pass
+        storage.flush()
+        print("   + PASSED: Background write errors are retried and reported")
+
+        # Test 2: A failing final write still closes the wrapped backend,
+        # which commits what was handed to it
+        manager.update_task(2, "Walk the cat")
+        expected = snapshot(manager)
+        backend.flush_error = OSError("disk full")
+        try:
+            manager.close()
+            assert False, "the failed write was not raised"
+        except OSError:
+            pass
+        assert backend.closed
+        print("   + PASSED: close() releases the backend even if the last write fails")
+
+        restored = TodoManager(JournalStorage(directory))
+        assert snapshot(restored) == expected
+        restored.close()
+
+
+if __name__ == "__main__":
+    test_merge_change()
+    test_autosave_round_trip()
+    test_background_writes()
+    test_write_errors()
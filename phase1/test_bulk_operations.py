@@ -0,0 +1,105 @@
+# [Task]: Bulk Task Operations
+# [From]: plan.md §TodoManager Class, specify.md §Error Handling
+
+"""
+Test script to verify the bulk operations of the Todo Console App.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+
+def test_bulk_operations():
+    """
+    Test add_tasks, update_tasks, delete_tasks and toggle_many.
+    """
+    print("Testing Bulk Operations for Todo Console App...")
+    print("="*50)
+    
+    manager = TodoManager()
+    manager.add_task("Existing task")
+    
+    # Test 1: IDs are assigned in one contiguous block
+    tasks = manager.add_tasks([("  Buy groceries ", "Milk"), ("Walk the dog", "")])
+    assert [task['id'] for task in tasks] == [2, 3]
+    assert tasks[0]['title'] == "Buy groceries"
+    print("   + PASSED: add_tasks assigned IDs 2 and 3")
+    
+    # Test 2: Batch updates and toggles
+    assert manager.update_tasks([(2, "Buy food", None), (3, None, "Around the park")])
+    assert manager.toggle_many([1, 3])
+    assert [(t['title'], t['description'], t['completed']) for t in manager.iter_tasks()] == [
+        ("Existing task", "", True),
+        ("Buy food", "Milk", False),
+        ("Walk the dog", "Around the park", True),
+    ]
+    print("   + PASSED: update_tasks and toggle_many applied every item")
+    
+    # Test 3: Batch deletes
+    assert manager.delete_tasks([1, 3, 1])
+    assert [task['id'] for task in manager.iter_tasks()] == [2]
+    print("   + PASSED: delete_tasks removed every listed task")
+
+
+def test_bulk_operations_are_atomic():
+    """
+    Test that a batch with a bad item changes nothing.
+    """
+    print("\nTesting Bulk Operation Atomicity for Todo Console App...")
+    print("="*50)
+    
+    manager = TodoManager()
+    manager.add_tasks([("First", ""), ("Second", "")])
+    before = [task.to_dict() for task in manager.iter_tasks()]
+    
+    for bad_batch in (lambda: manager.add_tasks([("Valid", ""), ("", "")]),
+                      lambda: manager.add_tasks([("Valid", "A" * 1001)]),
+                      lambda: manager.update_tasks([(1, "Renamed", None), (2, "A" * 201, None)])):
+        try:
+            bad_batch()
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            print(f"   + PASSED: Correctly raised ValueError: {e}")
+    
+    assert manager.update_tasks([(1, "Renamed", None), (999, "Missing", None)]) is False
+    assert manager.delete_tasks([1, 999]) is False
+    assert manager.toggle_many([2, 999]) is False
+    assert [task.to_dict() for task in manager.iter_tasks()] == before
+    assert manager.add_task("Third")['id'] == 3
+    print("   + PASSED: Failed batches left every task unchanged")
+
+
+def test_bulk_operations_journal():
+    """
+    Test that batches are journaled and replayed.
+    """
+    print("\nTesting Bulk Operation Journaling for Todo Console App...")
+    print("="*50)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory))
+        manager.add_tasks([(f"Task {i}", "") for i in range(10)])
+        manager.update_tasks([(1, "First", "Updated")])
+        manager.toggle_many([2, 4])
+        manager.delete_tasks([5, 6, 10])
+        expected = [task.to_dict() for task in manager.iter_tasks()]
+        manager.close()
+        
+        restored = TodoManager(JournalStorage(directory))
+        assert [task.to_dict() for task in restored.iter_tasks()] == expected
+        assert restored.add_task("Next")['id'] == 11
+        print("   + PASSED: Batches restored from the journal")
+        restored.close()
+
+
+if __name__ == "__main__":
+    test_bulk_operations()
+    test_bulk_operations_are_atomic()
+    test_bulk_operations_journal()
@@ -0,0 +1,90 @@
+# [Task]: Command-Line Mode
+# [From]: plan.md §Main Application, specify.md §Menu System
+
+"""
+Test script to verify the command-line and batch modes of the Todo Console App.
+"""
+
+import io
+import sys
+import os
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from cli import main, run_batch
+from todo_manager import TodoManager
+
+
+def test_batch_mode():
+    """
+    Test running newline-delimited commands against one manager.
+    """
+    print("Testing Batch Mode for Todo Console App...")
+    print("="*50)
+
+    manager = TodoManager()
+    out, err = io.StringIO(), io.StringIO()
+    failures = run_batch(manager, [
+        'add "Buy groceries" -d "Milk, eggs"\n',
+        "add 'Walk the dog'\n",
+        "# comments and blank lines are skipped\n",
+        "\n",
+        "toggle 1\n",
+        'update 2 --title "Walk the cat"\n',
+        "list --pending\n",
+        "delete 7\n",
+        'add ""\n',
+        "frobnicate 1\n",
+    ], out, err)
+
+    # Test 1: Commands run in order against the same manager
+    assert out.getvalue() == "1\n2\n2\tpending\tWalk the cat\t\n"
+    assert manager.get_task(1)['completed'] is True
+    assert manager.get_task(1)['description'] == "Milk, eggs"
+    print("   + PASSED: Batch commands run without prompts")
+
+    # Test 2: Failing lines are reported and the batch goes on
+    assert failures == 3
+    errors = err.getvalue().splitlines()
+    assert errors[0] == "line 8: task 7 not found"
+    assert errors[1] == "line 9: Title cannot be empty"
+    assert errors[2].startswith("line 10: ")
+    assert errors[3].startswith("Ran 8 commands (3 failed)")
+    print("   + PASSED: Errors are reported per line with a throughput summary")
+
+    # Test 3: Asking for help prints it and the batch goes on
+    manager = TodoManager()
+    out, err = io.StringIO(), io.StringIO()
+    failures = run_batch(manager, ["add a\n", "list -h\n", "add b\n", "--help\n"], out, err)
+    assert failures == 0
+    assert [task['title'] for task in manager.get_all_tasks()] == ["a", "b"]
+    assert "usage: todo list" in out.getvalue() and "usage: todo [-h] COMMAND" in out.getvalue()
+    print("   + PASSED: Help on a batch line does not end the batch")
+
+
+def test_subcommands():
+    """
+    Test single subcommands against a journal directory.
+    """
+    print("\nTesting Subcommands for Todo Console App...")
+    print("="*50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        stdout = sys.stdout
+        sys.stdout = out = io.StringIO()
+        try:
+            assert main(['--journal', directory, 'add', "Buy groceries"]) == 0
+            assert main(['--journal', directory, 'toggle', '1']) == 0
+            assert main(['--journal', directory, 'list', '--completed']) == 0
+            assert main(['--journal', directory, 'delete', '2']) == 1
+        finally:
+            sys.stdout = stdout
+        assert out.getvalue() == "1\n1\tdone\tBuy groceries\t\n"
+    print("   + PASSED: Subcommands share state through the journal")
+
+
+if __name__ == "__main__":
+    test_batch_mode()
+    test_subcommands()
@@ -0,0 +1,197 @@
+# [Task]: Thread-Safe Task Manager
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+"""
+Multi-threaded stress test for the thread-safe Todo Console App manager.
+"""
+
+import random
+import sys
+import os
+import tempfile
+import threading
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from concurrent_manager import READ_RETRIES, ConcurrentTodoManager
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+THREADS = 8
+ROUNDS = 300
+SHARED_TASKS = 16
+
+
+def run_threads(worker):
+    """Run worker(thread_number) on THREADS threads at once and wait for them."""
+    errors = []
+    start = threading.Barrier(THREADS)
+
+    def run(number):
+        start.wait()
+        try:
+            worker(number)
+        except Exception as e:  # reported after the join
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(number,)) for number in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == [], errors
+
+
+def test_concurrent_stress():
+    """
+    Test that IDs, toggles and indexes stay consistent under contention.
+    """
+    print("Testing Concurrent Access for Todo Console App...")
+    print("="*50)
+
+    # Switch threads as often as possible to provoke races
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            manager = ConcurrentTodoManager(JournalStorage(directory, compact_every=500), stripes=4)
+            shared = [task['id'] for task in manager.add_tasks(
+                (f"Shared {i}", "") for i in range(SHARED_TASKS))]
+            created = [[] for _ in range(THREADS)]
+
+            def worker(number):
+                rng = random.Random(number)
+                for i in range(ROUNDS):
+                    created[number].append(manager.add_task(f"Thread {number} task {i}")['id'])
+                    # Every thread toggles every shared task once per round
+                    for task_id in shared:
+                        manager.toggle_complete(task_id)
+                    manager.update_task(rng.choice(shared), f"Renamed by {number}")
+                    if i % 10 == 0:
+                        manager.add_tasks([(f"Bulk {number}.{i}", "")] * 3)
+                        manager.delete_task(created[number].pop(0))
+                    # Readers run alongside the writers
+                    manager.get_task_page(0, 20, completed=True)
+                    manager.get_all_tasks()
+                    manager.search("renamed")
+                    manager.get_sorted_page('title', 0, 20, completed=True)
+
+            run_threads(worker)
+
+            # Test 1: IDs are unique and none were skipped
+            ids = [task['id'] for task in manager.iter_tasks()]
+            assert len(ids) == len(set(ids))
+            expected_adds = SHARED_TASKS + THREADS * ROUNDS + THREADS * (ROUNDS // 10) * 3
+            assert manager._next_id == expected_adds + 1
+            assert len(ids) == expected_adds - THREADS * (ROUNDS // 10)
+            print("   + PASSED: IDs are allocated atomically")
+
+            # Test 2: No toggle was lost (an even number of toggles per shared task)
+            assert all(manager.get_task(task_id)['completed'] is False for task_id in shared)
+            print("   + PASSED: No toggles were lost")
+
+            # Test 3: The status index matches the tasks
+            completed = [task['id'] for task in manager.iter_tasks() if task['completed']]
+            assert manager.count_by_status() == {'completed': len(completed),
+                                                 'pending': len(ids) - len(completed)}
+            assert [task['id'] for task in manager.iter_tasks(completed=True)] == completed
+            by_title = sorted((task for task in manager.iter_tasks() if task['completed']),
+                              key=lambda task: (task['title'].casefold(), task['id']))
+            assert manager.get_sorted_page('title', 0, len(ids), completed=True) == by_title
+            print("   + PASSED: Status index is consistent")
+
+            # Test 4: The journal replays to the same state
+            expected = [task.to_dict() for task in manager.iter_tasks()]
+            manager.close()
+            restored = TodoManager(JournalStorage(directory))
+            assert [task.to_dict() for task in restored.iter_tasks()] == expected
+            restored.close()
+            print("   + PASSED: Journal matches the in-memory state")
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_concurrent_adds_keep_id_order():
+    """
+    Test that tasks added from many threads are stored in ID order.
+    """
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        manager = ConcurrentTodoManager(stripes=4)
+
+        def worker(number):
+            for i in range(1_000):
+                manager.add_task(f"Thread {number} task {i}")
+                if i % 100 == 0:
+                    manager.add_tasks([(f"Bulk {number}.{i}", "")] * 3)
+
+        run_threads(worker)
+
+        expected = list(range(1, manager.task_count() + 1))
+        assert [task['id'] for task in manager.get_all_tasks()] == expected
+        assert [task['id'] for task in manager.get_task_page(0, len(expected))] == expected
+        assert [task['id'] for task in manager.get_task_page(5_000, 50)] == expected[5_000:5_050]
+        print("   + PASSED: Concurrent adds keep the task list in ID order")
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_index_locks_and_read_retries():
+    """
+    Test that writes skip the locks of unbuilt indexes and that reads stop retrying.
+    """
+    manager = ConcurrentTodoManager(stripes=4)
+    manager.add_tasks([("Buy milk", ""), ("Walk dog", "")])
+
+    # Test 1: With no search or sort index, writes never wait on their locks
+    done = threading.Event()
+
+    def write():
+        manager.add_task("Call mom")
+        manager.update_task(1, "Buy oat milk")
+        manager.toggle_complete(2)
+        manager.delete_task(3)
+        done.set()
+
+    with manager._search_lock, manager._sort_lock:
+        writer = threading.Thread(target=write)
+        writer.start()
+        assert done.wait(timeout=5), "a write waited on an index lock"
+    writer.join()
+    print("   + PASSED: Writes skip the locks of indexes not yet built")
+
+    # Test 2: Sorted reads do not wait on the search index lock
+    manager.search("milk")
+    manager.get_sorted_page('title', 0, 10)
+    pages = []
+    with manager._search_lock:
+        reader = threading.Thread(target=lambda: pages.append(manager.get_sorted_page('title', 0, 10)))
+        reader.start()
+        reader.join(timeout=5)
+        assert pages, "a sorted read waited on the search lock"
+    assert [task['id'] for task in pages[0]] == [1, 2]
+    print("   + PASSED: Search and sort indexes have separate locks")
+
+    # Test 3: A read that keeps failing falls back to the stripe locks
+    attempts = []
+
+    def failing_read():
+        attempts.append(manager._stripes[0]._is_owned())
+        raise RuntimeError("dictionary changed size during iteration")
+
+    try:
+        manager._read(failing_read)
+        assert False, "the read retried forever"
+    except RuntimeError:
+        pass
+    assert len(attempts) == READ_RETRIES + 1
+    assert attempts[-1] and not any(attempts[:-1])
+    print("   + PASSED: Reads stop retrying and take the stripe locks")
+
+
+if __name__ == "__main__":
+    test_concurrent_stress()
+    test_concurrent_adds_keep_id_order()
+    test_index_locks_and_read_retries()
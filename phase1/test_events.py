@@ -0,0 +1,101 @@
+# [Task]: Change Events
+# [From]: plan.md §TodoManager Class
+
+"""
+Test script to verify change events for the Todo Console App.
+"""
+
+import sys
+import os
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from events import ChangeEvent
+from todo_manager import TodoManager
+
+
+def test_change_events():
+    """
+    Test the typed events published for single and bulk changes.
+    """
+    print("Testing Change Events for Todo Console App...")
+    print("="*50)
+
+    manager = TodoManager()
+    batches = []
+    manager.add_change_listener(batches.append)
+
+    # Test 1: Every single change arrives as its own batch
+    manager.add_task("Buy groceries", "Milk")
+    manager.update_task(1, description="Milk, eggs")
+    manager.toggle_complete(1)
+    manager.delete_task(1)
+    assert batches == [
+        [ChangeEvent('added', 1, {'title': "Buy groceries", 'description': "Milk", 'completed': False})],
+        [ChangeEvent('updated', 1, {'description': "Milk, eggs"})],
+        [ChangeEvent('toggled', 1, {'completed': True})],
+        [ChangeEvent('deleted', 1, {})],
+    ]
+    print("   + PASSED: Single changes publish typed events")
+
+    # Test 2: A bulk operation arrives as one batch
+    batches.clear()
+    manager.add_tasks([("A", ""), ("B", "")])
+    manager.toggle_many([2, 3, 3])
+    assert [[(event.kind, event.task_id) for event in batch] for batch in batches] == [
+        [('added', 2), ('added', 3)],
+        [('toggled', 2)],
+    ]
+    print("   + PASSED: Bulk changes arrive in one coalesced batch")
+
+    # Test 3: Failed changes publish nothing
+    batches.clear()
+    assert not manager.toggle_complete(99)
+    assert not manager.delete_tasks([2, 99])
+    assert batches == []
+    print("   + PASSED: Failed changes publish no events")
+
+    # Test 4: Removed listeners are no longer called
+    manager.remove_change_listener(batches.append)
+    manager.add_task("C")
+    assert batches == []
+    print("   + PASSED: Listeners can be removed")
+
+
+def test_batch_changes():
+    """
+    Test that changes inside batch_changes() are merged into their net effect.
+    """
+    print("\nTesting Batched Change Events for Todo Console App...")
+    print("="*50)
+
+    manager = TodoManager()
+    manager.add_tasks([("A", ""), ("B", ""), ("C", "")])
+    batches = []
+    manager.add_change_listener(batches.append)
+
+    with manager.batch_changes():
+        manager.update_task(1, "A1")
+        manager.update_task(1, description="First")
+        manager.toggle_complete(1)
+        manager.toggle_complete(2)
+        manager.toggle_complete(2)
+        task = manager.add_task("D")
+        manager.update_task(task['id'], "D1")
+        manager.add_task("E")
+        manager.delete_task(5)
+        manager.delete_task(3)
+        assert batches == []
+
+    assert batches == [[
+        ChangeEvent('updated', 1, {'title': "A1", 'description': "First", 'completed': True}),
+        ChangeEvent('added', 4, {'title': "D1", 'description': "", 'completed': False}),
+        ChangeEvent('deleted', 3, {}),
+    ]]
+    print("   + PASSED: A batch delivers each task's net change once")
+
+
+if __name__ == "__main__":
+    test_change_events()
+    test_batch_changes()
@@ -0,0 +1,91 @@
+# [Task]: Task Import/Export
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+"""
+Test script to verify JSON Lines and CSV import/export for the Todo Console App.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from task_io import export_file, import_file
+from todo_manager import TodoManager
+
+
+def test_round_trip():
+    """
+    Test exporting tasks and importing them into a new manager.
+    """
+    print("Testing Import/Export for Todo Console App...")
+    print("="*50)
+
+    manager = TodoManager()
+    manager.add_task("Buy groceries", 'Milk, "organic" eggs\nand bread')
+    manager.add_task("Walk the dog")
+    manager.toggle_complete(2)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("tasks.jsonl", "tasks.csv"):
+            path = os.path.join(directory, name)
+            assert export_file(manager, path) == 2
+
+            restored = TodoManager()
+            assert import_file(restored, path, batch_size=1) == 2
+            assert [task.to_dict() for task in restored.iter_tasks()] == \
+                [task.to_dict() for task in manager.iter_tasks()]
+            print(f"   + PASSED: {name} round trip keeps text and status")
+
+
+def test_import_errors():
+    """
+    Test that invalid rows are reported with their line number.
+    """
+    print("\nTesting Import Validation for Todo Console App...")
+    print("="*50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.jsonl")
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write('{"title": "First"}\n\n{"title": "Second"}\n{"title": "   "}\n')
+
+        # Test 1: The batch holding the invalid row is not added
+        manager = TodoManager()
+        try:
+            import_file(manager, path, batch_size=2)
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert str(e) == "line 4: Title cannot be empty"
+        assert manager.task_count() == 2
+        print("   + PASSED: Invalid titles are reported by line")
+
+        # Test 2: Malformed lines and unknown formats
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write('["not", "an", "object"]\n')
+        for bad_path, message in ((path, "line 1: expected a JSON object with a title"),
+                                  (os.path.join(directory, "tasks.txt"), "Unknown format 'txt'")):
+            try:
+                import_file(TodoManager(), bad_path)
+                assert False, "expected ValueError"
+            except ValueError as e:
+                assert str(e).startswith(message)
+        print("   + PASSED: Malformed files are rejected")
+
+        # Test 3: CSV titles over the limit
+        path = os.path.join(directory, "tasks.csv")
+        with open(path, "w", encoding="utf-8", newline="") as stream:
+            stream.write("title,completed\nOK,yes\n" + "x" * 201 + ",no\n")
+        try:
+            import_file(TodoManager(), path)
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert str(e) == "line 3: Title cannot exceed 200 characters"
+        print("   + PASSED: Import reuses the add_task limits")
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_import_errors()
@@ -0,0 +1,121 @@
+# [Task]: Operation Statistics
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+"""
+Test script to verify operation statistics in the Todo Console App.
+"""
+
+import io
+import json
+import sys
+import os
+import random
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from cli import main
+from instrumentation import LatencyHistogram, OperationStats
+from todo_manager import TodoManager
+from ui import TodoUI
+
+
+def test_latency_histogram():
+    """
+    Test that histogram percentiles stay close to the exact ones.
+    """
+    print("Testing Operation Statistics for Todo Console App...")
+    print("="*50)
+
+    rng = random.Random(3)
+    samples = [int(rng.lognormvariate(9, 1.5)) for _ in range(20_000)]
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+    samples.sort()
+    for fraction in (0.5, 0.95, 0.99):
+        exact = samples[round(fraction * len(samples)) - 1]
+        assert abs(histogram.percentile(fraction) - exact) <= 0.07 * exact
+    assert histogram.count == 20_000 and histogram.max == samples[-1]
+    assert LatencyHistogram().percentile(0.5) == 0.0
+    print("   + PASSED: Percentiles are within 7%")
+
+
+def test_manager_stats():
+    """
+    Test counting calls, latencies and copied list sizes per method.
+    """
+    # Test 1: Without statistics the methods are left alone
+    manager = TodoManager()
+    assert 'add_task' not in vars(manager)
+    manager.add_task("Buy groceries")
+    assert manager.stats() == {}
+
+    # Test 2: Every call is counted, including failing ones
+    manager = TodoManager(stats=OperationStats())
+    manager.add_tasks((f"Task {i}", "") for i in range(100))
+    for task_id in range(1, 11):
+        manager.get_task(task_id)
+    manager.get_all_tasks()
+    manager.get_task_page(0, 20)
+    try:
+        manager.add_task("")
+        assert False, "empty title was accepted"
+    except ValueError:
+        pass
+    stats = manager.stats()
+    assert list(stats) == ['add_task', 'add_tasks', 'get_all_tasks', 'get_task', 'get_task_page']
+    assert stats['get_task']['calls'] == 10 and stats['add_task']['calls'] == 1
+    assert stats['get_all_tasks']['copied'] == 100 and stats['get_task_page']['max_copied'] == 20
+    assert stats['get_task']['copied'] == 0
+    entry = stats['get_task']
+    assert 0 < entry['p50_us'] <= entry['p95_us'] <= entry['p99_us'] <= entry['max_us']
+
+    # Calls made inside another operation are part of that operation
+    manager.toggle_complete(1)
+    assert manager.stats()['get_task']['calls'] == 10
+    print("   + PASSED: Calls, latencies and copies are recorded")
+
+    # Test 3: The console shows the table
+    stdout = sys.stdout
+    sys.stdout = out = io.StringIO()
+    try:
+        TodoUI(manager).handle_stats()
+        TodoUI(TodoManager()).handle_stats()
+    finally:
+        sys.stdout = stdout
+    assert "get_all_tasks" in out.getvalue() and "No operations recorded yet" in out.getvalue()
+    print("   + PASSED: The Stats menu shows every operation")
+
+
+def test_stats_dump():
+    """
+    Test the periodic and final JSON dumps.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "stats.json")
+        stats = OperationStats()
+        manager = TodoManager(stats=stats)
+        stats.dump_every(path, interval=0.01)
+        manager.add_task("Buy groceries")
+        manager.close()
+        with open(path, encoding="utf-8") as file:
+            assert json.load(file)['operations']['add_task']['calls'] == 1
+
+        # The command line dumps the statistics of a subcommand
+        stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            assert main(['--stats', path, 'add', "Walk the dog"]) == 0
+        finally:
+            sys.stdout = stdout
+        with open(path, encoding="utf-8") as file:
+            assert list(json.load(file)['operations']) == ['add_task']
+    print("   + PASSED: Statistics are dumped to JSON")
+
+
+if __name__ == "__main__":
+    test_latency_histogram()
+    test_manager_stats()
+    test_stats_dump()
@@ -0,0 +1,144 @@
+# [Task]: Persistent Journal Storage
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+"""
+Test script to verify journal persistence for the Todo Console App.
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+
+def snapshot_of(manager):
+    """Return the manager state as plain dictionaries for comparison."""
+    return [task.to_dict() for task in manager.iter_tasks()]
+
+
+def test_journal_replay():
+    """
+    Test that every kind of change survives a restart.
+    """
+    print("Testing Journal Replay for Todo Console App...")
+    print("="*50)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory))
+        manager.add_task("Buy groceries", "Milk, bread, eggs")
+        manager.add_task("Walk the dog")
+        manager.add_task("Finish project")
+        manager.update_task(2, "Walk the cat", "Take Fluffy for a walk")
+        manager.toggle_complete(1)
+        manager.delete_task(3)
+        expected = snapshot_of(manager)
+        manager.close()
+        
+        restored = TodoManager(JournalStorage(directory))
+        assert snapshot_of(restored) == expected
+        print("   + PASSED: Tasks restored from the journal")
+        
+        # IDs must not be reused after the highest task was deleted
+        assert restored.add_task("New task")['id'] == 4
+        print("   + PASSED: Next ID restored from the journal")
+        restored.close()
+
+
+def test_journal_compaction():
+    """
+    Test that compaction writes a snapshot and keeps the state intact.
+    """
+    print("\nTesting Journal Compaction for Todo Console App...")
+    print("="*50)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory, compact_every=10))
+        for i in range(25):
+            manager.add_task(f"Task {i}")
+        manager.delete_task(25)
+        manager.toggle_complete(5)
+        expected = snapshot_of(manager)
+        manager.close()
+        
+        logs = [name for name in os.listdir(directory) if name.endswith(".log")]
+        snapshots = [name for name in os.listdir(directory) if name.endswith(".snapshot")]
+        assert snapshots == ["tasks.2.snapshot"]
+        assert logs == ["tasks.2.log"]
+        print("   + PASSED: Snapshot written and old logs removed")
+        
+        restored = TodoManager(JournalStorage(directory))
+        assert snapshot_of(restored) == expected
+        assert restored.add_task("After compaction")['id'] == 26
+        print("   + PASSED: State restored from snapshot plus log")
+        restored.close()
+    
+    # Each change in a batch counts toward compaction, also after replay
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory, compact_every=10))
+        manager.add_tasks((f"Bulk {i}", "") for i in range(8))
+        manager.close()
+        manager = TodoManager(JournalStorage(directory, compact_every=10))
+        manager.add_tasks([("Ninth", ""), ("Tenth", "")])
+        assert [name for name in os.listdir(directory) if name.endswith(".snapshot")] == ["tasks.1.snapshot"]
+        assert manager.task_count() == 10
+        print("   + PASSED: Batch records count each change toward compaction")
+        manager.close()
+
+
+def test_journal_torn_record():
+    """
+    Test that a partially written last record is discarded on replay.
+    """
+    print("\nTesting Torn Journal Records for Todo Console App...")
+    print("="*50)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory))
+        manager.add_task("Survives the crash")
+        manager.close()
+        
+        with open(os.path.join(directory, "tasks.0.log"), "a", encoding="utf-8") as log:
+            log.write('{"op":"add","id":2,"tit')
+        
+        restored = TodoManager(JournalStorage(directory))
+        assert [task['title'] for task in restored.iter_tasks()] == ["Survives the crash"]
+        restored.add_task("Written after recovery")
+        restored.close()
+        
+        again = TodoManager(JournalStorage(directory))
+        assert again.task_count() == 2
+        print("   + PASSED: Torn record discarded and log stays appendable")
+        again.close()
+
+
+def test_journal_idle_commit():
+    """
+    Test that a buffered change is committed without a later change or close().
+    """
+    print("\nTesting Idle Journal Commits for Todo Console App...")
+    print("="*50)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory, commit_interval=0.05))
+        manager.add_task("Written while idle")
+        time.sleep(0.3)
+        
+        # Reopen while the first manager is still open, as after a crash
+        reopened = TodoManager(JournalStorage(directory))
+        assert [task['title'] for task in reopened.iter_tasks()] == ["Written while idle"]
+        print("   + PASSED: Idle change committed within the commit interval")
+        reopened.close()
+        manager.close()
+
+
+if __name__ == "__main__":
+    test_journal_replay()
+    test_journal_compaction()
+    test_journal_torn_record()
+    test_journal_idle_commit()
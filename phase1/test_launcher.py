@@ -0,0 +1,59 @@
+# [Task]: Unified Launcher
+# [From]: plan.md §Main Application, specify.md §Menu System
+
+"""
+Test script to verify the unified launcher of the Todo Console App.
+"""
+
+import sys
+import os
+import subprocess
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def python(*arguments, stdin=""):
+    """Run a fresh interpreter in the project root and return its stdout."""
+    process = subprocess.run([sys.executable, *arguments], cwd=PROJECT_ROOT, input=stdin,
+                             capture_output=True, text=True, encoding="utf-8")
+    assert process.returncode == 0, process.stderr
+    return process.stdout
+
+
+def test_launcher_modes():
+    """
+    Test that each mode runs through the launcher.
+    """
+    print("Testing Launcher for Todo Console App...")
+    print("="*50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        assert python('todo.py', '--journal', directory, 'add', "Buy groceries") == "1\n"
+        assert python('todo.py', '--journal', directory, 'batch', stdin="toggle 1\nlist\n") == \
+            "1\tdone\tBuy groceries\t\n"
+        assert "Goodbye" in python('todo.py', '--journal', directory)
+    assert "--journal DIR" in python('todo.py', 'gui', '--help')
+    print("   + PASSED: Command, batch, console and GUI modes start")
+
+
+def test_lazy_imports():
+    """
+    Test that tkinter and the menu are only imported by the modes that use them.
+    """
+    loaded = python('-c', "import sys, todo; todo.main(['list']); "
+                          "print('tkinter' in sys.modules, 'src.ui' in sys.modules)")
+    assert loaded == "False False\n"
+    loaded = python('-c', "import sys, gui_ui; print('tkinter' in sys.modules)")
+    assert loaded == "False\n"
+    print("   + PASSED: Heavy imports wait for the mode that needs them")
+
+    # The src modules import as a package, without src/ on sys.path
+    assert python('-c', "from src.todo_manager import TodoManager; "
+                        "print(TodoManager().add_task('Walk the dog')['id'])") == "1\n"
+    print("   + PASSED: src imports as a package")
+
+
+if __name__ == "__main__":
+    test_launcher_modes()
+    test_lazy_imports()
@@ -0,0 +1,84 @@
+# [Task]: Task Search
+# [From]: plan.md §TodoManager Class, specify.md §Features
+
+"""
+Test script to verify task search for the Todo Console App.
+"""
+
+import sys
+import os
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from todo_manager import TodoManager
+
+
+def titles(tasks):
+    """Return the titles of the given tasks."""
+    return [task['title'] for task in tasks]
+
+
+def test_search():
+    """
+    Test prefix matching, ranking and limits.
+    """
+    print("Testing Search for Todo Console App...")
+    print("="*50)
+    
+    manager = TodoManager()
+    manager.add_task("Buy groceries", "Milk, bread, eggs")
+    manager.add_task("Walk the dog", "Buy treats on the way")
+    manager.add_task("Finish project", "Complete the todo app implementation")
+    
+    # Test 1: Prefix matching, case-insensitive
+    assert titles(manager.search("GRO")) == ["Buy groceries"]
+    print("   + PASSED: Prefix search is case-insensitive")
+    
+    # Test 2: Title matches rank above description matches
+    assert titles(manager.search("buy")) == ["Buy groceries", "Walk the dog"]
+    print("   + PASSED: Title matches rank first")
+    
+    # Test 3: Every query word must match
+    assert titles(manager.search("walk treats")) == ["Walk the dog"]
+    assert manager.search("walk groceries") == []
+    assert manager.search("") == []
+    print("   + PASSED: All query words must match")
+    
+    # Test 4: Limit
+    assert len(manager.search("the", limit=1)) == 1
+    print("   + PASSED: Results respect the limit")
+
+
+def test_search_follows_changes():
+    """
+    Test that the index follows updates, deletions and bulk changes.
+    """
+    print("\nTesting Search Index Maintenance for Todo Console App...")
+    print("="*50)
+    
+    manager = TodoManager()
+    manager.add_task("Buy groceries")
+    manager.add_task("Walk the dog")
+    assert titles(manager.search("dog")) == ["Walk the dog"]
+    
+    manager.update_task(2, "Walk the cat")
+    assert manager.search("dog") == []
+    assert titles(manager.search("cat")) == ["Walk the cat"]
+    print("   + PASSED: Updated titles are re-indexed")
+    
+    manager.delete_task(1)
+    assert manager.search("groceries") == []
+    print("   + PASSED: Deleted tasks are removed from the index")
+    
+    manager.add_tasks([("Cat food", ""), ("Dog food", "")])
+    manager.update_tasks([(3, None, "For the cat")])
+    assert titles(manager.search("cat")) == ["Cat food", "Walk the cat"]
+    manager.delete_tasks([2, 3])
+    assert titles(manager.search("food")) == ["Dog food"]
+    print("   + PASSED: Bulk changes keep the index in sync")
+
+
+if __name__ == "__main__":
+    test_search()
+    test_search_follows_changes()
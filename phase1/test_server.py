@@ -0,0 +1,147 @@
+# [Task]: HTTP API Server
+# [From]: plan.md §TodoManager Class, specify.md §F1-F5
+
+"""
+Test script to verify the HTTP/JSON API of the Todo Console App.
+"""
+
+import asyncio
+import json
+import sys
+import os
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from async_manager import AsyncTodoManager
+from server import TodoServer, serve
+
+
+def build_request(method, path, body=None, headers=None):
+    """Encode an HTTP/1.1 request."""
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    lines = [f"{method} {path} HTTP/1.1", "Host: localhost", f"Content-Length: {len(data)}"]
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + data
+
+
+async def read_response(reader):
+    """Read one response and return (status, headers, decoded JSON body or None)."""
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1")
+        if line == "\r\n":
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers["content-length"]))
+    return status, headers, json.loads(body) if body else None
+
+
+def test_server():
+    """
+    Test the REST endpoints, keep-alive, pipelining and conditional GETs.
+    """
+    print("Testing HTTP API for Todo Console App...")
+    print("="*50)
+
+    async def scenario():
+        ready = asyncio.get_running_loop().create_future()
+        server = asyncio.ensure_future(serve(port=0, ready=ready.set_result))
+        host, port = await ready
+        reader, writer = await asyncio.open_connection(host, port)
+
+        async def call(method, path, body=None, headers=None):
+            writer.write(build_request(method, path, body, headers))
+            return await read_response(reader)
+
+        # Test 1: CRUD over one kept-alive connection
+        status, _, task = await call("POST", "/tasks", {"title": "Buy groceries", "description": "Milk"})
+        assert status == 201 and task == {'id': 1, 'title': "Buy groceries",
+                                          'description': "Milk", 'completed': False}
+        assert (await call("GET", "/tasks/1"))[2]['title'] == "Buy groceries"
+        assert (await call("PATCH", "/tasks/1", {"title": "Buy food"}))[2]['title'] == "Buy food"
+        assert (await call("POST", "/tasks/1/toggle"))[2]['completed'] is True
+        assert (await call("DELETE", "/tasks/1"))[0] == 204
+        assert (await call("GET", "/tasks/1"))[0] == 404
+        print("   + PASSED: CRUD endpoints work on a kept-alive connection")
+
+        # Test 2: Invalid input is rejected without closing the connection
+        assert (await call("POST", "/tasks", {"title": ""}))[0] == 400
+        assert (await call("GET", "/tasks/abc"))[0] == 400
+        assert (await call("PUT", "/tasks"))[0] == 405
+        assert (await call("GET", "/nowhere"))[0] == 404
+        assert (await call("PATCH", "/tasks/1", {"title": 123}))[0] == 400
+        assert (await call("PATCH", "/tasks", [{"id": 1, "description": ["x"]}]))[0] == 400
+        print("   + PASSED: Errors get 4xx responses")
+
+        # Test 3: Bulk endpoints
+        status, _, tasks = await call("POST", "/tasks", [{"title": f"Task {i}"} for i in range(5)])
+        assert status == 201 and [task['id'] for task in tasks] == [2, 3, 4, 5, 6]
+        assert (await call("POST", "/tasks/toggle", {"ids": [2, 3]}))[0] == 204
+        assert (await call("POST", "/tasks/delete", {"ids": [4, 99]}))[0] == 404
+        assert (await call("POST", "/tasks/delete", {"ids": [4]}))[0] == 204
+        assert (await call("PATCH", "/tasks", [{"id": 5, "title": "Five"}]))[0] == 204
+        assert (await call("GET", "/stats"))[2] == {'completed': 2, 'pending': 2}
+        assert [task['id'] for task in (await call("GET", "/tasks?status=completed"))[2]] == [2, 3]
+        print("   + PASSED: Bulk endpoints change many tasks at once")
+
+        # Test 4: Conditional GETs of the task list
+        status, headers, tasks = await call("GET", "/tasks?limit=2")
+        assert status == 200 and len(tasks) == 2
+        etag = headers['etag']
+        assert (await call("GET", "/tasks?limit=2", headers={"If-None-Match": etag}))[0] == 304
+        await call("POST", "/tasks/6/toggle")
+        status, headers, _ = await call("GET", "/tasks?limit=2", headers={"If-None-Match": etag})
+        assert status == 200 and headers['etag'] != etag
+        # A restarted server at the same change count does not accept old ETags
+        first, restarted = TodoServer(AsyncTodoManager()), TodoServer(AsyncTodoManager())
+        old_etag = (await first.list_tasks({}, {}))[2]["ETag"]
+        assert (await restarted.list_tasks({}, {"if-none-match": old_etag}))[0] == 200
+        print("   + PASSED: ETags change with the tasks and across restarts")
+
+        # Test 5: Pipelined requests are answered in order
+        writer.write(b"".join(build_request("GET", f"/tasks/{task_id}") for task_id in (2, 3, 5)))
+        responses = [await read_response(reader) for _ in range(3)]
+        assert [body['id'] for _, _, body in responses] == [2, 3, 5]
+        print("   + PASSED: Pipelined requests are answered in order")
+
+        # Test 6: Connection: close is honoured
+        status, headers, _ = await call("GET", "/stats", headers={"Connection": "close"})
+        assert headers['connection'] == "close" and await reader.read() == b""
+        writer.close()
+        print("   + PASSED: Connection: close ends the connection")
+
+        # Test 7: A negative Content-Length gets a 400 before the connection closes
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b"POST /tasks HTTP/1.1\r\nContent-Length: -1\r\n\r\n")
+        assert (await read_response(reader))[0] == 400 and await reader.read() == b""
+        writer.close()
+        print("   + PASSED: Malformed requests are answered before closing")
+
+        # Test 8: An unexpected error gets a 500 and the server keeps serving
+        reader, writer = await asyncio.open_connection(host, port)
+        nested = b"[" * 100_000
+        writer.write(b"POST /tasks HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(nested) + nested)
+        status, headers, body = await read_response(reader)
+        assert status == 500 and headers['connection'] == "close" and "RecursionError" in body['error']
+        assert await reader.read() == b""
+        writer.close()
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(build_request("GET", "/stats"))
+        assert (await read_response(reader))[0] == 200
+        writer.close()
+        print("   + PASSED: Unexpected errors are answered with a 500")
+
+        server.cancel()
+        try:
+            await server
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_server()
@@ -0,0 +1,133 @@
+# [Task]: Sharded Task Manager
+# [From]: plan.md §TodoManager Class, constitution.md §Data Management
+
+"""
+Test script to verify the multi-process sharded manager of the Todo Console App.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from events import ChangeEvent
+from sharded_manager import ShardedTodoManager
+from todo_manager import TodoManager
+
+
+def apply_operations(manager):
+    """Run the same mix of single and bulk changes against any manager."""
+    manager.add_tasks((f"Task {i}", f"Notes {i}") for i in range(20))
+    manager.add_task("Buy groceries", "Milk and bread")
+    manager.toggle_many([1, 2, 3, 5, 8, 13])
+    manager.toggle_complete(2)
+    manager.update_task(4, "Renamed task")
+    manager.update_tasks([(6, None, "New notes"), (7, "Seven", None)])
+    manager.delete_task(10)
+    manager.delete_tasks([11, 12])
+
+
+def test_sharded_manager():
+    """
+    Test that a sharded manager behaves like a single TodoManager.
+    """
+    print("Testing Sharded Manager for Todo Console App...")
+    print("="*50)
+
+    expected = TodoManager()
+    apply_operations(expected)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = ShardedTodoManager(shards=3, directory=directory)
+        try:
+            apply_operations(manager)
+
+            # Test 1: Scatter-gather views match the single manager, in order
+            assert [task.to_dict() for task in manager.get_all_tasks()] == \
+                [task.to_dict() for task in expected.get_all_tasks()]
+            for completed in (True, False):
+                assert [task['id'] for task in manager.iter_tasks(completed)] == \
+                    [task['id'] for task in expected.iter_tasks(completed)]
+            assert manager.task_count() == expected.task_count()
+            assert manager.count_by_status() == expected.count_by_status()
+            print("   + PASSED: Scatter-gather views are in global order")
+
+            # Test 2: Pages and lookups cross shard boundaries
+            for offset, limit, completed in ((0, 5, None), (7, 6, None), (1, 3, True), (4, 10, False)):
+                assert [task['id'] for task in manager.get_task_page(offset, limit, completed)] == \
+                    [task['id'] for task in expected.get_task_page(offset, limit, completed)]
+            assert manager.get_task(4)['title'] == "Renamed task"
+            assert manager.get_task(10) is None
+            assert [task['id'] for task in manager.search("task", limit=5)] == \
+                [task['id'] for task in expected.search("task", limit=5)]
+            print("   + PASSED: Pages, lookups and searches match")
+
+            # Test 3: Errors and missing tasks behave like TodoManager
+            try:
+                manager.add_task("   ")
+                assert False, "empty title was accepted"
+            except ValueError:
+                pass
+            assert manager.update_task(10, "Gone") is False
+            assert manager.toggle_many([1, 10]) is False
+            assert manager.get_task(1)['completed'] is True
+            assert manager.delete_tasks([2, 99]) is False and manager.get_task(2) is not None
+            print("   + PASSED: Missing tasks leave every shard unchanged")
+
+            # Test 4: Change listeners are notified
+            events = []
+            manager.add_change_listener(events.extend)
+            task = manager.add_task("Call mom")
+            manager.toggle_complete(task['id'])
+            assert events == [ChangeEvent('added', task['id'], {'title': "Call mom", 'description': "",
+                                                                'completed': False}),
+                              ChangeEvent('toggled', task['id'], {'completed': True})]
+            print("   + PASSED: Change events are published")
+            expected_tasks = [task.to_dict() for task in manager.get_all_tasks()]
+        finally:
+            manager.close()
+
+        # Test 5: IDs stay unique across a restart from the shard journals
+        restored = ShardedTodoManager(shards=3, directory=directory)
+        try:
+            assert [task.to_dict() for task in restored.get_all_tasks()] == expected_tasks
+            assert restored.add_task("After restart")['id'] == task['id'] + 1
+        finally:
+            restored.close()
+        try:
+            ShardedTodoManager(shards=2, directory=directory)
+            assert False, "shard count change was accepted"
+        except ValueError:
+            pass
+        print("   + PASSED: Shards restore from their journals")
+
+    # Test 6: Tasks added from several threads at once stay in ID order
+    manager = ShardedTodoManager(shards=2)
+    try:
+        adders = [threading.Thread(target=lambda: [manager.add_task("Concurrent") for _ in range(300)])
+                  for _ in range(4)]
+        for adder in adders:
+            adder.start()
+        for adder in adders:
+            adder.join()
+        assert [task['id'] for task in manager.get_all_tasks()] == list(range(1, 1201))
+        assert [task['id'] for task in manager.get_task_page(0, 50)] == list(range(1, 51))
+        print("   + PASSED: Concurrent adds are listed in ID order")
+
+        # Test 7: A shard survives a method failing with any exception
+        try:
+            manager.search(None)
+            assert False, "invalid query was accepted"
+        except Exception as e:
+            assert not isinstance(e, AssertionError)
+        assert manager.get_task(1)['title'] == "Concurrent"
+        print("   + PASSED: Unexpected errors are reported without stopping a shard")
+    finally:
+        manager.close()
+
+
+if __name__ == "__main__":
+    test_sharded_manager()
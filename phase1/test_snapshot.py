@@ -0,0 +1,99 @@
+# [Task]: Binary Task Snapshot
+# [From]: constitution.md §Data Management, plan.md §TodoManager Class
+
+"""
+Test script to verify the memory-mapped task snapshot for the Todo Console App.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from journal import JournalStorage
+from snapshot import SnapshotTasks, write_snapshot
+from task import Task
+from todo_manager import TodoManager
+
+
+def test_snapshot_store():
+    """
+    Test reading and changing tasks through a mapped snapshot.
+    """
+    print("Testing Snapshot Store for Todo Console App...")
+    print("="*50)
+
+    tasks = [Task(1, "Buy groceries", "Milk, bread, eggs"),
+             Task(2, "Café ☕", "", True),
+             Task(4, "Finish project", "Complete the todo app")]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.snapshot")
+        write_snapshot(path, tasks, 5)
+        store = SnapshotTasks(path)
+
+        # Test 1: Lookups decode tasks on first access only
+        assert store.next_id == 5 and len(store) == 3
+        assert store._touched == {}
+        assert store[2].to_dict() == tasks[1].to_dict()
+        assert store[2] is store[2]
+        assert 3 not in store and store.get(3) is None
+        assert list(store) == [1, 2, 4]
+        print("   + PASSED: Tasks are decoded when first looked up")
+
+        # Test 2: Every view hands out the same Task objects
+        first, second = list(store.values()), list(store.values())
+        assert all(a is b for a, b in zip(first, second)) and first[0] is store[1]
+        print("   + PASSED: Decoded tasks are kept and shared by every view")
+
+        # Test 3: Changes live next to the read-only file
+        store[4].completed = True
+        del store[1]
+        store[5] = Task(5, "New task")
+        store[1] = Task(1, "Restored task")
+        # A task stored again takes its old place, so the store stays in ID order
+        assert list(store) == [1, 2, 4, 5]
+        assert [task.title for task in store.values()] == ["Restored task", "Café ☕", "Finish project", "New task"]
+        assert store.count_completed() == 2
+        assert store.status_ids() == {False: {5, 1}, True: {2, 4}}
+        print("   + PASSED: Added, changed and deleted tasks are tracked")
+        store.close()
+
+
+def test_snapshot_startup():
+    """
+    Test that a manager restored from a snapshot works without a full scan.
+    """
+    print("\nTesting Snapshot Startup for Todo Console App...")
+    print("="*50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory, compact_every=50))
+        for i in range(100):
+            manager.add_task(f"Task {i}")
+        manager.toggle_many([2, 4, 6])
+        manager.close()
+
+        restored = TodoManager(JournalStorage(directory))
+        assert isinstance(restored._tasks, SnapshotTasks)
+        assert restored.count_by_status() == {'completed': 3, 'pending': 97}
+        assert restored.toggle_complete(1) and restored.delete_task(2)
+        assert restored.count_by_status() == {'completed': 3, 'pending': 96}
+        assert [task['id'] for task in restored.iter_tasks(completed=True)] == [1, 4, 6]
+        assert [task['id'] for task in restored.get_task_page(0, 3)] == [1, 3, 4]
+        assert [task['title'] for task in restored.search("task 99")] == ["Task 99"]
+        print("   + PASSED: Counts, filters, pages and search work after a mapped start")
+
+        # A task held from a list view sees later updates
+        held = restored.get_all_tasks()[50]
+        restored.update_task(held['id'], "Renamed")
+        assert held['title'] == "Renamed" and next(restored.iter_tasks()) is restored.get_all_tasks()[0]
+        print("   + PASSED: Tasks from list views are the live stored tasks")
+        restored.close()
+
+
+if __name__ == "__main__":
+    test_snapshot_store()
+    test_snapshot_startup()
@@ -0,0 +1,169 @@
+# [Task]: Sorted Task Views
+# [From]: plan.md §TodoManager Class, specify.md §F2: View Tasks
+
+"""
+Test script to verify sorted task views in the Todo Console App.
+"""
+
+import sys
+import os
+import random
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from concurrent_manager import ConcurrentTodoManager
+from history import UndoHistory
+from sorted_index import SORT_KEYS, SortedKeyList
+from todo_manager import TodoManager
+
+
+def expected_ids(manager, sort_by, descending=False, completed=None):
+    """Return the task IDs sorted by a full sort of the task list."""
+    tasks = sorted(manager.iter_tasks(completed), key=SORT_KEYS[sort_by], reverse=descending)
+    return [task['id'] for task in tasks]
+
+
+def page_ids(manager, sort_by, offset, limit, descending=False, completed=None):
+    """Return the task IDs of one sorted page."""
+    return [task['id'] for task in manager.get_sorted_page(sort_by, offset, limit, descending, completed)]
+
+
+def check_views(manager):
+    """Assert every sorted view and page matches a full sort."""
+    for sort_by in SORT_KEYS:
+        for completed in (None, True, False):
+            for descending in (False, True):
+                expected = expected_ids(manager, sort_by, descending, completed)
+                assert page_ids(manager, sort_by, 0, len(expected) + 5, descending, completed) == expected
+                for offset, limit in ((0, 3), (2, 4), (max(len(expected) - 2, 0), 5)):
+                    assert page_ids(manager, sort_by, offset, limit, descending, completed) == \
+                        expected[offset:offset + limit]
+
+
+def test_sorted_key_list():
+    """
+    Test the order-statistic list against a plain sorted list.
+    """
+    print("Testing Sorted Views for Todo Console App...")
+    print("="*50)
+
+    rng = random.Random(7)
+    keys = SortedKeyList(rng.sample(range(100_000), 3_000))
+    reference = sorted(keys)
+    for _ in range(5_000):
+        if reference and rng.random() < 0.45:
+            key = reference.pop(rng.randrange(len(reference)))
+            keys.remove(key)
+        else:
+            key = rng.randrange(100_000)
+            if key not in keys.slice(keys.rank(key), keys.rank(key) + 1):
+                keys.add(key)
+                reference.append(key)
+                reference.sort()
+    assert list(keys) == reference and len(keys) == len(reference)
+    for start in (0, 511, 512, 1_500, len(reference) - 3):
+        assert keys.slice(start, start + 700) == reference[start:start + 700]
+    assert keys.rank(reference[1_000]) == 1_000
+    try:
+        keys.remove(-1)
+        assert False, "missing key was removed"
+    except KeyError:
+        pass
+    print("   + PASSED: Rank and slice match a sorted list")
+
+    keys.extend(range(100_000, 101_000))
+    reference.extend(range(100_000, 101_000))
+    assert list(keys) == reference and len(keys) == len(reference)
+    assert keys.slice(len(reference) - 600, len(reference)) == reference[-600:]
+    assert keys.rank(100_500) == len(reference) - 500
+    print("   + PASSED: Extending with larger keys keeps ranks and slices")
+
+
+def test_sorted_pages():
+    """
+    Test sorted pages, filters and ranks as the task list changes.
+    """
+    manager = TodoManager(history=UndoHistory())
+    manager.add_tasks([("banana", "b"), ("Apple", "c"), ("cherry", "a"), ("apple", "d"), ("Date", "")])
+    manager.toggle_many([2, 5])
+
+    # Test 1: Text sorts case-insensitively with ties in ID order
+    assert page_ids(manager, 'title', 0, 10) == [2, 4, 1, 3, 5]
+    assert page_ids(manager, 'title', 1, 2, descending=True) == [3, 1]
+    assert page_ids(manager, 'title', 0, 10, completed=True) == [2, 5]
+    assert page_ids(manager, 'status', 0, 10) == [1, 3, 4, 2, 5]
+    check_views(manager)
+    print("   + PASSED: Pages match a full sort")
+
+    # Test 2: Ranks come from the index
+    assert manager.task_rank(3, 'title') == 3
+    assert manager.task_rank(3, 'description') == 1
+    assert manager.task_rank(99, 'title') is None
+    print("   + PASSED: Task ranks")
+
+    # Test 3: The indexes follow every kind of change
+    manager.add_task("aardvark")
+    manager.update_task(1, "Zebra")
+    manager.toggle_complete(3)
+    manager.delete_task(4)
+    manager.update_tasks([(2, None, "zz"), (5, "avocado", None)])
+    manager.toggle_many([1, 2])
+    manager.delete_tasks([6])
+    check_views(manager)
+    while manager.undo():
+        check_views(manager)
+    while manager.redo():
+        check_views(manager)
+    print("   + PASSED: Indexes stay in sync through changes and undo")
+
+    # Test 4: Unknown fields are rejected
+    try:
+        manager.get_sorted_page('priority', 0, 10)
+        assert False, "unknown field was accepted"
+    except ValueError:
+        pass
+    print("   + PASSED: Unknown sort fields are rejected")
+
+
+def test_status_pages():
+    """
+    Test filtered and unfiltered pages as tasks are added, toggled,
+    deleted and restored.
+    """
+    rng = random.Random(11)
+    # The concurrent manager has no undo history, so undo() does nothing there
+    for manager in (TodoManager(history=UndoHistory()), ConcurrentTodoManager()):
+        manager.add_tasks([(f"Task {n}", "") for n in range(3_000)])
+        for step in range(600):
+            ids = [task['id'] for task in manager.get_all_tasks()]
+            choice = rng.random()
+            if choice < 0.4:
+                manager.toggle_complete(rng.choice(ids))
+            elif choice < 0.6:
+                manager.delete_task(rng.choice(ids))
+            elif choice < 0.8:
+                manager.add_task(f"New {step}")
+            else:
+                manager.undo()
+
+            # Filtered views are in ID order without sorting them here
+            if step % 50 == 0:
+                every_id = [task['id'] for task in manager.get_all_tasks()]
+                assert every_id == sorted(every_id)
+                for completed in (False, True, None):
+                    expected = [task['id'] for task in manager.get_all_tasks()
+                                if completed is None or task['completed'] == completed]
+                    assert [task['id'] for task in manager.iter_tasks(completed)] == expected
+                    for offset in (0, 100, 990, 2_000, max(len(expected) - 20, 0)):
+                        page = manager.get_task_page(offset, 50, completed)
+                        assert [task['id'] for task in page] == expected[offset:offset + 50]
+                    if completed is not None:
+                        assert manager.count_by_status()['completed' if completed else 'pending'] == len(expected)
+    print("   + PASSED: Pages stay in ID order through changes")
+
+
+if __name__ == "__main__":
+    test_sorted_key_list()
+    test_sorted_pages()
+    test_status_pages()
@@ -0,0 +1,198 @@
+# [Task]: SQLite Task Storage
+# [From]: plan.md §TodoManager Class, specify.md §Features
+
+"""
+Test script to verify the SQLite manager matches TodoManager behaviour.
+"""
+
+import sys
+import os
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from events import ChangeEvent
+from history import UndoHistory
+from instrumentation import OperationStats
+from sqlite_manager import SQLiteTodoManager
+from todo_manager import TodoManager
+
+
+def run_crud_scenario(manager):
+    """
+    Run the CRUD scenario from test_todo_app.py and return the results.
+    """
+    task1 = manager.add_task("Buy groceries", "Milk, bread, eggs")
+    manager.add_task("Walk the dog")
+    task3 = manager.add_task("Finish project", "Complete the todo app implementation")
+    
+    results = [
+        manager.update_task(2, "Walk the cat", "Take Fluffy for a walk"),
+        manager.toggle_complete(task1['id']),
+        manager.delete_task(task3['id']),
+        manager.get_task(999),
+        manager.update_task(999, "Non-existent task"),
+        manager.delete_task(999),
+        manager.toggle_complete(999),
+    ]
+    return results, [dict(task) for task in manager.get_all_tasks()]
+
+
+def test_sqlite_matches_memory():
+    """
+    Test that both managers produce the same results for the CRUD scenario.
+    """
+    print("Testing SQLite Manager for Todo Console App...")
+    print("="*50)
+    
+    expected = run_crud_scenario(TodoManager())
+    actual = run_crud_scenario(SQLiteTodoManager())
+    assert actual == expected
+    print("   + PASSED: SQLite manager matches the in-memory manager")
+
+
+def test_sqlite_errors_and_bulk():
+    """
+    Test validation errors and atomic bulk inserts.
+    """
+    print("\nTesting SQLite Validation and Bulk Inserts...")
+    print("="*50)
+    
+    manager = SQLiteTodoManager()
+    for bad_call in (lambda: manager.add_task(""),
+                     lambda: manager.add_task("A" * 201),
+                     lambda: manager.add_task("Valid", "A" * 1001)):
+        try:
+            bad_call()
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            print(f"   + PASSED: Correctly raised ValueError: {e}")
+    
+    tasks = manager.add_tasks([("First", ""), ("Second", "Bulk")])
+    assert [task['id'] for task in tasks] == [1, 2]
+    
+    try:
+        manager.add_tasks([("Third", ""), ("", "")])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    assert manager.task_count() == 2
+    print("   + PASSED: Bulk insert is all-or-nothing")
+    
+    # IDs are never reused, even after deleting the newest task
+    manager.delete_task(2)
+    assert manager.add_task("Third")['id'] == 3
+    print("   + PASSED: IDs are not reused after deletion")
+    manager.close()
+
+
+
+def test_sqlite_views_and_search():
+    """
+    Test that sorted pages, ranks and searches match the in-memory manager.
+    """
+    print("\nTesting SQLite Sorted Views and Search...")
+    print("="*50)
+    
+    managers = [TodoManager(), SQLiteTodoManager()]
+    for manager in managers:
+        manager.add_tasks((f"{word} task {i}", f"Notes about {word}")
+                          for i, word in enumerate(["walk", "Buy", "call", "groceries", "apple"] * 8))
+        manager.toggle_many(range(1, 41, 3))
+        manager.delete_task(6)
+    expected, actual = managers
+    
+    for field in ('id', 'title', 'description', 'status'):
+        for descending in (False, True):
+            for completed in (None, True, False):
+                assert [task['id'] for task in actual.get_sorted_page(field, 3, 10, descending, completed)] == \
+                    [task['id'] for task in expected.get_sorted_page(field, 3, 10, descending, completed)]
+        assert [actual.task_rank(task_id, field) for task_id in (1, 7, 40)] == \
+            [expected.task_rank(task_id, field) for task_id in (1, 7, 40)]
+    assert actual.task_rank(6, 'title') is None
+    print("   + PASSED: Sorted pages and ranks match")
+    
+    for query in ("gro", "buy task", "apple notes", "missing"):
+        assert [task['id'] for task in actual.search(query, limit=5)] == \
+            [task['id'] for task in expected.search(query, limit=5)]
+    actual.update_task(4, "Renamed", "")
+    assert 4 not in [task['id'] for task in actual.search("groceries")]
+    assert [task['id'] for task in actual.search("renamed")] == [4]
+    print("   + PASSED: Search matches and follows changes")
+    actual.close()
+
+
+def test_sqlite_listeners_undo_and_stats():
+    """
+    Test change events, undo/redo and operation statistics.
+    """
+    print("\nTesting SQLite Events, Undo and Stats...")
+    print("="*50)
+    
+    stats = OperationStats()
+    manager = SQLiteTodoManager(history=UndoHistory(), stats=stats)
+    events = []
+    manager.add_change_listener(events.extend)
+    manager.add_tasks([(f"Task {i}", "") for i in range(1, 5)])
+    with manager.batch_changes():
+        manager.toggle_complete(1)
+        manager.update_task(2, "Renamed")
+    assert events[-2:] == [ChangeEvent('toggled', 1, {'completed': True}),
+                           ChangeEvent('updated', 2, {'title': "Renamed"})]
+    print("   + PASSED: Change events are published")
+    
+    manager.delete_task(2)
+    assert manager.undo() and [task['id'] for task in manager.get_all_tasks()] == [1, 2, 3, 4]
+    assert manager.undo() and manager.get_task(2)['title'] == "Task 2"
+    assert manager.undo() and manager.get_task(1)['completed'] is False
+    assert manager.redo() and manager.get_task(1)['completed'] is True
+    assert manager.can_undo() and manager.can_redo()
+    manager.remove_change_listener(events.extend)
+    print("   + PASSED: Undo and redo revert and reapply changes")
+    
+    assert manager.stats()['toggle_complete']['calls'] == 1
+    assert manager.stats()['add_tasks']['copied'] == 4
+    manager.close()
+    print("   + PASSED: Operations are timed")
+
+
+def run_bulk_update(manager, updates):
+    """
+    Run one update_tasks() call on a fresh task list and return its outcome
+    (the result or the exception type) and the tasks afterwards.
+    """
+    manager.add_tasks([("Buy groceries", ""), ("Walk the dog", ""), ("Call mom", "")])
+    try:
+        outcome = manager.update_tasks(updates)
+    except ValueError as e:
+        outcome = type(e).__name__
+    return outcome, [dict(task) for task in manager.get_all_tasks()]
+
+
+def test_bulk_update_conformance():
+    """
+    Test that both backends check bulk updates in the same order.
+    """
+    cases = [
+        [(1, "Buy milk", None), (3, None, "Today")],
+        [(99, "Missing", None), (1, "", None)],
+        [(1, "", None), (99, "Missing", None)],
+        [(1, "Buy milk", None), (2, None, "x" * 1001)],
+        [(1, "First", None), (1, "Second", None)],
+        [],
+    ]
+    for updates in cases:
+        expected = run_bulk_update(TodoManager(), updates)
+        actual = run_bulk_update(SQLiteTodoManager(), updates)
+        assert actual == expected, (updates, actual, expected)
+    assert run_bulk_update(SQLiteTodoManager(), cases[1])[0] is False
+    assert run_bulk_update(SQLiteTodoManager(), cases[2])[0] == "ValueError"
+    print("   + PASSED: Bulk updates fail the same way on both backends")
+
+
+if __name__ == "__main__":
+    test_sqlite_matches_memory()
+    test_sqlite_errors_and_bulk()
+    test_sqlite_views_and_search()
+    test_sqlite_listeners_undo_and_stats()
+    test_bulk_update_conformance()
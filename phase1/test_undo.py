@@ -0,0 +1,152 @@
+# [Task]: Undo/Redo History
+# [From]: plan.md §TodoManager Class, specify.md §F4: Delete Task
+
+"""
+Test script to verify undo and redo in the Todo Console App.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from history import UndoHistory
+from journal import JournalStorage
+from todo_manager import TodoManager
+
+
+def snapshot(manager):
+    """Return the manager's tasks as plain dictionaries, in the manager's order."""
+    return [task.to_dict() for task in manager.iter_tasks()]
+
+
+def test_undo_redo():
+    """
+    Test undoing and redoing single and bulk operations.
+    """
+    print("Testing Undo/Redo for Todo Console App...")
+    print("="*50)
+
+    manager = TodoManager(history=UndoHistory())
+    assert manager.undo() is False and manager.redo() is False
+
+    # Test 1: Every single operation can be undone and redone
+    states = [snapshot(manager)]
+    manager.add_task("Buy groceries", "Milk")
+    states.append(snapshot(manager))
+    manager.update_task(1, "Buy food")
+    states.append(snapshot(manager))
+    manager.toggle_complete(1)
+    states.append(snapshot(manager))
+    manager.delete_task(1)
+    states.append(snapshot(manager))
+
+    for state in reversed(states[:-1]):
+        assert manager.undo()
+        assert snapshot(manager) == state
+    assert manager.can_undo() is False
+    for state in states[1:]:
+        assert manager.redo()
+        assert snapshot(manager) == state
+    assert manager.can_redo() is False
+    print("   + PASSED: Single operations undo and redo")
+
+    # Test 2: A bulk operation is one step, and its delta stays small
+    manager = TodoManager(history=UndoHistory())
+    manager.add_tasks((f"Task {i}", "") for i in range(10_000))
+    assert manager._history.size < 1000
+    manager.toggle_many([1, 2, 2, 3])
+    manager.update_tasks([(4, "First", None), (4, "Second", "Notes")])
+    before = snapshot(manager)
+    manager.delete_tasks(range(1, 101))
+    assert manager.task_count() == 9_900
+    assert manager.undo()
+    assert snapshot(manager) == before
+    assert manager.undo() and manager.get_task(4)['title'] == "Task 3"
+    assert manager.undo() and manager.count_by_status()['completed'] == 0
+    assert manager.undo() and manager.task_count() == 0
+    assert manager.redo() and manager.task_count() == 10_000
+    print("   + PASSED: Bulk operations undo in one step")
+
+    # Test 3: A new change discards the redo steps
+    manager.add_task("New branch")
+    assert manager.can_redo() is False
+    print("   + PASSED: New changes clear the redo stack")
+
+    # Test 4: Undone deletes put tasks back in ID order in every view
+    manager = TodoManager(history=UndoHistory())
+    manager.add_tasks((f"Task {i}", "") for i in range(1, 5))
+    manager.delete_task(2)
+    manager.delete_tasks([4, 1])
+    assert manager.undo() and manager.undo()
+    assert [task['id'] for task in manager.get_all_tasks()] == [1, 2, 3, 4]
+    assert [task['id'] for task in manager.get_task_page(0, 3)] == [1, 2, 3]
+    assert [task['id'] for task in manager.iter_tasks(completed=False)] == [1, 2, 3, 4]
+    print("   + PASSED: Restored tasks keep their place")
+
+
+def test_memory_cap():
+    """
+    Test that the history evicts its oldest steps to stay under budget.
+    """
+    history = UndoHistory(max_bytes=2_000)
+    manager = TodoManager(history=history)
+    for i in range(50):
+        manager.add_task(f"Task {i}")
+    assert history.size <= 2_000
+
+    # Only the newest steps survive
+    undone = 0
+    while manager.undo():
+        undone += 1
+    assert 0 < undone < 50
+    assert manager.task_count() == 50 - undone
+    assert [task['id'] for task in manager.iter_tasks()] == list(range(1, 51 - undone))
+
+    # A step too large for the budget is dropped along with older steps
+    manager.delete_tasks([task['id'] for task in manager.get_all_tasks()])
+    assert manager.can_undo() is False and history.size <= 2_000
+    print("   + PASSED: History stays under its memory cap")
+
+
+def test_undo_is_persisted():
+    """
+    Test that undone changes reach the journal and listeners.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TodoManager(JournalStorage(directory), UndoHistory())
+        manager.add_tasks([("A", ""), ("B", ""), ("C", "")])
+        manager.toggle_complete(2)
+        manager.delete_task(2)
+        events = []
+        manager.add_change_listener(events.extend)
+        assert manager.undo()
+        assert [(event.kind, event.task_id) for event in events] == [('added', 2)]
+        assert events[0].fields['completed'] is True
+        expected = snapshot(manager)
+        manager.close()
+
+        restored = TodoManager(JournalStorage(directory))
+        assert snapshot(restored) == expected
+        assert restored.count_by_status() == {'completed': 1, 'pending': 2}
+        restored.close()
+
+        # Undone deletes keep ID order in a snapshot-backed store and its compactions
+        manager = TodoManager(JournalStorage(directory, compact_every=1), UndoHistory())
+        manager.delete_task(1)
+        assert manager.undo()
+        assert [task['id'] for task in manager.get_all_tasks()] == [1, 2, 3]
+        manager.close()
+        restored = TodoManager(JournalStorage(directory))
+        assert [task['id'] for task in restored.get_all_tasks()] == [1, 2, 3]
+        assert restored.get_task(3)['title'] == "C"
+        restored.close()
+    print("   + PASSED: Undone changes are journaled and published")
+
+
+if __name__ == "__main__":
+    test_undo_redo()
+    test_memory_cap()
+    test_undo_is_persisted()
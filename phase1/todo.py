@@ -0,0 +1,41 @@
+# [Task]: Unified Launcher
+# [From]: plan.md §Main Application, specify.md §Menu System
+
+"""
+Single entry point for every mode of the Todo App.
+
+    python todo.py [--journal DIR]               interactive console menu
+    python todo.py gui [--journal DIR]           graphical window
+    python todo.py [--journal DIR] add "Milk"    one command (see src/cli.py)
+    python todo.py [--journal DIR] batch FILE    commands from a file or stdin
+
+Only the chosen mode's modules are imported: the console and batch
+modes never load tkinter, and one-off commands skip the menu's modules.
+"""
+
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Pick the mode from the first argument and run it.
+
+    Args:
+        argv (list[str] | None): Arguments without the program name;
+            defaults to sys.argv[1:]
+
+    Returns:
+        int: Exit status, 0 on success
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['gui']:
+        from gui_ui import main as gui_main
+        return gui_main(argv[1:])
+
+    from src.cli import main as cli_main
+    return cli_main(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())